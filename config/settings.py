@@ -12,13 +12,75 @@ load_dotenv()
 # Project root directory
 ROOT_DIR = Path(__file__).parent.parent.absolute()
 
+# ==================== ENVIRONMENT SNAPSHOT ====================
+_TRUTHY = {"true": True, "1": True, "yes": True}
+
+
+def _as_bool(value: str) -> bool:
+    """Cast an environment string to bool ("true", "1" or "yes")"""
+    return _TRUTHY.get(value.lower(), False)
+
+
+def _as_lower(value: str) -> str:
+    """Cast an environment string to lowercase"""
+    return value.lower()
+
+
+# (environment key, caster, default)
+_SCHEMA = [
+    ("BINANCE_API_KEY", str, ""),
+    ("BINANCE_API_SECRET", str, ""),
+    ("BINANCE_TLD", str, "com"),
+    ("BINANCE_TESTNET", _as_bool, "false"),
+    ("EXCHANGE_INFO_TTL", float, 3600),
+    ("DEFAULT_RSI_PERIOD", int, 14),
+    ("DEFAULT_RSI_OVERBOUGHT", int, 70),
+    ("DEFAULT_RSI_OVERSOLD", int, 30),
+    ("DEFAULT_TRADE_SYMBOL", str, "ETHUSDT"),
+    ("DEFAULT_TRADE_QUANTITY", float, 1000),
+    ("TRADING_MODE", _as_lower, "spot"),
+    ("DEFAULT_LEVERAGE", int, 5),
+    ("MARGIN_TYPE", _as_lower, "isolated"),
+    ("MAX_RISK_PER_TRADE_PCT", float, 2.0),
+    ("MAX_DRAWDOWN_PCT", float, 10.0),
+    ("DYNAMIC_POSITION_SIZING", _as_bool, "true"),
+    ("SIMULATION_MODE", _as_bool, "true"),
+    ("ENABLE_EMAIL_NOTIFICATIONS", _as_bool, "true"),
+    ("SMTP_HOST", str, "smtp.gmail.com"),
+    ("SMTP_PORT", int, 465),
+    ("SMTP_EMAIL", str, ""),
+    ("SMTP_PASSWORD", str, ""),
+    ("NOTIFICATION_EMAIL", str, ""),
+    ("LOG_LEVEL", str, "INFO"),
+    ("ENABLE_WEB_DASHBOARD", _as_bool, "true"),
+    ("DASHBOARD_HOST", str, "0.0.0.0"),
+    ("DASHBOARD_PORT", int, 5000),
+    ("FRONTEND_PORT", int, 3000),
+    ("DATABASE_URL", str, f"sqlite:///{ROOT_DIR / 'data'}/trades.db"),
+    ("DEBUG", _as_bool, "false"),
+]
+
+
+def _load_env() -> dict:
+    """Snapshot the environment once and cast every value up front"""
+    env = dict(os.environ)
+    return {key: cast(env.get(key, str(default))) for key, cast, default in _SCHEMA}
+
+
+_CFG = _load_env()
+
+# Allowed values for validated settings
+_VALID_MODES = frozenset(("spot", "futures"))
+_VALID_MARGIN = frozenset(("isolated", "cross"))
+
 # ==================== BINANCE API CONFIGURATION ====================
 class BinanceConfig:
     """Binance API configuration"""
-    API_KEY: str = os.getenv("BINANCE_API_KEY", "")
-    API_SECRET: str = os.getenv("BINANCE_API_SECRET", "")
-    TLD: str = os.getenv("BINANCE_TLD", "com")
-    TESTNET: bool = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
+    API_KEY: str = _CFG["BINANCE_API_KEY"]
+    API_SECRET: str = _CFG["BINANCE_API_SECRET"]
+    TLD: str = _CFG["BINANCE_TLD"]
+    TESTNET: bool = _CFG["BINANCE_TESTNET"]
+    EXCHANGE_INFO_TTL: float = _CFG["EXCHANGE_INFO_TTL"]  # seconds
     
     @classmethod
     def validate(cls) -> bool:
@@ -32,20 +94,20 @@ class BinanceConfig:
 class TradingConfig:
     """Trading strategy configuration"""
     # RSI Settings
-    RSI_PERIOD: int = int(os.getenv("DEFAULT_RSI_PERIOD", "14"))
-    RSI_OVERBOUGHT: int = int(os.getenv("DEFAULT_RSI_OVERBOUGHT", "70"))
-    RSI_OVERSOLD: int = int(os.getenv("DEFAULT_RSI_OVERSOLD", "30"))
+    RSI_PERIOD: int = _CFG["DEFAULT_RSI_PERIOD"]
+    RSI_OVERBOUGHT: int = _CFG["DEFAULT_RSI_OVERBOUGHT"]
+    RSI_OVERSOLD: int = _CFG["DEFAULT_RSI_OVERSOLD"]
     
     # Trading pair
-    TRADE_SYMBOL: str = os.getenv("DEFAULT_TRADE_SYMBOL", "ETHUSDT")
-    TRADE_QUANTITY: float = float(os.getenv("DEFAULT_TRADE_QUANTITY", "1000"))
+    TRADE_SYMBOL: str = _CFG["DEFAULT_TRADE_SYMBOL"]
+    TRADE_QUANTITY: float = _CFG["DEFAULT_TRADE_QUANTITY"]
     
     # Trading mode: "spot" or "futures"
-    TRADING_MODE: str = os.getenv("TRADING_MODE", "spot").lower()
+    TRADING_MODE: str = _CFG["TRADING_MODE"]
     
     # Futures Configuration
-    DEFAULT_LEVERAGE: int = int(os.getenv("DEFAULT_LEVERAGE", "5"))
-    MARGIN_TYPE: str = os.getenv("MARGIN_TYPE", "isolated").lower()  # "isolated" or "cross"
+    DEFAULT_LEVERAGE: int = _CFG["DEFAULT_LEVERAGE"]
+    MARGIN_TYPE: str = _CFG["MARGIN_TYPE"]  # "isolated" or "cross"
     
     # Risk management
     MAX_LOSS_PERCENTAGE: float = 2.0  # Maximum loss per trade
@@ -53,9 +115,9 @@ class TradingConfig:
     BIG_PROFIT_PERCENTAGE: float = 3.0  # Big profit target without RSI
     
     # Advanced Risk Management
-    MAX_RISK_PER_TRADE_PCT: float = float(os.getenv("MAX_RISK_PER_TRADE_PCT", "2.0"))
-    MAX_DRAWDOWN_PCT: float = float(os.getenv("MAX_DRAWDOWN_PCT", "10.0"))
-    DYNAMIC_POSITION_SIZING: bool = os.getenv("DYNAMIC_POSITION_SIZING", "true").lower() == "true"
+    MAX_RISK_PER_TRADE_PCT: float = _CFG["MAX_RISK_PER_TRADE_PCT"]
+    MAX_DRAWDOWN_PCT: float = _CFG["MAX_DRAWDOWN_PCT"]
+    DYNAMIC_POSITION_SIZING: bool = _CFG["DYNAMIC_POSITION_SIZING"]
     
     # Time-based sell conditions (more adaptive)
     SELL_AT_LOSS_0_5_HOURS: float = 0.5  # Sell at -0.5% after 30 min (was 1h)
@@ -69,12 +131,12 @@ class TradingConfig:
     MIN_TIME_AFTER_SELL: int = 5  # Minutes to wait after sell before buying
     
     # Simulation mode
-    SIMULATION_MODE: bool = os.getenv("SIMULATION_MODE", "true").lower() == "true"
+    SIMULATION_MODE: bool = _CFG["SIMULATION_MODE"]
     
     @classmethod
     def validate_trading_mode(cls) -> tuple[bool, str]:
         """Validate trading mode configuration"""
-        if cls.TRADING_MODE not in ["spot", "futures"]:
+        if cls.TRADING_MODE not in _VALID_MODES:
             return False, f"Invalid TRADING_MODE: {cls.TRADING_MODE}. Must be 'spot' or 'futures'"
         return True, ""
     
@@ -84,7 +146,7 @@ class TradingConfig:
         if cls.TRADING_MODE == "futures":
             if not (1 <= cls.DEFAULT_LEVERAGE <= 125):
                 return False, f"Invalid leverage: {cls.DEFAULT_LEVERAGE}. Must be between 1 and 125"
-            if cls.MARGIN_TYPE not in ["isolated", "cross"]:
+            if cls.MARGIN_TYPE not in _VALID_MARGIN:
                 return False, f"Invalid margin type: {cls.MARGIN_TYPE}. Must be 'isolated' or 'cross'"
         return True, ""
     
@@ -96,18 +158,40 @@ class TradingConfig:
         if not (1.0 <= cls.MAX_DRAWDOWN_PCT <= 50.0):
             return False, f"MAX_DRAWDOWN_PCT must be between 1.0 and 50.0, got {cls.MAX_DRAWDOWN_PCT}"
         return True, ""
+    
+    @classmethod
+    def validate_rsi_params(cls) -> tuple[bool, str]:
+        """Validate RSI period and thresholds"""
+        if cls.RSI_PERIOD < 1:
+            return False, f"RSI_PERIOD must be at least 1, got {cls.RSI_PERIOD}"
+        if not (0 < cls.RSI_OVERSOLD < cls.RSI_OVERBOUGHT < 100):
+            return False, (f"RSI thresholds must satisfy 0 < OVERSOLD < OVERBOUGHT < 100, "
+                           f"got {cls.RSI_OVERSOLD}/{cls.RSI_OVERBOUGHT}")
+        return True, ""
+    
+    @classmethod
+    def validate_all(cls) -> tuple[bool, str]:
+        """
+        Validate trading mode, leverage and risk parameters
+        Returns: (is_valid, first_error_message)
+        """
+        for validate in (cls.validate_trading_mode, cls.validate_leverage, cls.validate_risk_params):
+            is_valid, error = validate()
+            if not is_valid:
+                return False, error
+        return True, ""
 
 
 # ==================== NOTIFICATION CONFIGURATION ====================
 class NotificationConfig:
     """Email and notification settings"""
-    ENABLE_EMAIL: bool = os.getenv("ENABLE_EMAIL_NOTIFICATIONS", "true").lower() == "true"
+    ENABLE_EMAIL: bool = _CFG["ENABLE_EMAIL_NOTIFICATIONS"]
     
-    SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
-    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "465"))
-    SMTP_EMAIL: str = os.getenv("SMTP_EMAIL", "")
-    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
-    NOTIFICATION_EMAIL: str = os.getenv("NOTIFICATION_EMAIL", "")
+    SMTP_HOST: str = _CFG["SMTP_HOST"]
+    SMTP_PORT: int = _CFG["SMTP_PORT"]
+    SMTP_EMAIL: str = _CFG["SMTP_EMAIL"]
+    SMTP_PASSWORD: str = _CFG["SMTP_PASSWORD"]
+    NOTIFICATION_EMAIL: str = _CFG["NOTIFICATION_EMAIL"]
     
     @classmethod
     def validate(cls) -> bool:
@@ -120,7 +204,7 @@ class NotificationConfig:
 # ==================== LOGGING CONFIGURATION ====================
 class LoggingConfig:
     """Logging configuration"""
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _CFG["LOG_LEVEL"]
     LOG_DIR: Path = ROOT_DIR / "logs"
     LOG_FILE: str = "trading_bot.log"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -131,10 +215,10 @@ class LoggingConfig:
 # ==================== DASHBOARD CONFIGURATION ====================
 class DashboardConfig:
     """Web dashboard configuration"""
-    ENABLE_DASHBOARD: bool = os.getenv("ENABLE_WEB_DASHBOARD", "true").lower() == "true"
-    BACKEND_HOST: str = os.getenv("DASHBOARD_HOST", "0.0.0.0")
-    BACKEND_PORT: int = int(os.getenv("DASHBOARD_PORT", "5000"))
-    FRONTEND_PORT: int = int(os.getenv("FRONTEND_PORT", "3000"))
+    ENABLE_DASHBOARD: bool = _CFG["ENABLE_WEB_DASHBOARD"]
+    BACKEND_HOST: str = _CFG["DASHBOARD_HOST"]
+    BACKEND_PORT: int = _CFG["DASHBOARD_PORT"]
+    FRONTEND_PORT: int = _CFG["FRONTEND_PORT"]
     
     # WebSocket for real-time updates
     WEBSOCKET_ENABLED: bool = True
@@ -146,7 +230,7 @@ class DataConfig:
     """Data storage configuration"""
     DATA_DIR: Path = ROOT_DIR / "data"
     REPORTS_DIR: Path = DATA_DIR / "reports"
-    DATABASE_URL: str = os.getenv("DATABASE_URL", f"sqlite:///{DATA_DIR}/trades.db")
+    DATABASE_URL: str = _CFG["DATABASE_URL"]
     
     # Ensure directories exist
     @classmethod
@@ -161,7 +245,7 @@ class AppConfig:
     """Main application configuration"""
     APP_NAME: str = "RSI Trading Bot"
     VERSION: str = "2.0.0"
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    DEBUG: bool = _CFG["DEBUG"]
     
     # Configuration classes
     binance = BinanceConfig
@@ -202,6 +286,31 @@ class AppConfig:
         
         return len(errors) == 0, errors
     
+    @classmethod
+    def reload(cls) -> tuple[bool, str]:
+        """
+        Re-read the .env file and refresh the RSI thresholds in place.
+        Previous values are restored if the new trading settings are invalid.
+        Returns: (is_valid, error_message)
+        """
+        load_dotenv(override=True)
+        try:
+            cfg = _load_env()
+        except ValueError as e:
+            return False, f"Invalid value in environment: {e}"
+        
+        previous = (cls.trading.RSI_PERIOD, cls.trading.RSI_OVERBOUGHT, cls.trading.RSI_OVERSOLD)
+        cls.trading.RSI_PERIOD = cfg["DEFAULT_RSI_PERIOD"]
+        cls.trading.RSI_OVERBOUGHT = cfg["DEFAULT_RSI_OVERBOUGHT"]
+        cls.trading.RSI_OVERSOLD = cfg["DEFAULT_RSI_OVERSOLD"]
+        
+        is_valid, error = cls.trading.validate_rsi_params()
+        if is_valid:
+            is_valid, error = cls.trading.validate_all()
+        if not is_valid:
+            cls.trading.RSI_PERIOD, cls.trading.RSI_OVERBOUGHT, cls.trading.RSI_OVERSOLD = previous
+        return is_valid, error
+    
     @classmethod
     def initialize(cls):
         """Initialize application configuration"""
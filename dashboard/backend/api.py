@@ -2,12 +2,13 @@
 Dashboard API Backend
 Flask API for real-time bot monitoring
 """
-from flask import Flask, jsonify, request, send_from_directory
-from flask_cors import CORS
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_socketio import SocketIO, emit
+import hashlib
 import logging
+import mimetypes
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 from config.settings import AppConfig
@@ -16,18 +17,43 @@ from src.core.trading_bot import TradingBot
 
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
 # Get paths
 DASHBOARD_DIR = Path(__file__).parent.parent
 FRONTEND_DIR = DASHBOARD_DIR / "frontend"
 
+# In-memory copy of the frontend: path -> (content, mimetype, etag)
+_STATIC: Dict[str, Tuple[bytes, str, str]] = {}
+_STATIC_MAX_BYTES = 32 * 1024 * 1024
+
 # Global bot instance (will be set by main)
 bot_instance: Optional[TradingBot] = None
 
 logger = logging.getLogger(__name__)
 
+# The dashboard is served locally, so CORS headers are static
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+_PREFLIGHT_RESPONSE = Response(status=204, headers=_CORS_HEADERS)
+
+
+@app.before_request
+def handle_preflight():
+    """Answer CORS preflight requests without routing"""
+    if request.method == 'OPTIONS':
+        return _PREFLIGHT_RESPONSE
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attach static CORS headers to every response"""
+    response.headers.update(_CORS_HEADERS)
+    return response
+
 
 def set_bot_instance(bot: TradingBot):
     """Set the bot instance for the API"""
@@ -35,16 +61,51 @@ def set_bot_instance(bot: TradingBot):
     bot_instance = bot
 
 
+def load_static_files() -> int:
+    """
+    Load the frontend files into memory (files do not change at runtime)
+    
+    Returns:
+        Number of cached files (0 if the frontend is too large to cache)
+    """
+    files = [f for f in FRONTEND_DIR.rglob('*') if f.is_file()]
+    if sum(f.stat().st_size for f in files) > _STATIC_MAX_BYTES:
+        logger.warning("Frontend too large to cache in memory, serving from disk")
+        return 0
+    
+    _STATIC.clear()
+    for file in files:
+        content = file.read_bytes()
+        mimetype = mimetypes.guess_type(file.name)[0] or 'application/octet-stream'
+        etag = hashlib.sha1(content).hexdigest()
+        _STATIC[file.relative_to(FRONTEND_DIR).as_posix()] = (content, mimetype, etag)
+    
+    return len(_STATIC)
+
+
+def _send_static(path: str):
+    """Serve a frontend file from memory, falling back to disk"""
+    cached = _STATIC.get(path)
+    if cached is None:
+        return send_from_directory(FRONTEND_DIR, path)
+    
+    content, mimetype, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers=headers)
+    return Response(content, mimetype=mimetype, headers=headers)
+
+
 @app.route('/')
 def index():
     """Serve the main dashboard page"""
-    return send_from_directory(FRONTEND_DIR, 'index.html')
+    return _send_static('index.html')
 
 
 @app.route('/<path:path>')
 def serve_static(path):
     """Serve static files from frontend directory"""
-    return send_from_directory(FRONTEND_DIR, path)
+    return _send_static(path)
 
 
 @app.route('/api/status', methods=['GET'])
@@ -153,6 +214,7 @@ def run_dashboard(config: AppConfig, bot: TradingBot):
         bot: Trading bot instance
     """
     set_bot_instance(bot)
+    load_static_files()
     
     host = config.dashboard.BACKEND_HOST
     port = config.dashboard.BACKEND_PORT
@@ -9,10 +9,13 @@ Usage:
     python main.py --interactive
 """
 import sys
-import argparse
+import select
 import signal
+import socket
 import logging
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -23,13 +26,37 @@ from src.utils.helpers import setup_logger
 from dashboard.backend.api import run_dashboard
 import threading
 
+# Sending end of the signal wakeup socket (kept alive for the process lifetime)
+_wakeup_send: Optional[socket.socket] = None
+
+
+_HELP = """usage: main.py [-h] [--symbol SYMBOL] [--balance BALANCE] [--rsi-period RSI_PERIOD]
+               [--rsi-overbought RSI_OVERBOUGHT] [--rsi-oversold RSI_OVERSOLD]
+               [--simulate] [--live] [--interactive]
+               [--log-level {DEBUG,INFO,WARNING,ERROR}] [--no-email] [--dashboard]
+
+RSI Trading Bot for Binance
+
+options:
+  -h, --help            show this help message and exit
+  --symbol SYMBOL, -s SYMBOL
+                        Trading pair symbol (e.g., ETHUSDT, BTCUSDT)
+  --balance BALANCE, -b BALANCE
+                        Initial trading balance in quote currency
+  --rsi-period RSI_PERIOD
+                        RSI period (default: 14)
+  --rsi-overbought RSI_OVERBOUGHT
+                        RSI overbought level (default: 70)
+  --rsi-oversold RSI_OVERSOLD
+                        RSI oversold level (default: 30)
+  --simulate            Run in simulation mode (no real trades)
+  --live                Run in LIVE mode (real trades)
+  --interactive, -i     Interactive mode (prompt for parameters)
+  --log-level {DEBUG,INFO,WARNING,ERROR}
+                        Logging level
+  --no-email            Disable email notifications
+  --dashboard           Launch dashboard server with bot
 
-def parse_arguments():
-    """Parse command line arguments"""
-    parser = argparse.ArgumentParser(
-        description='RSI Trading Bot for Binance',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
   # Run with default settings (interactive mode)
   python main.py
@@ -42,81 +69,82 @@ Examples:
   
   # Custom RSI settings
   python main.py --symbol ETHUSDT --balance 1000 --rsi-period 14 --rsi-overbought 75 --rsi-oversold 25
-        """
-    )
-    
-    # Trading parameters
-    parser.add_argument(
-        '--symbol', '-s',
-        type=str,
-        help='Trading pair symbol (e.g., ETHUSDT, BTCUSDT)'
-    )
-    
-    parser.add_argument(
-        '--balance', '-b',
-        type=float,
-        help='Initial trading balance in quote currency'
-    )
-    
-    # RSI parameters
-    parser.add_argument(
-        '--rsi-period',
-        type=int,
-        help='RSI period (default: 14)'
-    )
-    
-    parser.add_argument(
-        '--rsi-overbought',
-        type=int,
-        help='RSI overbought level (default: 70)'
-    )
-    
-    parser.add_argument(
-        '--rsi-oversold',
-        type=int,
-        help='RSI oversold level (default: 30)'
-    )
-    
-    # Mode
-    parser.add_argument(
-        '--simulate',
-        action='store_true',
-        help='Run in simulation mode (no real trades)'
-    )
-    
-    parser.add_argument(
-        '--live',
-        action='store_true',
-        help='Run in LIVE mode (real trades)'
-    )
-    
-    # Other options
-    parser.add_argument(
-        '--interactive', '-i',
-        action='store_true',
-        help='Interactive mode (prompt for parameters)'
-    )
-    
-    parser.add_argument(
-        '--log-level',
-        type=str,
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-        help='Logging level'
-    )
-    
-    parser.add_argument(
-        '--no-email',
-        action='store_true',
-        help='Disable email notifications'
-    )
+"""
+
+# Option string -> (destination, type); a type of None marks a boolean flag
+_OPTIONS = {
+    '--symbol': ('symbol', str),
+    '-s': ('symbol', str),
+    '--balance': ('balance', float),
+    '-b': ('balance', float),
+    '--rsi-period': ('rsi_period', int),
+    '--rsi-overbought': ('rsi_overbought', int),
+    '--rsi-oversold': ('rsi_oversold', int),
+    '--simulate': ('simulate', None),
+    '--live': ('live', None),
+    '--interactive': ('interactive', None),
+    '-i': ('interactive', None),
+    '--log-level': ('log_level', str),
+    '--no-email': ('no_email', None),
+    '--dashboard': ('dashboard', None),
+}
+
+_CHOICES = {
+    'log_level': ('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+}
+
+
+def _argument_error(message: str):
+    """Print a usage error and exit like argparse does"""
+    usage = _HELP.split("\n\n", 1)[0]
+    print(f"{usage}\nmain.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """Parse command line arguments"""
+    argv = sys.argv[1:] if argv is None else argv
+    args = SimpleNamespace(**{
+        dest: (False if arg_type is None else None)
+        for dest, arg_type in _OPTIONS.values()
+    })
     
-    parser.add_argument(
-        '--dashboard',
-        action='store_true',
-        help='Launch dashboard server with bot'
-    )
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            print(_HELP)
+            sys.exit(0)
+        
+        name, has_value, value = arg.partition('=')
+        if name not in _OPTIONS:
+            _argument_error(f"unrecognized arguments: {arg}")
+        
+        dest, arg_type = _OPTIONS[name]
+        if arg_type is None:
+            if has_value:
+                _argument_error(f"argument {name}: ignored explicit argument '{value}'")
+            setattr(args, dest, True)
+        else:
+            if not has_value:
+                i += 1
+                if i >= len(argv):
+                    _argument_error(f"argument {name}: expected one argument")
+                value = argv[i]
+            try:
+                value = arg_type(value)
+            except ValueError:
+                _argument_error(f"argument {name}: invalid {arg_type.__name__} value: '{value}'")
+            choices = _CHOICES.get(dest)
+            if choices and value not in choices:
+                _argument_error(
+                    f"argument {name}: invalid choice: '{value}' "
+                    f"(choose from {', '.join(repr(c) for c in choices)})"
+                )
+            setattr(args, dest, value)
+        i += 1
     
-    return parser.parse_args()
+    return args
 
 
 def interactive_mode():
@@ -180,15 +208,38 @@ def interactive_mode():
     }
 
 
-def setup_signal_handlers(bot: TradingBot):
-    """Setup signal handlers for graceful shutdown"""
-    def signal_handler(sig, frame):
+def setup_signal_handlers() -> Tuple[socket.socket, threading.Event, threading.Event]:
+    """
+    Setup signal handlers for graceful shutdown and live config reload
+    
+    Signals are routed through a wakeup socket so the main loop reacts
+    immediately instead of on its next poll.
+    
+    Returns:
+        Tuple of (wakeup_socket, shutdown_event, reload_event)
+    """
+    global _wakeup_send
+    wakeup_recv, _wakeup_send = socket.socketpair()
+    wakeup_recv.setblocking(False)
+    _wakeup_send.setblocking(False)
+    signal.set_wakeup_fd(_wakeup_send.fileno())
+    
+    shutdown_event = threading.Event()
+    reload_event = threading.Event()
+    
+    def shutdown_handler(sig, frame):
         print("\n\n🛑 Shutdown signal received...")
-        bot.stop()
-        sys.exit(0)
+        shutdown_event.set()
+    
+    def reload_handler(sig, frame):
+        reload_event.set()
+    
+    signal.signal(signal.SIGINT, shutdown_handler)
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    if hasattr(signal, 'SIGHUP'):  # Not available on Windows
+        signal.signal(signal.SIGHUP, reload_handler)
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    return wakeup_recv, shutdown_event, reload_event
 
 
 def main():
@@ -253,8 +304,8 @@ def main():
             initial_balance=params['balance']
         )
         
-        # Setup signal handlers for graceful shutdown
-        setup_signal_handlers(bot)
+        # Setup signal handlers for graceful shutdown and config reload
+        wakeup_sock, shutdown_event, reload_event = setup_signal_handlers()
         
         # Start dashboard if requested
         dashboard_thread = None
@@ -276,12 +327,17 @@ def main():
         # Keep bot running
         logger.info("\n✓ Bot is running... Press Ctrl+C to stop\n")
         
-        while bot.is_running:
+        while bot.is_running and not shutdown_event.is_set():
+            select.select([wakeup_sock], [], [], 1.0)
             try:
-                import time
-                time.sleep(1)
-            except KeyboardInterrupt:
-                break
+                while wakeup_sock.recv(64):
+                    pass
+            except BlockingIOError:
+                pass
+            
+            if reload_event.is_set():
+                reload_event.clear()
+                bot.reload_config()
         
         bot.stop()
         
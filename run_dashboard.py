@@ -17,11 +17,12 @@ print("\n⚠️  Assurez-vous que le bot est déjà lancé dans un autre termina
 print("   → python main.py --interactive\n")
 
 try:
-    from dashboard.backend.api import app, socketio
+    from dashboard.backend.api import app, socketio, load_static_files
     from config.settings import AppConfig
     
     config = AppConfig()
     config.initialize()
+    load_static_files()
     
     port = config.dashboard.BACKEND_PORT
     host = config.dashboard.BACKEND_HOST
@@ -45,7 +46,7 @@ except KeyboardInterrupt:
 except ImportError as e:
     print(f"\n❌ Erreur d'import: {e}")
     print("\n💡 Installez les dépendances:")
-    print("   pip install flask flask-cors flask-socketio")
+    print("   pip install flask flask-socketio")
 except Exception as e:
     print(f"\n❌ Erreur: {e}")
     import traceback
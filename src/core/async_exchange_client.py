@@ -0,0 +1,310 @@
+"""
+Asynchronous Binance Exchange Client
+Concurrent REST access for market data and account queries (Spot and Futures)
+"""
+import asyncio
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+from binance.exceptions import BinanceAPIException
+
+from src.core.exchange_client import (
+    ORDER_RECV_WINDOW,
+    parse_futures_balance,
+    parse_klines,
+    parse_spot_balance,
+    parse_ticker
+)
+from src.models.trading_models import Balance, Candle, Ticker
+from src.utils.helpers import json_loads
+
+
+# Total seconds allowed per request, matching the sync client's timeout
+REQUEST_TIMEOUT = 10
+
+# Errors a request can fail with; methods log these and return a fallback
+_REQUEST_ERRORS = (BinanceAPIException, aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+# REST endpoints per trading mode
+_ENDPOINTS = {
+    "spot": {
+        "base": "https://api.binance.com",
+        "klines": "/api/v3/klines",
+        "ticker": "/api/v3/ticker/24hr",
+        "account": "/api/v3/account",
+        "order": "/api/v3/order",
+    },
+    "futures": {
+        "base": "https://fapi.binance.com",
+        "klines": "/fapi/v1/klines",
+        "ticker": "/fapi/v1/ticker/24hr",
+        "account": "/fapi/v2/account",
+        "order": "/fapi/v1/order",
+    },
+}
+
+
+class AsyncBinanceClient:
+    """
+    aiohttp-based Binance client that shares one keep-alive session for the
+    process lifetime. Requests run on a private event loop thread so that
+    synchronous callers can batch several calls into a single round-trip
+    of wall-clock time with run_many().
+    """
+    
+    def __init__(self, api_key: str, api_secret: str, trading_mode: str = "spot"):
+        """
+        Initialize async Binance client
+        
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret
+            trading_mode: "spot" or "futures"
+        """
+        self.logger = logging.getLogger(__name__)
+        self.api_key = api_key
+        self.api_secret = api_secret.encode()
+        # Keyed signer; copied per request so the key schedule is computed once
+        self._hmac_proto = hmac.new(self.api_secret, digestmod=hashlib.sha256)
+        self.trading_mode = trading_mode.lower()
+        
+        if self.trading_mode not in _ENDPOINTS:
+            raise ValueError(f"Invalid trading_mode: {self.trading_mode}. Must be 'spot' or 'futures'")
+        
+        self._endpoints = _ENDPOINTS[self.trading_mode]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
+        # Request weight used in the current minute, as reported by Binance
+        self.used_weight = 0
+    
+    # ==================== EVENT LOOP / SESSION ====================
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the private event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="binance-async",
+                    daemon=True
+                )
+                self._loop_thread.start()
+        return self._loop
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session (created lazily on the client loop)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                headers={'X-MBX-APIKEY': self.api_key}
+            )
+        return self._session
+    
+    def run(self, coro: Awaitable) -> Any:
+        """
+        Run a coroutine on the client loop and wait for its result
+        
+        Args:
+            coro: Coroutine created from one of the a* methods
+        
+        Returns:
+            Coroutine result
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    def run_many(self, coros: Iterable[Awaitable]) -> List[Any]:
+        """
+        Run several coroutines concurrently and wait for all results
+        
+        Args:
+            coros: Coroutines created from the a* methods
+        
+        Returns:
+            List of results in the same order
+        """
+        async def _gather():
+            return await asyncio.gather(*coros)
+        
+        return self.run(_gather())
+    
+    def close(self):
+        """Close the HTTP session and stop the client loop"""
+        if self._loop is None:
+            return
+        
+        if self._session is not None:
+            self.run(self._session.close())
+            self._session = None
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop_thread:
+            self._loop_thread.join(timeout=5)
+        self._loop = None
+        self._loop_thread = None
+    
+    # ==================== REQUESTS ====================
+    
+    def _sign(self, params: Dict) -> str:
+        """Build a signed query string for a private endpoint"""
+        params['timestamp'] = int(time.time() * 1000)
+        query = urlencode(params)
+        signer = self._hmac_proto.copy()
+        signer.update(query.encode())
+        signature = signer.hexdigest()
+        return f"{query}&signature={signature}"
+    
+    async def _request(self, method: str, path: str, params: Optional[Dict] = None, signed: bool = False):
+        """
+        Send a request and decode the JSON response
+        
+        Raises:
+            BinanceAPIException: On non-2xx responses
+        """
+        session = await self._get_session()
+        url = self._endpoints['base'] + path
+        params = dict(params or {})
+        
+        if signed:
+            url = f"{url}?{self._sign(params)}"
+            params = None
+        
+        async with session.request(method, url, params=params) as response:
+            text = await response.text()
+            used = response.headers.get('X-MBX-USED-WEIGHT-1M')
+            if used is not None:
+                self.used_weight = int(used)
+            if not (200 <= response.status < 300):
+                raise BinanceAPIException(response, response.status, text)
+            return json_loads(text)
+    
+    # ==================== API METHODS ====================
+    
+    async def aget_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Candle]:
+        """
+        Get candlestick/kline data
+        
+        Args:
+            symbol: Trading pair
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            limit: Number of klines to retrieve (max 1000)
+        
+        Returns:
+            List of kline data
+        """
+        try:
+            klines = await self._request(
+                'GET',
+                self._endpoints['klines'],
+                {'symbol': symbol, 'interval': interval, 'limit': limit}
+            )
+            return parse_klines(klines)
+        except _REQUEST_ERRORS as e:
+            self.logger.error("✗ Failed to get klines for %s: %s", symbol, e)
+            return []
+    
+    async def aget_ticker(self, symbol: str) -> Optional[Ticker]:
+        """
+        Get 24hr ticker price change statistics
+        
+        Args:
+            symbol: Trading pair
+        
+        Returns:
+            Ticker information
+        """
+        try:
+            ticker = await self._request('GET', self._endpoints['ticker'], {'symbol': symbol})
+            return parse_ticker(ticker)
+        except _REQUEST_ERRORS as e:
+            self.logger.error("✗ Failed to get ticker for %s: %s", symbol, e)
+            return None
+    
+    async def aget_balance(self, asset: str) -> Balance:
+        """
+        Get account balance for a specific asset
+        
+        Args:
+            asset: Asset symbol (e.g., 'USDT')
+        
+        Returns:
+            Balance information
+        """
+        try:
+            account = await self._request('GET', self._endpoints['account'], signed=True)
+            if self.trading_mode == "futures":
+                return parse_futures_balance(account, asset)
+            
+            for balance in account.get('balances', []):
+                if balance['asset'] == asset:
+                    return parse_spot_balance(balance, asset)
+            return Balance(asset)
+        except _REQUEST_ERRORS as e:
+            self.logger.error("✗ Failed to get balance for %s: %s", asset, e)
+            return Balance(asset)
+    
+    async def acancel_order(self, symbol: str, order_id: int) -> bool:
+        """
+        Cancel an order
+        
+        Args:
+            symbol: Trading pair
+            order_id: Order ID
+        
+        Returns:
+            True if successful
+        """
+        try:
+            await self._request(
+                'DELETE',
+                self._endpoints['order'],
+                {'symbol': symbol, 'orderId': order_id, 'recvWindow': ORDER_RECV_WINDOW},
+                signed=True
+            )
+            return True
+        except _REQUEST_ERRORS as e:
+            self.logger.error("✗ Failed to cancel order %s: %s", order_id, e)
+            return False
+    
+    async def acancel_many(self, symbol: str, order_ids: Iterable[int]) -> List[bool]:
+        """
+        Cancel several orders concurrently over the shared session
+        
+        Args:
+            symbol: Trading pair
+            order_ids: Order IDs to cancel
+        
+        Returns:
+            Cancel result per order ID, in the same order
+        """
+        return await asyncio.gather(*(self.acancel_order(symbol, i) for i in order_ids))
+    
+    # ==================== SYNC FACADE ====================
+    
+    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Candle]:
+        """Blocking wrapper around aget_klines"""
+        return self.run(self.aget_klines(symbol, interval, limit))
+    
+    def get_symbol_ticker(self, symbol: str) -> Optional[Ticker]:
+        """Blocking wrapper around aget_ticker"""
+        return self.run(self.aget_ticker(symbol))
+    
+    def get_account_balance(self, asset: str) -> Balance:
+        """Blocking wrapper around aget_balance"""
+        return self.run(self.aget_balance(asset))
+    
+    def cancel_orders(self, symbol: str, order_ids: Iterable[int]) -> List[bool]:
+        """Blocking wrapper around acancel_many"""
+        return self.run(self.acancel_many(symbol, order_ids))
@@ -0,0 +1,542 @@
+"""
+Asynchronous Binance Futures Executor
+Concurrent leverage, position and order operations over one aiohttp session
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+from binance.exceptions import BinanceAPIException
+
+from config.settings import AppConfig
+from src.core.async_exchange_client import AsyncBinanceClient
+from src.core.exchange_client import WEIGHT_LIMIT_PER_MINUTE
+from src.core.futures_executor import (
+    build_order_formatters,
+    parse_futures_account,
+    parse_open_position,
+    parse_symbol_info
+)
+from src.models.trading_models import PositionSnap
+
+
+# Futures REST paths
+_PATHS = {
+    "leverage": "/fapi/v1/leverage",
+    "margin_type": "/fapi/v1/marginType",
+    "account": "/fapi/v2/account",
+    "position": "/fapi/v2/positionRisk",
+    "order": "/fapi/v1/order",
+    "all_open_orders": "/fapi/v1/allOpenOrders",
+    "exchange_info": "/fapi/v1/exchangeInfo",
+}
+
+_API_ERRORS = (BinanceAPIException, aiohttp.ClientError)
+
+# Signed request validity window (ms)
+RECV_WINDOW = 5000
+
+# Bulk configuration: concurrent requests and weight share before backing off
+BULK_CONCURRENCY = 10
+BULK_WEIGHT_THRESHOLD = 0.8
+
+
+def _flag(value: bool) -> str:
+    """Encode a boolean the way the Binance API expects it"""
+    return "true" if value else "false"
+
+
+class AsyncFuturesExecutor:
+    """
+    Asynchronous counterpart of FuturesExecutor. Every operation is a coroutine,
+    so several symbols can be configured, queried or traded concurrently
+    with asyncio.gather (see run_many) instead of one round-trip at a time.
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        config: AppConfig,
+        client: Optional[AsyncBinanceClient] = None
+    ):
+        """
+        Initialize async Futures executor
+        
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret
+            config: Application configuration
+            client: Optional shared async Futures client
+        """
+        self.logger = logging.getLogger(__name__)
+        self.client = client or AsyncBinanceClient(api_key, api_secret, trading_mode="futures")
+        self.config = config
+        
+        # Futures configuration
+        self.default_leverage = config.trading.DEFAULT_LEVERAGE
+        self.margin_type = config.trading.MARGIN_TYPE
+        
+        # Symbol-specific leverage cache
+        self.leverage_cache: Dict[str, int] = {}
+        
+        # Raw symbol entries from exchange info and per-symbol order formatters
+        self._symbol_index: Optional[Dict[str, Dict]] = None
+        self._order_formatters: Dict[str, Tuple[Callable, Callable]] = {}
+        self._exchange_info_lock = asyncio.Lock()
+    
+    # ==================== LOOP HELPERS ====================
+    
+    def run(self, coro: Awaitable) -> Any:
+        """Run one coroutine on the client loop and wait for its result"""
+        return self.client.run(coro)
+    
+    def run_many(self, coros: Iterable[Awaitable]) -> List[Any]:
+        """Run several coroutines concurrently and wait for all results"""
+        return self.client.run_many(coros)
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.client.close()
+    
+    async def _signed_request(self, method: str, path: str, params: Optional[Dict] = None):
+        """Send a signed Futures request"""
+        params = dict(params or {})
+        params.setdefault('recvWindow', RECV_WINDOW)
+        return await self.client._request(method, path, params, signed=True)
+    
+    async def _wait_for_weight(self):
+        """Sleep until the next minute window once most of the weight quota is used"""
+        if self.client.used_weight < WEIGHT_LIMIT_PER_MINUTE * BULK_WEIGHT_THRESHOLD:
+            return
+        
+        delay = 60 - time.time() % 60
+        self.logger.warning("⚠️ Request weight at %s/%s, pausing %.1fs",
+                            self.client.used_weight, WEIGHT_LIMIT_PER_MINUTE, delay)
+        await asyncio.sleep(delay)
+        self.client.used_weight = 0
+    
+    # ==================== ACCOUNT SETUP ====================
+    
+    async def set_leverage(self, symbol: str, leverage: Optional[int] = None) -> bool:
+        """
+        Set leverage for a symbol
+        
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT')
+            leverage: Leverage value (1-125), uses default if None
+        
+        Returns:
+            True if successful
+        """
+        leverage = leverage or self.default_leverage
+        
+        if self.leverage_cache.get(symbol) == leverage:
+            return True
+        
+        try:
+            await self._signed_request('POST', _PATHS['leverage'], {
+                'symbol': symbol,
+                'leverage': leverage
+            })
+            self.leverage_cache[symbol] = leverage
+            self.logger.info("✓ Leverage set for %s: %sx", symbol, leverage)
+            return True
+        except _API_ERRORS as e:
+            self.logger.error("✗ Failed to set leverage for %s: %s", symbol, e)
+            return False
+    
+    async def set_margin_type(self, symbol: str, margin_type: Optional[str] = None) -> bool:
+        """
+        Set margin type for a symbol
+        
+        Args:
+            symbol: Trading symbol
+            margin_type: 'ISOLATED' or 'CROSSED', uses config default if None
+        
+        Returns:
+            True if successful
+        """
+        margin_type = (margin_type or self.margin_type).upper()
+        
+        if margin_type not in ('ISOLATED', 'CROSSED'):
+            self.logger.error("Invalid margin type: %s", margin_type)
+            return False
+        
+        try:
+            await self._signed_request('POST', _PATHS['margin_type'], {
+                'symbol': symbol,
+                'marginType': margin_type
+            })
+            self.logger.info("✓ Margin type set for %s: %s", symbol, margin_type)
+            return True
+        except BinanceAPIException as e:
+            # Error code 4046 means margin type is already set
+            if e.code == -4046:
+                return True
+            self.logger.error("✗ Failed to set margin type for %s: %s", symbol, e)
+            return False
+        except aiohttp.ClientError as e:
+            self.logger.error("✗ Failed to set margin type for %s: %s", symbol, e)
+            return False
+    
+    # ==================== ACCOUNT DATA ====================
+    
+    async def get_futures_balance(self) -> Dict:
+        """
+        Get Futures account balance
+        
+        Returns:
+            Balance information
+        """
+        try:
+            account = await self._signed_request('GET', _PATHS['account'])
+            return parse_futures_account(account)
+        except _API_ERRORS as e:
+            self.logger.error("✗ Failed to get Futures balance: %s", e)
+            return {
+                'total_balance': 0.0,
+                'available_balance': 0.0,
+                'unrealized_pnl': 0.0,
+                'margin_balance': 0.0
+            }
+    
+    async def get_position(self, symbol: str) -> Optional[PositionSnap]:
+        """
+        Get current position for a symbol
+        
+        Args:
+            symbol: Trading symbol
+        
+        Returns:
+            Position information or None
+        """
+        try:
+            positions = await self._signed_request('GET', _PATHS['position'], {'symbol': symbol})
+            return parse_open_position(positions)
+        except _API_ERRORS as e:
+            self.logger.error("✗ Failed to get position for %s: %s", symbol, e)
+            return None
+    
+    # ==================== ORDERS ====================
+    
+    async def get_order_formatters(self, symbol: str) -> Tuple[Callable, Callable]:
+        """
+        Get price and quantity formatters matching the symbol's precision,
+        built with the same rules as FuturesExecutor.get_order_formatters
+        
+        Args:
+            symbol: Trading symbol
+        
+        Returns:
+            (format_price, format_qty) callables returning strings
+        """
+        formatters = self._order_formatters.get(symbol)
+        if formatters is not None:
+            return formatters
+        
+        async with self._exchange_info_lock:
+            if self._symbol_index is None:
+                try:
+                    exchange_info = await self.client._request('GET', _PATHS['exchange_info'])
+                    self._symbol_index = {s['symbol']: s for s in exchange_info['symbols']}
+                except _API_ERRORS as e:
+                    # Unknown precision: send the plain representation and retry next time
+                    self.logger.error("✗ Failed to get Futures exchange info: %s", e)
+                    return str, str
+        
+        s = self._symbol_index.get(symbol)
+        formatters = build_order_formatters(parse_symbol_info(s)) if s else (str, str)
+        self._order_formatters[symbol] = formatters
+        return formatters
+    
+    async def _create_order(self, params: Dict, description: str) -> Optional[Dict]:
+        """Place an order and log the outcome"""
+        try:
+            order = await self._signed_request('POST', _PATHS['order'], params)
+            self.logger.info("✓ %s created: %s %s %s", description, params['side'], params['quantity'], params['symbol'])
+            return order
+        except _API_ERRORS as e:
+            self.logger.error("✗ Failed to create %s: %s", description, e)
+            return None
+    
+    async def create_market_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        position_side: str = 'BOTH',
+        reduce_only: bool = False
+    ) -> Optional[Dict]:
+        """
+        Create a Futures market order
+        
+        Args:
+            symbol: Trading symbol
+            side: 'BUY' or 'SELL'
+            quantity: Order quantity (in base asset)
+            position_side: 'LONG', 'SHORT', or 'BOTH' (for hedge mode)
+            reduce_only: If True, order only reduces position
+        
+        Returns:
+            Order response or None
+        """
+        _, format_qty = await self.get_order_formatters(symbol)
+        return await self._create_order({
+            'symbol': symbol,
+            'side': side,
+            'type': 'MARKET',
+            'quantity': format_qty(quantity),
+            'positionSide': position_side,
+            'reduceOnly': _flag(reduce_only)
+        }, "Futures market order")
+    
+    async def create_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        position_side: str = 'BOTH',
+        reduce_only: bool = False,
+        time_in_force: str = 'GTC'
+    ) -> Optional[Dict]:
+        """
+        Create a Futures limit order
+        
+        Args:
+            symbol: Trading symbol
+            side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            price: Limit price
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+            reduce_only: If True, order only reduces position
+            time_in_force: Time in force ('GTC', 'IOC', 'FOK')
+        
+        Returns:
+            Order response or None
+        """
+        format_price, format_qty = await self.get_order_formatters(symbol)
+        return await self._create_order({
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'quantity': format_qty(quantity),
+            'price': format_price(price),
+            'timeInForce': time_in_force,
+            'positionSide': position_side,
+            'reduceOnly': _flag(reduce_only)
+        }, "Futures limit order")
+    
+    async def create_stop_loss(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+        position_side: str = 'BOTH'
+    ) -> Optional[Dict]:
+        """
+        Create a stop-loss order
+        
+        Args:
+            symbol: Trading symbol
+            side: 'BUY' or 'SELL' (opposite of position)
+            quantity: Order quantity
+            stop_price: Stop trigger price
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+        
+        Returns:
+            Order response or None
+        """
+        format_price, format_qty = await self.get_order_formatters(symbol)
+        return await self._create_order({
+            'symbol': symbol,
+            'side': side,
+            'type': 'STOP_MARKET',
+            'quantity': format_qty(quantity),
+            'stopPrice': format_price(stop_price),
+            'positionSide': position_side,
+            'reduceOnly': 'true'
+        }, "stop-loss order")
+    
+    async def create_take_profit(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        take_profit_price: float,
+        position_side: str = 'BOTH'
+    ) -> Optional[Dict]:
+        """
+        Create a take-profit order
+        
+        Args:
+            symbol: Trading symbol
+            side: 'BUY' or 'SELL' (opposite of position)
+            quantity: Order quantity
+            take_profit_price: Take profit trigger price
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+        
+        Returns:
+            Order response or None
+        """
+        format_price, format_qty = await self.get_order_formatters(symbol)
+        return await self._create_order({
+            'symbol': symbol,
+            'side': side,
+            'type': 'TAKE_PROFIT_MARKET',
+            'quantity': format_qty(quantity),
+            'stopPrice': format_price(take_profit_price),
+            'positionSide': position_side,
+            'reduceOnly': 'true'
+        }, "take-profit order")
+    
+    async def close_position(self, symbol: str, position_side: str = 'BOTH') -> Optional[Dict]:
+        """
+        Close an existing position
+        
+        Args:
+            symbol: Trading symbol
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+        
+        Returns:
+            Order response or None
+        """
+        position = await self.get_position(symbol)
+        return await self._close(symbol, position, position_side)
+    
+    async def _close(self, symbol: str, position: Optional[PositionSnap], position_side: str) -> Optional[Dict]:
+        """Send the reduce-only market order that flattens a known position"""
+        if not position:
+            self.logger.warning("No position to close for %s", symbol)
+            return None
+        
+        position_amt = position.position_amt
+        return await self.create_market_order(
+            symbol=symbol,
+            side='SELL' if position_amt > 0 else 'BUY',
+            quantity=abs(position_amt),
+            position_side=position_side,
+            reduce_only=True
+        )
+    
+    async def cancel_all_orders(self, symbol: str) -> bool:
+        """
+        Cancel all open orders for a symbol
+        
+        Args:
+            symbol: Trading symbol
+        
+        Returns:
+            True if successful
+        """
+        try:
+            await self._signed_request('DELETE', _PATHS['all_open_orders'], {'symbol': symbol})
+            self.logger.info("✓ All orders cancelled for %s", symbol)
+            return True
+        except _API_ERRORS as e:
+            self.logger.error("✗ Failed to cancel orders for %s: %s", symbol, e)
+            return False
+    
+    # ==================== BATCH HELPERS ====================
+    
+    async def set_leverage_many(self, symbols: Iterable[str], leverage: Optional[int] = None) -> List[bool]:
+        """
+        Set leverage for several symbols concurrently
+        
+        Args:
+            symbols: Trading symbols
+            leverage: Leverage value, uses default if None
+        
+        Returns:
+            Result per symbol, in the same order
+        """
+        return await asyncio.gather(*(self.set_leverage(s, leverage) for s in symbols))
+    
+    async def get_positions(self, symbols: Iterable[str]) -> List[Optional[PositionSnap]]:
+        """
+        Get current positions for several symbols concurrently
+        
+        Args:
+            symbols: Trading symbols
+        
+        Returns:
+            Position (or None) per symbol, in the same order
+        """
+        return await asyncio.gather(*(self.get_position(s) for s in symbols))
+    
+    async def bulk_configure(
+        self,
+        symbols: Iterable[str],
+        leverage: Optional[int] = None,
+        margin_type: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """
+        Set margin type and leverage for several symbols concurrently,
+        pausing when the per-minute request weight nears the limit
+        
+        Args:
+            symbols: Trading symbols
+            leverage: Leverage value, uses default if None
+            margin_type: 'ISOLATED' or 'CROSSED', uses config default if None
+        
+        Returns:
+            Success flag per symbol
+        """
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        
+        async def _configure(symbol: str) -> bool:
+            async with semaphore:
+                await self._wait_for_weight()
+                margin_ok = await self.set_margin_type(symbol, margin_type)
+                await self._wait_for_weight()
+                leverage_ok = await self.set_leverage(symbol, leverage)
+                return margin_ok and leverage_ok
+        
+        symbols = list(symbols)
+        results = await asyncio.gather(*(_configure(s) for s in symbols))
+        return dict(zip(symbols, results))
+    
+    async def close_positions(
+        self,
+        symbols: Iterable[str],
+        position_side: str = 'BOTH'
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Close positions for several symbols. All positions are fetched
+        concurrently, then all closing orders are sent concurrently.
+        
+        Args:
+            symbols: Trading symbols
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+        
+        Returns:
+            Closing order response (or None) per symbol
+        """
+        symbols = list(symbols)
+        positions = await self.get_positions(symbols)
+        orders = await asyncio.gather(*(
+            self._close(symbol, position, position_side)
+            for symbol, position in zip(symbols, positions)
+        ))
+        return dict(zip(symbols, orders))
+    
+    def close_positions_sync(
+        self,
+        symbols: Iterable[str],
+        position_side: str = 'BOTH'
+    ) -> Dict[str, Optional[Dict]]:
+        """Blocking wrapper around close_positions"""
+        return self.run(self.close_positions(symbols, position_side))
+    
+    def configure_all(
+        self,
+        symbols: Iterable[str],
+        leverage: Optional[int] = None,
+        margin_type: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """Blocking wrapper around bulk_configure"""
+        return self.run(self.bulk_configure(symbols, leverage, margin_type))
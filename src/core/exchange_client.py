@@ -2,14 +2,249 @@
 Binance Exchange Client Wrapper
 Supports both Spot and Futures trading
 """
+import hashlib
+import hmac
+import json
 import logging
-from typing import Dict, List, Optional
+import socket
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, Final, List, Optional
+from urllib.parse import urlencode
+import numpy as np
+import requests
+import urllib3
 from binance.client import Client
 from binance.enums import *
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config.settings import AppConfig
-from src.models.trading_models import Trade, TradeType, OrderStatus
+from src.core.websocket_handler import STREAM_KLINE_HISTORY, MarketDataStream
+from src.models.trading_models import Balance, Candle, Ticker
+from src.utils.helpers import json_loads
+from src.utils.rate_limiter import TokenBucket
+
+
+# Order endpoints per trading mode: (base URL, order path)
+ORDER_ENDPOINTS: Final = {
+    'spot': ('https://api.binance.com', '/api/v3/order'),
+    'futures': ('https://fapi.binance.com', '/fapi/v1/order')
+}
+
+# Cancel-all-open-orders path per trading mode
+OPEN_ORDERS_PATHS: Final = {
+    'spot': '/api/v3/openOrders',
+    'futures': '/fapi/v1/allOpenOrders'
+}
+
+# Ping path per trading mode (used to open a pooled order connection)
+PING_PATHS: Final = {
+    'spot': '/api/v3/ping',
+    'futures': '/fapi/v1/ping'
+}
+
+# Connections kept per host in the REST session pool
+SESSION_POOL_MAXSIZE: Final = 32
+
+# Order pool timeouts, matching python-binance's REST request timeout (s)
+ORDER_CONNECT_TIMEOUT: Final = Client.REQUEST_TIMEOUT
+ORDER_READ_TIMEOUT: Final = Client.REQUEST_TIMEOUT
+
+# recvWindow sent with orders (Binance maximum), in milliseconds
+ORDER_RECV_WINDOW: Final = 60000
+
+# Request weight per endpoint, as documented by Binance
+API_WEIGHTS: Final = {
+    'ping': 1,
+    'account': 20,
+    'exchange_info': 20,
+    'ticker': 2,
+    'tickers': 40,
+    'klines': 2,
+    'order': 1,
+    'order_status': 4,
+    'recent_trades': 25
+}
+
+# Client-side limits: request weight per minute, orders per second
+WEIGHT_LIMIT_PER_MINUTE: Final = 1200
+ORDER_LIMIT_PER_SECOND: Final = 10
+
+# Kline cache freshness per interval (seconds)
+KLINES_CACHE_TTL: Final = {
+    '1m': 5, '3m': 10, '5m': 20, '15m': 60, '30m': 120,
+    '1h': 300, '2h': 600, '4h': 1200, '6h': 1800, '8h': 2400, '12h': 3600,
+    '1d': 3600, '3d': 3600, '1w': 3600, '1M': 3600
+}
+
+# Candles requested when topping up a stale kline cache entry
+KLINES_REFRESH_LIMIT: Final = 5
+
+
+# Column layout of get_klines_np results
+KLINE_DTYPE: Final = np.dtype([
+    ('open_time', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+    ('close_time', np.int64)
+])
+
+
+def klines_to_array(klines: List[list]) -> np.ndarray:
+    """
+    Convert raw Binance kline rows into a structured array in bulk
+    
+    Args:
+        klines: Raw kline rows as returned by the API
+        
+    Returns:
+        Structured array with KLINE_DTYPE columns
+    """
+    result = np.empty(len(klines), dtype=KLINE_DTYPE)
+    if not klines:
+        return result
+    
+    # Transpose once, then parse every price/volume string in a single cast
+    columns = list(zip(*klines))
+    floats = np.array(columns[1:6], dtype=np.float64)
+    
+    result['open_time'] = columns[0]
+    result['close_time'] = columns[6]
+    for i, name in enumerate(('open', 'high', 'low', 'close', 'volume')):
+        result[name] = floats[i]
+    return result
+
+
+def parse_kline(kline: list) -> Candle:
+    """Convert a raw Binance kline row into a Candle"""
+    return Candle(
+        kline[0],
+        float(kline[1]),
+        float(kline[2]),
+        float(kline[3]),
+        float(kline[4]),
+        float(kline[5]),
+        kline[6]
+    )
+
+
+def parse_klines(klines: List[list]) -> List[Candle]:
+    """
+    Convert raw Binance kline rows into Candles in one pass.
+    Inlines parse_kline to skip a Python function call per candle.
+    """
+    return [
+        Candle(k[0], float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]), k[6])
+        for k in klines
+    ]
+
+
+def parse_ticker(ticker: Dict) -> Ticker:
+    """Convert a raw Binance 24hr ticker into a Ticker"""
+    return Ticker(
+        ticker['symbol'],
+        float(ticker['lastPrice']),
+        float(ticker['highPrice']),
+        float(ticker['lowPrice']),
+        float(ticker['volume']),
+        float(ticker['priceChange']),
+        float(ticker['priceChangePercent'])
+    )
+
+
+def parse_futures_balance(account: Dict, asset: str) -> Balance:
+    """Extract one asset balance from a raw Binance Futures account"""
+    for balance in account.get('assets', []):
+        if balance['asset'] == asset:
+            return Balance(
+                asset,
+                float(balance['availableBalance']),
+                float(balance['initialMargin']),
+                float(balance['walletBalance'])
+            )
+    
+    return Balance(asset)
+
+
+def parse_spot_balance(balance: Dict, asset: str) -> Balance:
+    """Convert a raw Binance Spot asset balance into a Balance"""
+    free = float(balance['free'])
+    locked = float(balance['locked'])
+    return Balance(asset, free, locked, free + locked)
+
+
+class FastJsonClient(Client):
+    """python-binance client that decodes responses with orjson when available"""
+    
+    @staticmethod
+    def _handle_response(response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        
+        if not response.content:
+            return {}
+        
+        try:
+            return json_loads(response.content)
+        except ValueError:
+            raise BinanceRequestException(f"Invalid Response: {response.text}")
+
+
+def configure_session(client: Client) -> None:
+    """
+    Install a pooled keep-alive HTTP adapter on a python-binance client session.
+    The same session serves both the Spot (api) and Futures (fapi) endpoints.
+    Calling it again on a configured session keeps the existing (warm) pool.
+    
+    Args:
+        client: python-binance client
+    """
+    if getattr(client.session.get_adapter('https://'), '_pool_maxsize', None) == SESSION_POOL_MAXSIZE:
+        return
+    
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=SESSION_POOL_MAXSIZE,
+        # Only idempotent methods are retried, so orders (POST) are never resent.
+        # The last response is returned as-is so BinanceAPIException is still raised.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    client.session.mount('https://', adapter)
+    client.session.headers.update({
+        'Connection': 'keep-alive',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+
+
+def create_order_pool() -> urllib3.PoolManager:
+    """
+    Create the connection pool used for order placement and cancellation.
+    Nagle is disabled and TCP keepalive enabled so warm connections stay
+    usable between orders.
+    """
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=8,
+        block=False,
+        timeout=urllib3.Timeout(connect=ORDER_CONNECT_TIMEOUT, read=ORDER_READ_TIMEOUT),
+        # Only failed connects are retried (the request was never sent); a read
+        # failure after an order went out is not, so a POST is never resent
+        retries=Retry(total=2, connect=2, read=0, status=0, redirect=0),
+        socket_options=[
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+    )
 
 
 class BinanceClient:
@@ -18,7 +253,15 @@ class BinanceClient:
     Automatically routes operations based on trading mode.
     """
     
-    def __init__(self, api_key: str, api_secret: str, trading_mode: str = "spot", testnet: bool = False):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        trading_mode: str = "spot",
+        testnet: bool = False,
+        exchange_info_ttl: float = 3600,
+        warmup: bool = False
+    ):
         """
         Initialize Binance client
         
@@ -27,27 +270,179 @@ class BinanceClient:
             api_secret: Binance API secret
             trading_mode: "spot" or "futures"
             testnet: Use testnet instead of production
+            exchange_info_ttl: Seconds to keep exchange info before refetching
+            warmup: Call warmup() from the constructor (does network I/O)
         """
         self.logger = logging.getLogger(__name__)
         self.api_key = api_key
         self.api_secret = api_secret
+        # Keyed signer; copied per request so the key schedule is computed once
+        self._hmac_proto = hmac.new(api_secret.encode(), digestmod=hashlib.sha256)
         self.trading_mode = trading_mode.lower()
         self.testnet = testnet
         
+        # Exchange info cache, indexed by symbol
+        self.exchange_info_ttl = exchange_info_ttl
+        self._exinfo_cache = {'ts': 0.0, 'by_symbol': {}}
+        self._exinfo_lock = threading.Lock()
+        
+        # Kline cache: (symbol, interval, limit) -> (fetched_at, klines)
+        self._klines_cache: Dict[tuple, tuple] = {}
+        self._klines_lock = threading.Lock()
+        
+        # Order parameter templates: (symbol, side, type, tif, position side) -> params
+        self._order_templates: Dict[tuple, Dict] = {}
+        
+        # Client-side rate limiting
+        self._weight_bucket = TokenBucket(WEIGHT_LIMIT_PER_MINUTE, WEIGHT_LIMIT_PER_MINUTE / 60)
+        self._order_bucket = TokenBucket(ORDER_LIMIT_PER_SECOND, ORDER_LIMIT_PER_SECOND)
+        
+        # Async client for concurrent bulk requests (created on first use)
+        self._async_client = None
+        
+        # Live market data stream (started on first subscription)
+        self.stream: Optional[MarketDataStream] = None
+        
         if self.trading_mode not in ["spot", "futures"]:
             raise ValueError(f"Invalid trading_mode: {self.trading_mode}. Must be 'spot' or 'futures'")
         
         try:
-            self.client = Client(
+            self.client = FastJsonClient(
                 api_key=api_key,
                 api_secret=api_secret,
                 tld='com'
             )
-            mode_str = "FUTURES" if self.trading_mode == "futures" else "SPOT"
-            self.logger.info(f"✓ Binance {mode_str} client initialized successfully")
+            configure_session(self.client)
+            self._order_pool = create_order_pool()
+            # urllib3 decodes gzip bodies itself but does not advertise it by default
+            self._order_headers = {
+                'X-MBX-APIKEY': api_key,
+                'Accept-Encoding': 'gzip, deflate'
+            }
+            self._bind_mode_methods()
+            self.logger.info("✓ Binance %s client initialized successfully", self._mode_label.upper())
         except Exception as e:
-            self.logger.error(f"✗ Failed to initialize Binance client: {e}")
+            self.logger.error("✗ Failed to initialize Binance client: %s", e)
             raise
+        
+        if warmup:
+            self.warmup()
+    
+    def _bind_mode_methods(self):
+        """Resolve the Spot or Futures API callables once for the trading mode"""
+        if self.is_futures():
+            self._mode_label = "Futures"
+            self._klines_fn = self.client.futures_klines
+            self._exinfo_fn = self.client.futures_exchange_info
+            self._balance_fn = self._get_futures_balance
+        else:
+            self._mode_label = "Spot"
+            self._klines_fn = self.client.get_klines
+            self._exinfo_fn = self.client.get_exchange_info
+            self._balance_fn = self._get_spot_balance
+        self._uses_position_side = self.is_futures()
+        
+        # Order requests only vary in method and query string
+        base, path = ORDER_ENDPOINTS[self.trading_mode]
+        self._order_url = base + path
+        self._open_orders_url = base + OPEN_ORDERS_PATHS[self.trading_mode]
+        self._send_order = partial(self._order_pool.request, headers=self._order_headers)
+    
+    def _call(self, endpoint: str, fn: Callable, *args, **kwargs):
+        """
+        Call a python-binance method within the request weight budget
+        
+        Args:
+            endpoint: Key into API_WEIGHTS
+            fn: Client method to call
+            
+        Returns:
+            The method's result
+        """
+        waited = self._weight_bucket.consume(API_WEIGHTS[endpoint])
+        if waited:
+            self.logger.debug("Rate limiter delayed %s by %.2fs", endpoint, waited)
+        
+        result = fn(*args, **kwargs)
+        response = getattr(self.client, 'response', None)
+        if response is not None:
+            self._sync_used_weight(response.headers)
+        return result
+    
+    def _sync_used_weight(self, headers):
+        """Correct the weight bucket from the X-MBX-USED-WEIGHT-1M header"""
+        used = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used is None:
+            return
+        try:
+            self._weight_bucket.sync_used(int(used))
+        except (TypeError, ValueError):
+            pass
+    
+    def _signed_request(self, method: str, url: str, params: Dict) -> Dict:
+        """
+        Send a signed request through the order connection pool
+        
+        Args:
+            method: HTTP method
+            url: Endpoint URL
+            params: Request parameters (timestamp is added)
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            BinanceAPIException: On non-2xx responses with a JSON error body
+            BinanceRequestException: On responses that are not JSON (e.g. proxy error pages)
+        """
+        self._order_bucket.consume()
+        self._weight_bucket.consume(API_WEIGHTS['order'])
+        
+        params['timestamp'] = int(time.time() * 1000)
+        query = urlencode(params)
+        signer = self._hmac_proto.copy()
+        signer.update(query.encode())
+        signature = signer.hexdigest()
+        
+        response = self._send_order(method, f"{url}?{query}&signature={signature}")
+        self._sync_used_weight(response.headers)
+        text = response.data.decode(errors='replace')
+        try:
+            data = json_loads(text)
+        except ValueError:
+            # BinanceAPIException would read response.text, which urllib3 lacks
+            raise BinanceRequestException(f"Invalid response ({response.status}): {text[:200]}")
+        if not (200 <= response.status < 300):
+            raise BinanceAPIException(response, response.status, text)
+        return data
+    
+    def warmup(self) -> bool:
+        """
+        Resolve the API host and open the pooled connections, and fill the
+        exchange info cache, so the first real request skips DNS, the TLS
+        handshake and the exchange info download.
+        
+        Returns:
+            True if the API connection test succeeded
+        """
+        base, _ = ORDER_ENDPOINTS[self.trading_mode]
+        host = base.split('://', 1)[1]
+        
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            # Opens a keep-alive connection in the order pool
+            self._order_pool.request('GET', base + PING_PATHS[self.trading_mode])
+        except (OSError, urllib3.exceptions.HTTPError) as e:
+            self.logger.warning("⚠️ Order connection warm-up failed: %s", e)
+        
+        if not self.test_connection():
+            return False
+        
+        try:
+            self._get_symbol_index()
+        except (BinanceAPIException, BinanceRequestException, requests.RequestException) as e:
+            self.logger.warning("⚠️ Exchange info warm-up failed: %s", e)
+        return True
     
     def is_futures(self) -> bool:
         """Check if trading mode is Futures"""
@@ -65,14 +460,14 @@ class BinanceClient:
             True if connection is successful
         """
         try:
-            self.client.ping()
+            self._call('ping', self.client.ping)
             self.logger.info("✓ Binance API connection test successful")
             return True
         except Exception as e:
-            self.logger.error(f"✗ Binance API connection test failed: {e}")
+            self.logger.error("✗ Binance API connection test failed: %s", e)
             return False
     
-    def get_account_balance(self, asset: str) -> Dict:
+    def get_account_balance(self, asset: str) -> Balance:
         """
         Get account balance for a specific asset (works for both Spot and Futures)
         
@@ -83,33 +478,18 @@ class BinanceClient:
             Balance information
         """
         try:
-            if self.is_futures():
-                # Get Futures account balance
-                account = self.client.futures_account()
-                
-                # Find specific asset balance
-                for balance in account.get('assets', []):
-                    if balance['asset'] == asset:
-                        return {
-                            'asset': asset,
-                            'free': float(balance['availableBalance']),
-                            'locked': float(balance['initialMargin']),
-                            'total': float(balance['walletBalance'])
-                        }
-                
-                return {'asset': asset, 'free': 0.0, 'locked': 0.0, 'total': 0.0}
-            else:
-                # Get Spot balance
-                balance = self.client.get_asset_balance(asset=asset)
-                return {
-                    'asset': asset,
-                    'free': float(balance['free']),
-                    'locked': float(balance['locked']),
-                    'total': float(balance['free']) + float(balance['locked'])
-                }
+            return self._balance_fn(asset)
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get balance for {asset}: {e}")
-            return {'asset': asset, 'free': 0.0, 'locked': 0.0, 'total': 0.0}
+            self.logger.error("✗ Failed to get balance for %s: %s", asset, e)
+            return Balance(asset)
+    
+    def _get_futures_balance(self, asset: str) -> Balance:
+        """Get Futures account balance"""
+        return parse_futures_balance(self._call('account', self.client.futures_account), asset)
+    
+    def _get_spot_balance(self, asset: str) -> Balance:
+        """Get Spot balance"""
+        return parse_spot_balance(self._call('account', self.client.get_asset_balance, asset=asset), asset)
     
     def get_symbol_info(self, symbol: str) -> Optional[Dict]:
         """
@@ -122,20 +502,34 @@ class BinanceClient:
             Symbol information or None if not found
         """
         try:
-            if self.is_futures():
-                exchange_info = self.client.futures_exchange_info()
-            else:
-                exchange_info = self.client.get_exchange_info()
-            
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    return s
-            return None
+            return self._get_symbol_index().get(symbol)
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get symbol info for {symbol}: {e}")
+            self.logger.error("✗ Failed to get symbol info for %s: %s", symbol, e)
             return None
     
-    def get_symbol_ticker(self, symbol: str) -> Optional[Dict]:
+    def _get_symbol_index(self) -> Dict[str, Dict]:
+        """
+        Return exchange info indexed by symbol, refetching once the TTL expires.
+        The lock ensures concurrent callers trigger a single download.
+        
+        Returns:
+            Mapping of symbol to symbol information
+        """
+        with self._exinfo_lock:
+            if time.time() - self._exinfo_cache['ts'] > self.exchange_info_ttl:
+                exchange_info = self._call('exchange_info', self._exinfo_fn)
+                self._exinfo_cache = {
+                    'ts': time.time(),
+                    'by_symbol': {s['symbol']: s for s in exchange_info['symbols']}
+                }
+            return self._exinfo_cache['by_symbol']
+    
+    def invalidate_exchange_info(self):
+        """Force the next symbol info lookup to refetch exchange info"""
+        with self._exinfo_lock:
+            self._exinfo_cache['ts'] = 0.0
+    
+    def get_symbol_ticker(self, symbol: str) -> Optional[Ticker]:
         """
         Get 24hr ticker price change statistics
         
@@ -145,60 +539,190 @@ class BinanceClient:
         Returns:
             Ticker information
         """
+        if self.stream:
+            cached = self.stream.get_ticker(symbol)
+            if cached:
+                return cached
+        
         try:
-            ticker = self.client.get_ticker(symbol=symbol)
-            return {
-                'symbol': ticker['symbol'],
-                'lastPrice': float(ticker['lastPrice']),
-                'highPrice': float(ticker['highPrice']),
-                'lowPrice': float(ticker['lowPrice']),
-                'volume': float(ticker['volume']),
-                'priceChange': float(ticker['priceChange']),
-                'priceChangePercent': float(ticker['priceChangePercent'])
-            }
+            ticker = self._call('ticker', self.client.get_ticker, symbol=symbol)
+            return parse_ticker(ticker)
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get ticker for {symbol}: {e}")
+            self.logger.error("✗ Failed to get ticker for %s: %s", symbol, e)
             return None
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Dict]:
+    def get_symbol_tickers(self, symbols: List[str]) -> List[Ticker]:
         """
-        Get candlestick/kline data (works for both Spot and Futures)
+        Get 24hr ticker statistics for several symbols in a single request
         
         Args:
-            symbol: Trading pair
-            interval: Kline interval (e.g., '1m', '5m', '1h')
-            limit: Number of klines to retrieve (max 1000)
+            symbols: Trading pairs (e.g., ['ETHUSDT', 'BTCUSDT'])
             
         Returns:
-            List of kline data
+            List of ticker information in the same order as symbols
+            (symbols missing from the response are skipped)
         """
         try:
             if self.is_futures():
-                klines = self.client.futures_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    limit=limit
-                )
+                # Futures has no symbols filter: fetch every ticker at once
+                tickers = self._call('tickers', self.client.futures_ticker)
             else:
-                klines = self.client.get_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    limit=limit
+                tickers = self._call(
+                    'tickers',
+                    self.client.get_ticker,
+                    symbols=json.dumps(symbols, separators=(',', ':'))
                 )
             
-            return [{
-                'open_time': kline[0],
-                'open': float(kline[1]),
-                'high': float(kline[2]),
-                'low': float(kline[3]),
-                'close': float(kline[4]),
-                'volume': float(kline[5]),
-                'close_time': kline[6]
-            } for kline in klines]
+            by_symbol = {t['symbol']: t for t in tickers}
+            return [parse_ticker(by_symbol[s]) for s in symbols if s in by_symbol]
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get klines for {symbol}: {e}")
+            self.logger.error("✗ Failed to get tickers for %s: %s", ', '.join(symbols), e)
             return []
     
+    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Candle]:
+        """
+        Get candlestick/kline data (works for both Spot and Futures).
+        Results are cached for a fraction of the interval; once stale, only
+        the newest candles are fetched and merged into the cached list.
+        
+        Args:
+            symbol: Trading pair
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            limit: Number of klines to retrieve (max 1000)
+            
+        Returns:
+            List of kline data
+        """
+        if self.stream:
+            cached = self.stream.get_klines(symbol, interval, limit)
+            if cached is not None:
+                return cached
+        
+        key = (symbol, interval, limit)
+        ttl = KLINES_CACHE_TTL.get(interval, 5)
+        
+        try:
+            with self._klines_lock:
+                entry = self._klines_cache.get(key)
+                now = time.time()
+                
+                if entry and now - entry[0] < ttl:
+                    return list(entry[1])
+                
+                klines = None
+                if entry and entry[1]:
+                    klines = self._refresh_klines(symbol, interval, limit, entry[1])
+                if klines is None:
+                    raw = self._fetch_klines(symbol, interval, limit)
+                    klines = parse_klines(raw)
+                
+                self._klines_cache[key] = (now, klines)
+                return list(klines)
+        except BinanceAPIException as e:
+            self.logger.error("✗ Failed to get klines for %s: %s", symbol, e)
+            return []
+    
+    def get_klines_np(self, symbol: str, interval: str, limit: int = 500) -> np.ndarray:
+        """
+        Get candlestick/kline data as a NumPy structured array
+        
+        Args:
+            symbol: Trading pair
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            limit: Number of klines to retrieve (max 1000)
+            
+        Returns:
+            Structured array with KLINE_DTYPE columns (e.g. result['close'])
+        """
+        try:
+            return klines_to_array(self._fetch_klines(symbol, interval, limit))
+        except BinanceAPIException as e:
+            self.logger.error("✗ Failed to get klines for %s: %s", symbol, e)
+            return np.empty(0, dtype=KLINE_DTYPE)
+    
+    def _refresh_klines(self, symbol: str, interval: str, limit: int, cached: List[Candle]) -> Optional[List[Candle]]:
+        """
+        Fetch candles from the last cached open time onward and merge them
+        
+        Returns:
+            Merged kline list, or None if too many candles are missing
+        """
+        raw = self._fetch_klines(
+            symbol, interval, KLINES_REFRESH_LIMIT,
+            start_time=cached[-1].open_time
+        )
+        if not raw or len(raw) >= KLINES_REFRESH_LIMIT:
+            # Gap larger than the top-up window (or empty answer): refetch all
+            return None
+        
+        # The last cached candle may still have been open: replace it
+        first_open = raw[0][0]
+        merged = [k for k in cached if k.open_time < first_open]
+        merged.extend(parse_klines(raw))
+        return merged[-limit:]
+    
+    def _fetch_klines(self, symbol: str, interval: str, limit: int, start_time: Optional[int] = None) -> List[list]:
+        """Request raw klines from the Spot or Futures endpoint"""
+        params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+        if start_time is not None:
+            params['startTime'] = start_time
+        
+        return self._call('klines', self._klines_fn, **params)
+    
+    # ==================== STREAMS ====================
+    
+    def _get_stream(self) -> MarketDataStream:
+        """Return the market data stream, creating it on first use"""
+        if self.stream is None:
+            self.stream = MarketDataStream(self.trading_mode, self._stream_history)
+        return self.stream
+    
+    def _stream_history(self, symbol: str, interval: str) -> List[Candle]:
+        """REST klines used to (re)seed a streamed kline cache"""
+        return parse_klines(self._fetch_klines(symbol, interval, STREAM_KLINE_HISTORY))
+    
+    def subscribe_kline(self, symbol: str, interval: str, callback: Optional[Callable] = None):
+        """
+        Stream klines for a symbol so get_klines is served from memory while
+        the stream is live. The cache is seeded with recent REST history and
+        reseeded after every reconnect.
+        
+        Args:
+            symbol: Trading pair
+            interval: Kline interval (e.g., '1m')
+            callback: Optional callback receiving each streamed kline
+        """
+        try:
+            history = self._stream_history(symbol, interval)
+        except BinanceAPIException as e:
+            self.logger.warning("⚠️ Could not seed kline stream for %s: %s", symbol, e)
+            history = []
+        
+        self._get_stream().subscribe_kline(symbol, interval, callback, history)
+    
+    def subscribe_ticker(self, symbol: str, callback: Optional[Callable] = None):
+        """
+        Stream 24hr ticker updates so get_symbol_ticker is served from memory
+        
+        Args:
+            symbol: Trading pair
+            callback: Optional callback receiving each streamed ticker
+        """
+        self._get_stream().subscribe_ticker(symbol, callback)
+    
+    def close_streams(self):
+        """Stop the market data stream"""
+        if self.stream:
+            self.stream.stop()
+            self.stream = None
+    
+    def close(self):
+        """Stop the market data stream and release the async client"""
+        self.close_streams()
+        if self._async_client is not None:
+            self._async_client.close()
+            self._async_client = None
+    
     def create_order(
         self,
         symbol: str,
@@ -225,61 +749,52 @@ class BinanceClient:
             Order response or None if failed
         """
         try:
-            if self.is_futures():
-                # Futures order
-                if order_type == 'MARKET':
-                    order = self.client.futures_create_order(
-                        symbol=symbol,
-                        side=side,
-                        type=order_type,
-                        quantity=quantity,
-                        positionSide=position_side
-                    )
-                elif order_type == 'LIMIT':
-                    if price is None:
-                        raise ValueError("Price is required for LIMIT orders")
-                    order = self.client.futures_create_order(
-                        symbol=symbol,
-                        side=side,
-                        type=order_type,
-                        timeInForce=time_in_force,
-                        quantity=quantity,
-                        price=str(price),
-                        positionSide=position_side
-                    )
-                else:
-                    raise ValueError(f"Unsupported order type: {order_type}")
-            else:
-                # Spot order
-                if order_type == 'MARKET':
-                    order = self.client.create_order(
-                        symbol=symbol,
-                        side=side,
-                        type=order_type,
-                        quantity=quantity
-                    )
-                elif order_type == 'LIMIT':
-                    if price is None:
-                        raise ValueError("Price is required for LIMIT orders")
-                    order = self.client.create_order(
-                        symbol=symbol,
-                        side=side,
-                        type=order_type,
-                        timeInForce=time_in_force,
-                        quantity=quantity,
-                        price=str(price)
-                    )
-                else:
-                    raise ValueError(f"Unsupported order type: {order_type}")
+            key = (symbol, side, order_type, time_in_force, position_side)
+            template = self._order_templates.get(key)
+            if template is None:
+                template = self._build_order_template(*key)
+                self._order_templates[key] = template
+            
+            params = template.copy()
+            params['quantity'] = quantity
+            if order_type == 'LIMIT':
+                if price is None:
+                    raise ValueError("Price is required for LIMIT orders")
+                params['price'] = str(price)
+            
+            order = self._signed_request('POST', self._order_url, params)
             
-            mode_str = "Futures" if self.is_futures() else "Spot"
-            self.logger.info(f"✓ {mode_str} order created: {side} {quantity} {symbol} at {order.get('price', 'MARKET')}")
+            self.logger.info(
+                "✓ %s order created: %s %s %s at %s",
+                self._mode_label, side, quantity, symbol, order.get('price', 'MARKET')
+            )
             return order
             
-        except (BinanceAPIException, BinanceOrderException) as e:
-            self.logger.error(f"✗ Failed to create order: {e}")
+        except (BinanceAPIException, BinanceOrderException, BinanceRequestException,
+                urllib3.exceptions.HTTPError) as e:
+            self.logger.error("✗ Failed to create order: %s", e)
             return None
     
+    def _build_order_template(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        time_in_force: str,
+        position_side: str
+    ) -> Dict:
+        """Build the fixed part of an order request, in wire order"""
+        if order_type not in ('MARKET', 'LIMIT'):
+            raise ValueError(f"Unsupported order type: {order_type}")
+        
+        template = {'symbol': symbol, 'side': side, 'type': order_type}
+        if order_type == 'LIMIT':
+            template['timeInForce'] = time_in_force
+        if self._uses_position_side:
+            template['positionSide'] = position_side
+        template['recvWindow'] = ORDER_RECV_WINDOW
+        return template
+    
     def create_market_buy(self, symbol: str, quantity: float) -> Optional[Dict]:
         """
         Create a market buy order
@@ -328,10 +843,10 @@ class BinanceClient:
             Order information
         """
         try:
-            order = self.client.get_order(symbol=symbol, orderId=order_id)
+            order = self._call('order_status', self.client.get_order, symbol=symbol, orderId=order_id)
             return order
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get order status: {e}")
+            self.logger.error("✗ Failed to get order status: %s", e)
             return None
     
     def cancel_order(self, symbol: str, order_id: int) -> bool:
@@ -346,13 +861,70 @@ class BinanceClient:
             True if successful
         """
         try:
-            self.client.cancel_order(symbol=symbol, orderId=order_id)
-            self.logger.info(f"✓ Order {order_id} cancelled")
+            self._signed_request('DELETE', self._order_url, {
+                'symbol': symbol,
+                'orderId': order_id,
+                'recvWindow': ORDER_RECV_WINDOW
+            })
+            self.logger.info("✓ Order %s cancelled", order_id)
             return True
-        except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to cancel order {order_id}: {e}")
+        except (BinanceAPIException, BinanceRequestException, urllib3.exceptions.HTTPError) as e:
+            self.logger.error("✗ Failed to cancel order %s: %s", order_id, e)
+            return False
+    
+    def cancel_all_open(self, symbol: str) -> bool:
+        """
+        Cancel every open order on a symbol with a single request
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            True if successful
+        """
+        try:
+            self._signed_request('DELETE', self._open_orders_url, {
+                'symbol': symbol,
+                'recvWindow': ORDER_RECV_WINDOW
+            })
+            self.logger.info("✓ All open orders cancelled for %s", symbol)
+            return True
+        except (BinanceAPIException, BinanceRequestException, urllib3.exceptions.HTTPError) as e:
+            self.logger.error("✗ Failed to cancel open orders for %s: %s", symbol, e)
             return False
     
+    def cancel_orders(self, symbol: str, order_ids: List[int]) -> List[bool]:
+        """
+        Cancel several orders concurrently (one round-trip of wall-clock time)
+        
+        Args:
+            symbol: Trading pair
+            order_ids: Order IDs to cancel
+            
+        Returns:
+            Cancel result per order ID, in the same order
+        """
+        if self._async_client is None:
+            # Imported here: the async client reuses this module's parsers
+            from src.core.async_exchange_client import AsyncBinanceClient
+            self._async_client = AsyncBinanceClient(self.api_key, self.api_secret, self.trading_mode)
+        
+        for _ in order_ids:
+            self._order_bucket.consume()
+        self._weight_bucket.consume(API_WEIGHTS['order'] * len(order_ids))
+        
+        try:
+            results = self._async_client.cancel_orders(symbol, order_ids)
+        except Exception as e:
+            self.logger.error("✗ Failed to cancel orders for %s: %s", symbol, e)
+            return [False] * len(order_ids)
+        finally:
+            if self._async_client.used_weight:
+                self._weight_bucket.sync_used(self._async_client.used_weight)
+        
+        self.logger.info("✓ Cancelled %d/%d orders for %s", sum(results), len(results), symbol)
+        return results
+    
     def get_recent_trades(self, symbol: str, limit: int = 10) -> List[Dict]:
         """
         Get recent trades
@@ -365,8 +937,8 @@ class BinanceClient:
             List of recent trades
         """
         try:
-            trades = self.client.get_recent_trades(symbol=symbol, limit=limit)
+            trades = self._call('recent_trades', self.client.get_recent_trades, symbol=symbol, limit=limit)
             return trades
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get recent trades: {e}")
+            self.logger.error("✗ Failed to get recent trades: %s", e)
             return []
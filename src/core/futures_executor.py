@@ -3,12 +3,106 @@ Binance Futures Executor Module
 Handles Binance Futures API operations with leverage support
 """
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from decimal import ROUND_DOWN, Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+import requests
 from binance.client import Client
 from binance.enums import *
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 
 from config.settings import AppConfig
+from src.core.exchange_client import configure_session
+from src.core.websocket_handler import UserStreamManager
+from src.models.trading_models import PositionSnap
+
+
+# Maximum orders per /fapi/v1/batchOrders request
+MAX_BATCH_ORDERS = 5
+
+
+def parse_futures_account(account: Dict) -> Dict:
+    """Summarize a raw Binance Futures account into balance figures"""
+    total_balance = float(account['totalWalletBalance'])
+    available_balance = float(account['availableBalance'])
+    unrealized_pnl = float(account['totalUnrealizedProfit'])
+    
+    return {
+        'total_balance': total_balance,
+        'available_balance': available_balance,
+        'unrealized_pnl': unrealized_pnl,
+        'margin_balance': total_balance + unrealized_pnl
+    }
+
+
+def parse_position(pos: Dict) -> Optional[PositionSnap]:
+    """Parse one raw position entry, or return None if it is empty"""
+    position_amt = float(pos['positionAmt'])
+    if position_amt == 0:
+        return None
+    
+    liquidation_price = pos.get('liquidationPrice')
+    return PositionSnap(
+        pos['symbol'],
+        position_amt,
+        float(pos['entryPrice']),
+        float(pos['unRealizedProfit']),
+        int(pos['leverage']),
+        pos['positionSide'],
+        float(liquidation_price) if liquidation_price else None
+    )
+
+
+def parse_open_position(positions: List[Dict]) -> Optional[PositionSnap]:
+    """Return the first non-empty position from raw position information"""
+    for pos in positions:
+        parsed = parse_position(pos)
+        if parsed:
+            return parsed
+    
+    return None
+
+
+def parse_symbol_info(s: Dict) -> Dict:
+    """Extract the trading rules used by the executor from a raw symbol entry"""
+    return {
+        'symbol': s['symbol'],
+        'status': s['status'],
+        'base_asset': s['baseAsset'],
+        'quote_asset': s['quoteAsset'],
+        'price_precision': s['pricePrecision'],
+        'quantity_precision': s['quantityPrecision'],
+        'filters': s['filters']
+    }
+
+
+def build_order_formatters(info: Dict) -> Tuple[Callable, Callable]:
+    """
+    Build price and quantity formatters from parsed symbol info. Prices are
+    rounded; quantities are truncated so sizing never rounds up past the
+    available margin.
+    
+    Args:
+        info: Symbol info from parse_symbol_info
+    
+    Returns:
+        (format_price, format_qty) callables returning strings
+    """
+    price_spec = f".{info['price_precision']}f"
+    qty_step = Decimal(1).scaleb(-info['quantity_precision'])
+    return (
+        lambda value: format(value, price_spec),
+        # str() gives the shortest repr, so 0.3 is not truncated to 0.299
+        lambda value: format(Decimal(str(value)).quantize(qty_step, rounding=ROUND_DOWN), 'f')
+    )
+
+
+def _batch_value(value) -> str:
+    """Encode an order parameter for a batchOrders payload (all strings)"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
 
 
 class FuturesExecutor:
@@ -29,6 +123,9 @@ class FuturesExecutor:
         self.client = client
         self.config = config
         
+        # Reuse pooled keep-alive connections for every Futures call
+        configure_session(client)
+        
         # Futures configuration
         self.default_leverage = config.trading.DEFAULT_LEVERAGE
         self.margin_type = config.trading.MARGIN_TYPE
@@ -36,9 +133,33 @@ class FuturesExecutor:
         # Symbol-specific leverage cache
         self.leverage_cache: Dict[str, int] = {}
         
+        # Exchange info cache, indexed by symbol
+        self.exchange_info_ttl = config.binance.EXCHANGE_INFO_TTL
+        self._exchange_info_cache: Optional[Dict] = None
+        self._exchange_info_ts = 0.0
+        self._symbol_index: Dict[str, Dict] = {}
+        self._symbol_info: Dict[str, Dict] = {}
+        
+        # Per-symbol price/quantity formatters from exchange precision
+        self._order_formatters: Dict[str, Tuple[Callable, Callable]] = {}
+        
+        # Balance cache: (fetched_at, balance), served stale while refreshing
+        self.balance_ttl = 1.0
+        self._balance_cache: Optional[Tuple[float, Dict]] = None
+        self._balance_refreshing = False
+        self._balance_lock = threading.Lock()
+        
+        # Open positions snapshot for all symbols, refreshed once per TTL
+        self.positions_ttl = 1.0
+        self._positions: Dict[str, PositionSnap] = {}
+        self._positions_ts: Optional[float] = None
+        
+        # User-data stream; while connected it replaces position/balance polling
+        self.user_stream: Optional[UserStreamManager] = None
+        
         self.logger.info("✓ Futures Executor initialized")
-        self.logger.info(f"  Default Leverage: {self.default_leverage}x")
-        self.logger.info(f"  Margin Type: {self.margin_type}")
+        self.logger.info("  Default Leverage: %sx", self.default_leverage)
+        self.logger.info("  Margin Type: %s", self.margin_type)
     
     def set_leverage(self, symbol: str, leverage: Optional[int] = None) -> bool:
         """
@@ -55,7 +176,7 @@ class FuturesExecutor:
         
         # Check cache
         if symbol in self.leverage_cache and self.leverage_cache[symbol] == leverage:
-            self.logger.debug(f"Leverage already set for {symbol}: {leverage}x")
+            self.logger.debug("Leverage already set for %s: %sx", symbol, leverage)
             return True
         
         try:
@@ -66,11 +187,11 @@ class FuturesExecutor:
             )
             
             self.leverage_cache[symbol] = leverage
-            self.logger.info(f"✓ Leverage set for {symbol}: {leverage}x")
+            self.logger.info("✓ Leverage set for %s: %sx", symbol, leverage)
             return True
             
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to set leverage for {symbol}: {e}")
+            self.logger.error("✗ Failed to set leverage for %s: %s", symbol, e)
             return False
     
     def set_margin_type(self, symbol: str, margin_type: Optional[str] = None) -> bool:
@@ -87,7 +208,7 @@ class FuturesExecutor:
         margin_type = (margin_type or self.margin_type).upper()
         
         if margin_type not in ['ISOLATED', 'CROSSED']:
-            self.logger.error(f"Invalid margin type: {margin_type}")
+            self.logger.error("Invalid margin type: %s", margin_type)
             return False
         
         try:
@@ -97,16 +218,16 @@ class FuturesExecutor:
                 marginType=margin_type
             )
             
-            self.logger.info(f"✓ Margin type set for {symbol}: {margin_type}")
+            self.logger.info("✓ Margin type set for %s: %s", symbol, margin_type)
             return True
             
         except BinanceAPIException as e:
             # Error code 4046 means margin type is already set
             if e.code == -4046:
-                self.logger.debug(f"Margin type already set for {symbol}: {margin_type}")
+                self.logger.debug("Margin type already set for %s: %s", symbol, margin_type)
                 return True
             else:
-                self.logger.error(f"✗ Failed to set margin type for {symbol}: {e}")
+                self.logger.error("✗ Failed to set margin type for %s: %s", symbol, e)
                 return False
     
     def enable_hedge_mode(self) -> bool:
@@ -131,32 +252,63 @@ class FuturesExecutor:
             return True
             
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to enable hedge mode: {e}")
+            self.logger.error("✗ Failed to enable hedge mode: %s", e)
             return False
     
     def get_futures_balance(self) -> Dict:
         """
-        Get Futures account balance
+        Get Futures account balance. Within balance_ttl the cached value is
+        returned; once stale, the last value is returned immediately while
+        a background thread refreshes it.
         
         Returns:
             Balance information
         """
+        with self._balance_lock:
+            cached = self._balance_cache
+            # A live user stream expires the cache on ACCOUNT_UPDATE instead
+            ttl = float('inf') if self._stream_connected() else self.balance_ttl
+            if cached is not None and time.monotonic() - cached[0] >= ttl \
+                    and not self._balance_refreshing:
+                self._balance_refreshing = True
+                threading.Thread(target=self._refresh_balance, daemon=True).start()
+        
+        if cached is not None:
+            return dict(cached[1])
+        
+        balance = self._fetch_balance()
+        return dict(balance)
+    
+    def _expire_balance(self, event: Optional[Dict] = None):
+        """Mark the cached balance stale so the next read refreshes it in the background"""
+        with self._balance_lock:
+            if self._balance_cache is not None:
+                self._balance_cache = (float('-inf'), self._balance_cache[1])
+    
+    def invalidate_balance(self):
+        """Drop the cached balance so the next read fetches it synchronously"""
+        with self._balance_lock:
+            self._balance_cache = None
+    
+    def _refresh_balance(self):
+        """Background refresh for a stale balance"""
+        try:
+            self._fetch_balance()
+        finally:
+            with self._balance_lock:
+                self._balance_refreshing = False
+    
+    def _fetch_balance(self) -> Dict:
+        """Fetch the Futures account balance and update the cache"""
         try:
             account = self.client.futures_account()
-            
-            total_balance = float(account['totalWalletBalance'])
-            available_balance = float(account['availableBalance'])
-            unrealized_pnl = float(account['totalUnrealizedProfit'])
-            
-            return {
-                'total_balance': total_balance,
-                'available_balance': available_balance,
-                'unrealized_pnl': unrealized_pnl,
-                'margin_balance': total_balance + unrealized_pnl
-            }
+            balance = parse_futures_account(account)
+            with self._balance_lock:
+                self._balance_cache = (time.monotonic(), balance)
+            return balance
             
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get Futures balance: {e}")
+            self.logger.error("✗ Failed to get Futures balance: %s", e)
             return {
                 'total_balance': 0.0,
                 'available_balance': 0.0,
@@ -164,7 +316,7 @@ class FuturesExecutor:
                 'margin_balance': 0.0
             }
     
-    def get_position(self, symbol: str) -> Optional[Dict]:
+    def get_position(self, symbol: str) -> Optional[PositionSnap]:
         """
         Get current position for a symbol
         
@@ -174,35 +326,105 @@ class FuturesExecutor:
         Returns:
             Position information or None
         """
+        if self._stream_connected():
+            return self.user_stream.get_position(symbol)
+        
         try:
-            positions = self.client.futures_position_information(symbol=symbol)
-            
-            for pos in positions:
-                position_amt = float(pos['positionAmt'])
-                if position_amt != 0:
-                    return {
-                        'symbol': pos['symbol'],
-                        'position_amt': position_amt,
-                        'entry_price': float(pos['entryPrice']),
-                        'unrealized_pnl': float(pos['unRealizedProfit']),
-                        'leverage': int(pos['leverage']),
-                        'position_side': pos['positionSide'],
-                        'liquidation_price': float(pos['liquidationPrice']) if pos.get('liquidationPrice') else None
-                    }
-            
-            return None
+            if self._positions_ts is None or time.monotonic() - self._positions_ts >= self.positions_ttl:
+                self.refresh_positions()
+            return self._positions.get(symbol)
             
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get position for {symbol}: {e}")
+            self.logger.error("✗ Failed to get position for %s: %s", symbol, e)
             return None
     
+    def refresh_positions(self) -> Dict[str, PositionSnap]:
+        """
+        Fetch open positions for every symbol in one request
+        
+        Returns:
+            Open positions keyed by symbol
+            
+        Raises:
+            BinanceAPIException: If the request fails
+        """
+        positions: Dict[str, PositionSnap] = {}
+        for pos in self.client.futures_position_information():
+            if pos['symbol'] not in positions:
+                parsed = parse_position(pos)
+                if parsed:
+                    positions[pos['symbol']] = parsed
+        
+        self._positions = positions
+        self._positions_ts = time.monotonic()
+        return positions
+    
+    def invalidate_positions(self):
+        """Force the next position read to refetch the snapshot"""
+        self._positions_ts = None
+    
+    # ==================== USER DATA STREAM ====================
+    
+    def start_user_stream(self) -> UserStreamManager:
+        """
+        Start the user-data stream, resynced from REST on every (re)connect.
+        While it is connected, positions are read from the stream and the
+        balance is only refetched after an ACCOUNT_UPDATE.
+        
+        Returns:
+            Running user stream manager
+        """
+        if self.user_stream is None:
+            self.user_stream = UserStreamManager(self.client, self._stream_snapshot, self.default_leverage)
+            self.user_stream.on('ACCOUNT_UPDATE', self._expire_balance)
+            self.user_stream.start()
+        return self.user_stream
+    
+    def _stream_snapshot(self) -> Tuple[Dict[Tuple[str, str], PositionSnap], Dict[str, Dict]]:
+        """
+        Fetch positions and wallet balances to (re)seed the user stream
+        
+        Returns:
+            (positions keyed by (symbol, position side), balances keyed by asset)
+        """
+        positions: Dict[Tuple[str, str], PositionSnap] = {}
+        for pos in self.client.futures_position_information():
+            parsed = parse_position(pos)
+            if parsed:
+                positions[(parsed.symbol, parsed.position_side)] = parsed
+        
+        account = self.client.futures_account()
+        balances = {
+            a['asset']: {
+                'wallet_balance': float(a['walletBalance']),
+                'cross_wallet_balance': float(a['crossWalletBalance'])
+            }
+            for a in account.get('assets', ())
+        }
+        # The same response refreshes the cached account balance
+        with self._balance_lock:
+            self._balance_cache = (time.monotonic(), parse_futures_account(account))
+        return positions, balances
+    
+    def stop_user_stream(self):
+        """Stop the user-data stream and fall back to REST polling"""
+        if self.user_stream is not None:
+            self.user_stream.stop()
+            self.user_stream = None
+            self.invalidate_positions()
+    
+    def _stream_connected(self) -> bool:
+        """Whether reads can be served from the user-data stream"""
+        return self.user_stream is not None and self.user_stream.connected
+    
     def create_market_order(
         self,
         symbol: str,
         side: str,
         quantity: float,
         position_side: str = 'BOTH',
-        reduce_only: bool = False
+        reduce_only: bool = False,
+        batch: Optional[List[Dict]] = None
     ) -> Optional[Dict]:
         """
         Create a Futures market order
@@ -213,29 +435,38 @@ class FuturesExecutor:
             quantity: Order quantity (in base asset)
             position_side: 'LONG', 'SHORT', or 'BOTH' (for hedge mode)
             reduce_only: If True, order only reduces position
+            batch: If given, the order is appended here instead of sent (see flush_batch)
             
         Returns:
             Order response or None
         """
         try:
-            order = self.client.futures_create_order(
+            format_price, format_qty = self.get_order_formatters(symbol)
+            params = dict(
                 symbol=symbol,
                 side=side,
                 type='MARKET',
-                quantity=quantity,
+                quantity=format_qty(quantity),
                 positionSide=position_side,
                 reduceOnly=reduce_only
             )
+            if batch is not None:
+                batch.append(params)
+                return params
             
+            order = self.client.futures_create_order(**params)
+            
+            self.invalidate_balance()
+            self.invalidate_positions()
             self.logger.info(
-                f"✓ Futures {side} order created: {quantity} {symbol} "
-                f"(Position: {position_side}, ReduceOnly: {reduce_only})"
+                "✓ Futures %s order created: %s %s (Position: %s, ReduceOnly: %s)",
+                side, quantity, symbol, position_side, reduce_only
             )
             
             return order
             
         except (BinanceAPIException, BinanceOrderException) as e:
-            self.logger.error(f"✗ Failed to create Futures market order: {e}")
+            self.logger.error("✗ Failed to create Futures market order: %s", e)
             return None
     
     def create_limit_order(
@@ -246,7 +477,8 @@ class FuturesExecutor:
         price: float,
         position_side: str = 'BOTH',
         reduce_only: bool = False,
-        time_in_force: str = 'GTC'
+        time_in_force: str = 'GTC',
+        batch: Optional[List[Dict]] = None
     ) -> Optional[Dict]:
         """
         Create a Futures limit order
@@ -259,31 +491,40 @@ class FuturesExecutor:
             position_side: 'LONG', 'SHORT', or 'BOTH'
             reduce_only: If True, order only reduces position
             time_in_force: Time in force ('GTC', 'IOC', 'FOK')
+            batch: If given, the order is appended here instead of sent (see flush_batch)
             
         Returns:
             Order response or None
         """
         try:
-            order = self.client.futures_create_order(
+            format_price, format_qty = self.get_order_formatters(symbol)
+            params = dict(
                 symbol=symbol,
                 side=side,
                 type='LIMIT',
-                quantity=quantity,
-                price=str(price),
+                quantity=format_qty(quantity),
+                price=format_price(price),
                 timeInForce=time_in_force,
                 positionSide=position_side,
                 reduceOnly=reduce_only
             )
+            if batch is not None:
+                batch.append(params)
+                return params
+            
+            order = self.client.futures_create_order(**params)
             
+            self.invalidate_balance()
+            self.invalidate_positions()
             self.logger.info(
-                f"✓ Futures {side} limit order created: {quantity} {symbol} @ ${price} "
-                f"(Position: {position_side})"
+                "✓ Futures %s limit order created: %s %s @ $%s (Position: %s)",
+                side, quantity, symbol, price, position_side
             )
             
             return order
             
         except (BinanceAPIException, BinanceOrderException) as e:
-            self.logger.error(f"✗ Failed to create Futures limit order: {e}")
+            self.logger.error("✗ Failed to create Futures limit order: %s", e)
             return None
     
     def create_stop_loss(
@@ -292,7 +533,8 @@ class FuturesExecutor:
         side: str,
         quantity: float,
         stop_price: float,
-        position_side: str = 'BOTH'
+        position_side: str = 'BOTH',
+        batch: Optional[List[Dict]] = None
     ) -> Optional[Dict]:
         """
         Create a stop-loss order
@@ -303,29 +545,36 @@ class FuturesExecutor:
             quantity: Order quantity
             stop_price: Stop trigger price
             position_side: 'LONG', 'SHORT', or 'BOTH'
+            batch: If given, the order is appended here instead of sent (see flush_batch)
             
         Returns:
             Order response or None
         """
         try:
-            order = self.client.futures_create_order(
+            format_price, format_qty = self.get_order_formatters(symbol)
+            params = dict(
                 symbol=symbol,
                 side=side,
                 type='STOP_MARKET',
-                quantity=quantity,
-                stopPrice=str(stop_price),
+                quantity=format_qty(quantity),
+                stopPrice=format_price(stop_price),
                 positionSide=position_side,
                 reduceOnly=True
             )
+            if batch is not None:
+                batch.append(params)
+                return params
+            
+            order = self.client.futures_create_order(**params)
             
             self.logger.info(
-                f"✓ Stop-loss order created: {side} {quantity} {symbol} @ ${stop_price}"
+                "✓ Stop-loss order created: %s %s %s @ $%s", side, quantity, symbol, stop_price
             )
             
             return order
             
         except (BinanceAPIException, BinanceOrderException) as e:
-            self.logger.error(f"✗ Failed to create stop-loss order: {e}")
+            self.logger.error("✗ Failed to create stop-loss order: %s", e)
             return None
     
     def create_take_profit(
@@ -334,7 +583,8 @@ class FuturesExecutor:
         side: str,
         quantity: float,
         take_profit_price: float,
-        position_side: str = 'BOTH'
+        position_side: str = 'BOTH',
+        batch: Optional[List[Dict]] = None
     ) -> Optional[Dict]:
         """
         Create a take-profit order
@@ -345,31 +595,141 @@ class FuturesExecutor:
             quantity: Order quantity
             take_profit_price: Take profit trigger price
             position_side: 'LONG', 'SHORT', or 'BOTH'
+            batch: If given, the order is appended here instead of sent (see flush_batch)
             
         Returns:
             Order response or None
         """
         try:
-            order = self.client.futures_create_order(
+            format_price, format_qty = self.get_order_formatters(symbol)
+            params = dict(
                 symbol=symbol,
                 side=side,
                 type='TAKE_PROFIT_MARKET',
-                quantity=quantity,
-                stopPrice=str(take_profit_price),
+                quantity=format_qty(quantity),
+                stopPrice=format_price(take_profit_price),
                 positionSide=position_side,
                 reduceOnly=True
             )
+            if batch is not None:
+                batch.append(params)
+                return params
+            
+            order = self.client.futures_create_order(**params)
             
             self.logger.info(
-                f"✓ Take-profit order created: {side} {quantity} {symbol} @ ${take_profit_price}"
+                "✓ Take-profit order created: %s %s %s @ $%s", side, quantity, symbol, take_profit_price
             )
             
             return order
             
         except (BinanceAPIException, BinanceOrderException) as e:
-            self.logger.error(f"✗ Failed to create take-profit order: {e}")
+            self.logger.error("✗ Failed to create take-profit order: %s", e)
             return None
     
+    def get_order_formatters(self, symbol: str) -> Tuple[Callable, Callable]:
+        """
+        Get price and quantity formatters matching the symbol's precision.
+        Built once per symbol from the cached exchange info
+        (see build_order_formatters).
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            (format_price, format_qty) callables returning strings
+        """
+        formatters = self._order_formatters.get(symbol)
+        if formatters is None:
+            info = self.get_symbol_info(symbol)
+            if info is None:
+                # Unknown precision: send the plain representation. Cached only
+                # when exchange info loaded, so a failed download is retried
+                if self._exchange_info_cache is not None:
+                    self._order_formatters[symbol] = (str, str)
+                return str, str
+            
+            formatters = self._order_formatters[symbol] = build_order_formatters(info)
+        return formatters
+    
+    def flush_batch(self, batch: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Send accumulated orders with as few batchOrders requests as possible
+        
+        Args:
+            batch: Order parameters collected by the create_* methods (cleared)
+            
+        Returns:
+            Order response (or None if rejected) per order, in the same order
+        """
+        results: List[Optional[Dict]] = []
+        
+        for start in range(0, len(batch), MAX_BATCH_ORDERS):
+            chunk = [
+                {key: _batch_value(value) for key, value in params.items()}
+                for params in batch[start:start + MAX_BATCH_ORDERS]
+            ]
+            try:
+                responses = self.client.futures_place_batch_order(batchOrders=chunk)
+            except (BinanceAPIException, BinanceOrderException) as e:
+                self.logger.error("✗ Failed to place batch orders: %s", e)
+                results.extend([None] * len(chunk))
+                continue
+            
+            for params, response in zip(chunk, responses):
+                if 'code' in response and 'orderId' not in response:
+                    self.logger.error(
+                        "✗ Batch %s order rejected for %s: %s",
+                        params['type'], params['symbol'], response.get('msg')
+                    )
+                    results.append(None)
+                else:
+                    results.append(response)
+        
+        batch.clear()
+        if any(results):
+            self.invalidate_balance()
+            self.invalidate_positions()
+            self.logger.info("✓ Batch placed: %s/%s orders", sum(1 for r in results if r), len(results))
+        return results
+    
+    def create_bracket(
+        self,
+        symbol: str,
+        entry_side: str,
+        quantity: float,
+        stop_price: float,
+        take_profit_price: float,
+        entry_price: Optional[float] = None,
+        position_side: str = 'BOTH'
+    ) -> List[Optional[Dict]]:
+        """
+        Place entry, stop-loss and take-profit orders in a single request
+        
+        Args:
+            symbol: Trading symbol
+            entry_side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            stop_price: Stop-loss trigger price
+            take_profit_price: Take-profit trigger price
+            entry_price: Limit price for the entry, market entry if None
+            position_side: 'LONG', 'SHORT', or 'BOTH'
+            
+        Returns:
+            [entry, stop_loss, take_profit] responses (None where rejected)
+        """
+        exit_side = 'SELL' if entry_side == 'BUY' else 'BUY'
+        batch: List[Dict] = []
+        
+        if entry_price is None:
+            self.create_market_order(symbol, entry_side, quantity, position_side, batch=batch)
+        else:
+            self.create_limit_order(symbol, entry_side, quantity, entry_price, position_side, batch=batch)
+        self.create_stop_loss(symbol, exit_side, quantity, stop_price, position_side, batch=batch)
+        self.create_take_profit(symbol, exit_side, quantity, take_profit_price, position_side, batch=batch)
+        
+        return self.flush_batch(batch)
+    
     def close_position(
         self,
         symbol: str,
@@ -389,7 +749,7 @@ class FuturesExecutor:
         position = self.get_position(symbol)
         
         if not position:
-            self.logger.warning(f"No position to close for {symbol}")
+            self.logger.warning("No position to close for %s", symbol)
             return None
         
         # Determine close side (opposite of position)
@@ -422,11 +782,11 @@ class FuturesExecutor:
         """
         try:
             self.client.futures_cancel_all_open_orders(symbol=symbol)
-            self.logger.info(f"✓ All orders cancelled for {symbol}")
+            self.logger.info("✓ All orders cancelled for %s", symbol)
             return True
             
         except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to cancel orders for {symbol}: {e}")
+            self.logger.error("✗ Failed to cancel orders for %s: %s", symbol, e)
             return False
     
     def get_symbol_info(self, symbol: str) -> Optional[Dict]:
@@ -440,22 +800,34 @@ class FuturesExecutor:
             Symbol information or None
         """
         try:
-            exchange_info = self.client.futures_exchange_info()
-            
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    return {
-                        'symbol': s['symbol'],
-                        'status': s['status'],
-                        'base_asset': s['baseAsset'],
-                        'quote_asset': s['quoteAsset'],
-                        'price_precision': s['pricePrecision'],
-                        'quantity_precision': s['quantityPrecision'],
-                        'filters': s['filters']
-                    }
-            
-            return None
-            
-        except BinanceAPIException as e:
-            self.logger.error(f"✗ Failed to get Futures symbol info: {e}")
+            self._get_exchange_info()
+            info = self._symbol_info.get(symbol)
+            if info is None:
+                s = self._symbol_index.get(symbol)
+                if s is None:
+                    return None
+                # Parse lazily, once per symbol per exchange-info refresh
+                info = self._symbol_info[symbol] = parse_symbol_info(s)
+            
+            return info
+            
+        except (BinanceAPIException, BinanceRequestException, requests.RequestException) as e:
+            self.logger.error("✗ Failed to get Futures symbol info: %s", e)
             return None
+    
+    def _get_exchange_info(self) -> Dict:
+        """
+        Return Futures exchange info, refetching once the TTL expires.
+        The symbol index is rebuilt together with the cached payload.
+        
+        Returns:
+            Raw exchange info
+        """
+        now = time.monotonic()
+        if self._exchange_info_cache is None or now - self._exchange_info_ts >= self.exchange_info_ttl:
+            exchange_info = self.client.futures_exchange_info()
+            self._symbol_index = {s['symbol']: s for s in exchange_info['symbols']}
+            self._symbol_info = {}
+            self._exchange_info_cache = exchange_info
+            self._exchange_info_ts = now
+        return self._exchange_info_cache
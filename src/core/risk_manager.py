@@ -3,11 +3,60 @@ Risk Management Module for Trading Bot
 Handles position sizing, risk validation, and drawdown monitoring
 """
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 from datetime import datetime
+import numpy as np
 
 from config.settings import AppConfig
-from src.models.trading_models import Position, TradingStats
+from src.models.trading_models import Position, RiskSnapshot, TradingStats
+from src.utils.jit import njit
+
+
+def compute_drawdown_curve(
+    balances: Sequence[float],
+    initial_peak: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute running peaks and drawdowns for a balance series in one pass
+    
+    Args:
+        balances: Balance history (oldest first)
+        initial_peak: Peak reached before the series starts, if any
+        
+    Returns:
+        Tuple of (peaks, drawdown_pcts) arrays aligned with balances
+    """
+    balances = np.asarray(balances, dtype=np.float64)
+    peaks = np.maximum.accumulate(balances)
+    if initial_peak is not None:
+        np.maximum(peaks, initial_peak, out=peaks)
+    
+    drawdowns = np.zeros_like(balances)
+    np.divide((peaks - balances) * 100, peaks, out=drawdowns, where=peaks > 0)
+    return peaks, drawdowns
+
+
+@njit(cache=True, fastmath=True)
+def _position_size_core(
+    current_balance: float,
+    entry_price: float,
+    stop_loss_price: float,
+    leverage: float,
+    risk_fraction: float,
+    dynamic: bool
+) -> float:
+    """Numeric core of RiskManager.calculate_position_size (stop_loss_price 0 = none)"""
+    if not dynamic:
+        return current_balance / entry_price
+    
+    risk_amount = current_balance * risk_fraction
+    if stop_loss_price > 0:
+        risk_per_unit = abs(entry_price - stop_loss_price)
+        if risk_per_unit > 0:
+            return risk_amount / risk_per_unit
+        return risk_amount / entry_price
+    
+    return current_balance * leverage * risk_fraction / entry_price
 
 
 class RiskManager:
@@ -16,6 +65,13 @@ class RiskManager:
     Validates trades against risk parameters before execution.
     """
     
+    __slots__ = (
+        'logger', 'config',
+        'initial_balance', 'max_risk_per_trade_pct', 'max_drawdown_pct', 'dynamic_position_sizing',
+        '_risk_fraction', '_balance_tolerance', '_drawdown_warn_threshold', '_drawdown_crit_threshold',
+        'peak_balance', 'current_drawdown_pct', '_snapshot'
+    )
+    
     def __init__(self, config: AppConfig, initial_balance: float):
         """
         Initialize risk manager
@@ -33,14 +89,20 @@ class RiskManager:
         self.max_drawdown_pct = config.trading.MAX_DRAWDOWN_PCT
         self.dynamic_position_sizing = config.trading.DYNAMIC_POSITION_SIZING
         
+        # Derived thresholds, computed once instead of on every check
+        self._risk_fraction = self.max_risk_per_trade_pct / 100.0
+        self._balance_tolerance = 1.01  # Allow 1% over the leveraged balance
+        self._drawdown_warn_threshold = self.max_drawdown_pct * 0.8
+        self._drawdown_crit_threshold = self.max_drawdown_pct
+        
         # State tracking
         self.peak_balance = initial_balance
         self.current_drawdown_pct = 0.0
         
         self.logger.info("✓ Risk Manager initialized")
-        self.logger.info(f"  Max Risk Per Trade: {self.max_risk_per_trade_pct}%")
-        self.logger.info(f"  Max Drawdown: {self.max_drawdown_pct}%")
-        self.logger.info(f"  Dynamic Position Sizing: {self.dynamic_position_sizing}")
+        self.logger.info("  Max Risk Per Trade: %s%%", self.max_risk_per_trade_pct)
+        self.logger.info("  Max Drawdown: %s%%", self.max_drawdown_pct)
+        self.logger.info("  Dynamic Position Sizing: %s", self.dynamic_position_sizing)
     
     def calculate_position_size(
         self,
@@ -61,20 +123,26 @@ class RiskManager:
         Returns:
             Tuple of (position_size, calculation_details)
         """
+        position_size = _position_size_core(
+            current_balance,
+            entry_price,
+            stop_loss_price or 0.0,
+            leverage,
+            self._risk_fraction,
+            self.dynamic_position_sizing
+        )
+        
         if not self.dynamic_position_sizing:
             # Fixed position sizing: use full balance
-            position_size = current_balance / entry_price
             details = f"Fixed sizing: {position_size:.6f} units (full balance)"
             return position_size, details
         
         # Dynamic position sizing based on risk
-        risk_amount = current_balance * (self.max_risk_per_trade_pct / 100)
+        risk_amount = current_balance * self._risk_fraction
         
         if stop_loss_price and stop_loss_price > 0:
-            # Calculate position size based on stop loss distance
-            risk_per_unit = abs(entry_price - stop_loss_price)
-            if risk_per_unit > 0:
-                position_size = risk_amount / risk_per_unit
+            # Size based on stop loss distance
+            if entry_price != stop_loss_price:
                 details = (
                     f"Dynamic sizing: {position_size:.6f} units "
                     f"(risk ${risk_amount:.2f} @ {self.max_risk_per_trade_pct}% "
@@ -82,18 +150,15 @@ class RiskManager:
                 )
             else:
                 # Fallback if stop loss is at entry
-                position_size = risk_amount / entry_price
                 details = f"Risk-based sizing: {position_size:.6f} units (SL at entry)"
         else:
             # No stop loss provided, use conservative percentage of balance
-            usable_balance = current_balance * leverage * (self.max_risk_per_trade_pct / 100)
-            position_size = usable_balance / entry_price
             details = (
                 f"Conservative sizing: {position_size:.6f} units "
                 f"({self.max_risk_per_trade_pct}% of balance with {leverage}x leverage)"
             )
         
-        self.logger.debug(f"Position size calculated: {details}")
+        self.logger.debug("Position size calculated: %s", details)
         return position_size, details
     
     def validate_trade(
@@ -122,7 +187,7 @@ class RiskManager:
         
         # Check if position size is valid (with leverage)
         trade_value = position_size * entry_price
-        if trade_value > current_balance * leverage * 1.01:  # Allow 1% tolerance
+        if trade_value > current_balance * leverage * self._balance_tolerance:
             return False, (
                 f"❌ TRADE BLOCKED: Position size (${trade_value:.2f}) "
                 f"exceeds available balance with {leverage}x leverage (${current_balance * leverage:.2f})"
@@ -131,7 +196,7 @@ class RiskManager:
         # Check drawdown limit
         if stats:
             self._update_drawdown(current_balance)
-            if self.current_drawdown_pct >= self.max_drawdown_pct:
+            if self.current_drawdown_pct >= self._drawdown_crit_threshold:
                 return False, (
                     f"❌ TRADE BLOCKED: Maximum drawdown reached "
                     f"({self.current_drawdown_pct:.2f}% >= {self.max_drawdown_pct}%). "
@@ -161,8 +226,9 @@ class RiskManager:
         # Position close is generally always valid
         # This method exists for future risk checks (e.g., circuit breakers)
         
-        pnl_pct = ((current_price - position.entry_price) / position.entry_price) * 100
-        self.logger.debug(f"Position close validated: {reason} (P&L: {pnl_pct:+.2f}%)")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            pnl_pct = ((current_price - position.entry_price) / position.entry_price) * 100
+            self.logger.debug("Position close validated: %s (P&L: %+.2f%%)", reason, pnl_pct)
         
         return True, "✓ Position close validated"
     
@@ -183,7 +249,26 @@ class RiskManager:
                 (self.peak_balance - current_balance) / self.peak_balance * 100
             )
     
-    def get_risk_status(self, current_balance: float, stats: Optional[TradingStats] = None) -> dict:
+    def update_drawdown_series(self, balances: Sequence[float]) -> np.ndarray:
+        """
+        Replay a balance series through drawdown tracking (vectorized).
+        Equivalent to calling _update_drawdown for each balance in order.
+        
+        Args:
+            balances: Balance history (oldest first)
+            
+        Returns:
+            Drawdown percentage after each balance
+        """
+        if len(balances) == 0:
+            return np.zeros(0)
+        
+        peaks, drawdowns = compute_drawdown_curve(balances, self.peak_balance)
+        self.peak_balance = float(peaks[-1])
+        self.current_drawdown_pct = float(drawdowns[-1])
+        return drawdowns
+    
+    def get_risk_status(self, current_balance: float, stats: Optional[TradingStats] = None) -> RiskSnapshot:
         """
         Get current risk status
         
@@ -192,27 +277,27 @@ class RiskManager:
             stats: Trading statistics
             
         Returns:
-            Dictionary with risk metrics
+            Risk metrics snapshot
         """
         self._update_drawdown(current_balance)
         
-        risk_status = {
-            "current_balance": current_balance,
-            "initial_balance": self.initial_balance,
-            "peak_balance": self.peak_balance,
-            "current_drawdown_pct": round(self.current_drawdown_pct, 2),
-            "max_drawdown_pct": self.max_drawdown_pct,
-            "max_risk_per_trade_pct": self.max_risk_per_trade_pct,
-            "drawdown_warning": self.current_drawdown_pct >= self.max_drawdown_pct * 0.8,
-            "drawdown_critical": self.current_drawdown_pct >= self.max_drawdown_pct
-        }
+        snapshot = RiskSnapshot(
+            current_balance=current_balance,
+            initial_balance=self.initial_balance,
+            peak_balance=self.peak_balance,
+            current_drawdown_pct=self.current_drawdown_pct,
+            max_drawdown_pct=self.max_drawdown_pct,
+            max_risk_per_trade_pct=self.max_risk_per_trade_pct,
+            drawdown_warning=self.current_drawdown_pct >= self._drawdown_warn_threshold,
+            drawdown_critical=self.current_drawdown_pct >= self._drawdown_crit_threshold
+        )
         
         if stats:
-            risk_status["total_pnl"] = stats.total_profit_loss
-            risk_status["total_pnl_pct"] = stats.total_profit_loss_percentage
-            risk_status["win_rate"] = stats.win_rate
+            snapshot.total_pnl = stats.total_profit_loss
+            snapshot.total_pnl_pct = stats.total_profit_loss_percentage
+            snapshot.win_rate = stats.win_rate
         
-        return risk_status
+        return snapshot
     
     def log_risk_status(self, current_balance: float, stats: Optional[TradingStats] = None):
         """
@@ -226,21 +311,21 @@ class RiskManager:
         
         self.logger.info("=" * 60)
         self.logger.info("📊 RISK STATUS")
-        self.logger.info(f"Balance: ${current_balance:.2f} (Peak: ${status['peak_balance']:.2f})")
+        self.logger.info("Balance: $%.2f (Peak: $%.2f)", current_balance, status.peak_balance)
         self.logger.info(
-            f"Drawdown: {status['current_drawdown_pct']:.2f}% "
-            f"(Max: {status['max_drawdown_pct']:.2f}%)"
+            "Drawdown: %.2f%% (Max: %.2f%%)",
+            status.current_drawdown_pct, status.max_drawdown_pct
         )
         
-        if status.get('drawdown_warning') and not status.get('drawdown_critical'):
+        if status.drawdown_warning and not status.drawdown_critical:
             self.logger.warning("⚠️ WARNING: Approaching maximum drawdown limit!")
-        elif status.get('drawdown_critical'):
+        elif status.drawdown_critical:
             self.logger.error("🚨 CRITICAL: Maximum drawdown reached! Trading will be blocked.")
         
         if stats:
             self.logger.info(
-                f"Total P&L: ${status['total_pnl']:.2f} ({status['total_pnl_pct']:+.2f}%) "
-                f"| Win Rate: {status['win_rate']:.1f}%"
+                "Total P&L: $%.2f (%+.2f%%) | Win Rate: %.1f%%",
+                status.total_pnl, status.total_pnl_pct, status.win_rate
             )
         
         self.logger.info("=" * 60)
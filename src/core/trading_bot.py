@@ -2,11 +2,16 @@
 Main Trading Bot Implementation
 Supports both Spot and Futures trading with leverage and risk management
 """
+import itertools
 import logging
+import queue
+import threading
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 
 from config.settings import AppConfig
 from src.core.exchange_client import BinanceClient
@@ -14,13 +19,40 @@ from src.core.risk_manager import RiskManager
 from src.core.futures_executor import FuturesExecutor
 from src.core.websocket_handler import WebSocketHandler
 from src.strategies.rsi_strategy import RSIStrategy
-from src.indicators.technical_indicators import TechnicalIndicators
+from src.indicators.technical_indicators import IncrementalRSI, TechnicalIndicators
 from src.models.trading_models import (
     Trade, Position, TradingStats, TradeType, TradeResult, OrderStatus, MarketData, PositionSide
 )
 from src.services.notification_service import NotificationService
 from src.services.report_service import ReportService
 from src.utils.helpers import format_currency, format_percentage
+from src.utils.jit import NUMBA_AVAILABLE
+from src.utils.ring_buffer import RingBuffer
+
+
+# Closing prices loaded at startup and kept for indicator calculation
+# (at least RSI_LOOKBACK_FACTOR RSI periods for long RSI settings)
+CLOSES_HISTORY = 500
+RSI_LOOKBACK_FACTOR = 4
+
+# Minimum seconds between trading-logic runs for in-progress candle ticks
+TICK_PROCESS_INTERVAL = 0.05
+
+# Ticks buffered between the WebSocket thread and the trading thread
+TICK_QUEUE_SIZE = 1024
+
+# Queued after a config reload so the RSI is rebuilt on the trading thread
+_RELOAD_TICK = object()
+
+# Relative price change below which in-progress ticks are skipped while flat
+MIN_PRICE_CHANGE = 1e-5
+
+# Hoisted enum member for the per-tick position side check
+_LONG = PositionSide.LONG
+
+# Seconds the trade-driven parts of get_status() are reused between trades
+# (runtime_hours is rounded to 0.01 h, i.e. 36 s)
+STATUS_CACHE_TTL = 36.0
 
 
 class TradingBot:
@@ -47,17 +79,23 @@ class TradingBot:
         self.trading_mode = config.trading.TRADING_MODE
         self.is_futures = self.trading_mode == "futures"
         self.leverage = config.trading.DEFAULT_LEVERAGE if self.is_futures else 1
+        self.margin_type = config.trading.MARGIN_TYPE
         
         # Trading state
         self.current_balance = initial_balance
+        # Trade IDs: one random run prefix plus a sequence number
+        self._trade_id_prefix = uuid.uuid4().hex[:12]
+        self._trade_seq = itertools.count(1)
         self.position: Optional[Position] = None
+        self._tick_fn = self._tick_flat
         self.stats = TradingStats(
             start_balance=initial_balance,
             current_balance=initial_balance
         )
         
         # Price data
-        self.closes: List[float] = [0.0]  # Start with dummy value
+        self.closes = RingBuffer(max(CLOSES_HISTORY, config.trading.RSI_PERIOD * RSI_LOOKBACK_FACTOR))
+        self.rsi = IncrementalRSI(config.trading.RSI_PERIOD)
         self.current_price: float = 0.0
         self.current_rsi: Optional[float] = None
         
@@ -66,7 +104,8 @@ class TradingBot:
             api_key=config.binance.API_KEY,
             api_secret=config.binance.API_SECRET,
             trading_mode=self.trading_mode,
-            testnet=config.binance.TESTNET
+            testnet=config.binance.TESTNET,
+            exchange_info_ttl=config.binance.EXCHANGE_INFO_TTL
         )
         
         # Initialize Futures executor if needed
@@ -93,37 +132,55 @@ class TradingBot:
         # Control flags
         self.is_running = False
         self.is_simulation = config.trading.SIMULATION_MODE
-        self.last_candle_closed = False
+        # Open time (ms) of the candle in the newest closes slot
+        self._candle_open_time: Optional[int] = None
+        
+        # Tick coalescing: trading logic runs at most every TICK_PROCESS_INTERVAL
+        self._last_process_ts = 0.0
+        self._coalesced_ticks = 0
+        self._last_processed_price = 0.0
+        
+        # WebSocket ticks are queued and processed on a dedicated thread
+        self._tick_q: "queue.Queue[Optional[object]]" = queue.Queue(maxsize=TICK_QUEUE_SIZE)
+        self._consumer_thread: Optional[threading.Thread] = None
+        
+        # Notifications and trade reports run off the trading thread, in order
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Stats and risk status for get_status(), rebuilt after each trade
+        self._status_cache: Optional[dict] = None
+        self._status_cache_ts = 0.0
         
         mode_emoji = "🎮" if self.is_simulation else "💰"
         mode_type = "FUTURES" if self.is_futures else "SPOT"
-        self.logger.info(f"{mode_emoji} {mode_type} Trading Bot initialized")
-        self.logger.info(f"Symbol: {self.symbol} | Initial Balance: {format_currency(initial_balance)}")
+        self.logger.info("%s %s Trading Bot initialized", mode_emoji, mode_type)
+        self.logger.info("Symbol: %s | Initial Balance: %s", self.symbol, format_currency(initial_balance))
         if self.is_futures:
-            self.logger.info(f"Leverage: {self.leverage}x | Margin: {config.trading.MARGIN_TYPE}")
+            self.logger.info("Leverage: %sx | Margin: %s", self.leverage, self.margin_type)
     
     def start(self):
         """Start the trading bot"""
         self.logger.info("=" * 60)
         mode_type = "FUTURES" if self.is_futures else "SPOT"
-        self.logger.info(f"🚀 STARTING RSI {mode_type} TRADING BOT")
+        self.logger.info("🚀 STARTING RSI %s TRADING BOT", mode_type)
         self.logger.info("=" * 60)
         
-        # Test exchange connection (skip in simulation mode with invalid keys)
+        # Test exchange connection and warm up DNS, order connections and
+        # exchange info (skip in simulation mode with invalid keys)
         if not self.is_simulation:
-            if not self.exchange.test_connection():
+            if not self.exchange.warmup():
                 self.logger.error("❌ Failed to connect to exchange")
                 return False
         else:
             # In simulation mode, try to connect but don't fail if it doesn't work
-            if self.exchange.test_connection():
+            if self.exchange.warmup():
                 self.logger.info("✓ Connected to exchange (market data)")
             else:
                 self.logger.warning("⚠️ Could not connect to exchange API, will use mock data for simulation")
         
         # Setup Futures if needed (only in live mode)
         if self.is_futures and self.futures_executor and not self.is_simulation:
-            self.logger.info(f"⚙️ Configuring Futures for {self.symbol}...")
+            self.logger.info("⚙️ Configuring Futures for %s...", self.symbol)
             
             # Set leverage
             if not self.futures_executor.set_leverage(self.symbol, self.leverage):
@@ -134,14 +191,24 @@ class TradingBot:
             if not self.futures_executor.set_margin_type(self.symbol):
                 self.logger.warning("⚠️ Failed to set margin type (may already be set)")
             
-            self.logger.info(f"✓ Futures configured: {self.leverage}x leverage, {self.config.trading.MARGIN_TYPE} margin")
+            # Download exchange info now so the first order does not block on it
+            self.futures_executor.get_order_formatters(self.symbol)
+            
+            self.logger.info("✓ Futures configured: %sx leverage, %s margin", self.leverage, self.margin_type)
         elif self.is_futures and self.is_simulation:
-            self.logger.info(f"🎮 Futures SIMULATION mode: using {self.leverage}x leverage (virtual only)")
+            self.logger.info("🎮 Futures SIMULATION mode: using %sx leverage (virtual only)", self.leverage)
         
         # Get initial market data
         self._initialize_market_data()
+        self._warm_up_jit()
         
-        # Start WebSocket
+        # Start tick consumer, then WebSocket
+        self._consumer_thread = threading.Thread(
+            target=self._consume_loop,
+            name="tick-consumer",
+            daemon=True
+        )
+        self._consumer_thread.start()
         self.ws_handler.start()
         time.sleep(2)  # Wait for connection
         
@@ -185,8 +252,18 @@ class TradingBot:
                 "Bot shutdown"
             )
         
-        # Stop WebSocket
+        # Stop WebSocket and tick consumer
         self.ws_handler.stop()
+        self._enqueue_tick(None)
+        if self._consumer_thread and self._consumer_thread.is_alive():
+            self._consumer_thread.join(timeout=5)
+        
+        self.exchange.close()
+        
+        # Let queued notifications and trade reports finish first
+        if self._io_pool:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
         
         # Generate final report
         self.reporter.generate_final_report(self.stats, self.position)
@@ -197,15 +274,58 @@ class TradingBot:
         self.logger.info("✓ Bot stopped successfully")
         self.logger.info("=" * 60)
     
+    def reload_config(self) -> bool:
+        """
+        Reload RSI thresholds from the environment without restarting.
+        While the tick consumer runs, the new settings are applied on its
+        thread, between ticks.
+        
+        Returns:
+            True if the new configuration was accepted
+        """
+        is_valid, error = self.config.reload()
+        if not is_valid:
+            self.logger.error("❌ Config reload rejected: %s", error)
+            return False
+        
+        if self._consumer_thread and self._consumer_thread.is_alive():
+            self._enqueue_tick(_RELOAD_TICK)
+        else:
+            self._apply_rsi_config()
+        return True
+    
+    def _apply_rsi_config(self):
+        """Apply reloaded RSI settings to the history, RSI state and strategy"""
+        trading = self.config.trading
+        needed = trading.RSI_PERIOD * RSI_LOOKBACK_FACTOR
+        
+        if needed > self.closes.capacity:
+            # Keep the current closes, then top up the longer history from REST
+            grown = RingBuffer(needed)
+            grown.load(self.closes.view())
+            self.closes = grown
+            self._initialize_market_data()
+        elif self.rsi.period != trading.RSI_PERIOD:
+            self._seed_rsi()
+        
+        self.strategy.rsi_period = trading.RSI_PERIOD
+        self.strategy.rsi_overbought = trading.RSI_OVERBOUGHT
+        self.strategy.rsi_oversold = trading.RSI_OVERSOLD
+        
+        self.logger.info(
+            "🔄 Config reloaded: RSI Period=%s, Overbought=%s, Oversold=%s",
+            trading.RSI_PERIOD, trading.RSI_OVERBOUGHT, trading.RSI_OVERSOLD
+        )
+    
     def _initialize_market_data(self):
         """Initialize historical market data"""
         self.logger.info("📊 Loading historical data...")
         
-        # Get last 500 candles for RSI calculation
+        # Get last candles for RSI calculation
         klines = self.exchange.get_klines(
             symbol=self.symbol,
             interval='1m',
-            limit=500
+            limit=self.closes.capacity
         )
         
         if not klines:
@@ -213,23 +333,93 @@ class TradingBot:
             return
         
         # Extract closing prices
-        self.closes = [kline['close'] for kline in klines]
-        self.current_price = self.closes[-1]
+        self.closes.load(np.fromiter(
+            (kline.close for kline in klines), dtype=np.float64, count=len(klines)
+        ))
+        self.current_price = self.closes.last()
+        self._candle_open_time = klines[-1].open_time
         
         # Calculate initial RSI
-        self.current_rsi = self.indicators.calculate_rsi(
-            self.closes,
-            self.config.trading.RSI_PERIOD
-        )
+        self._seed_rsi()
         
-        self.logger.info(f"✓ Loaded {len(self.closes)} candles")
-        self.logger.info(f"Current Price: {format_currency(self.current_price)}")
+        self.logger.info("✓ Loaded %s candles", len(self.closes))
+        self.logger.info("Current Price: %s", format_currency(self.current_price))
         if self.current_rsi:
-            self.logger.info(f"Current RSI: {self.current_rsi:.2f}")
+            self.logger.info("Current RSI: %.2f", self.current_rsi)
+    
+    def _warm_up_jit(self):
+        """Compile the numba kernels now so the first tick and trade do not pay for it"""
+        if not NUMBA_AVAILABLE:
+            return
+        
+        started = time.perf_counter()
+        TechnicalIndicators.calculate_rsi(self.closes.view(), self.rsi.period)
+        # Same argument types as _execute_buy, so the compiled signature is reused
+        self.risk_manager.calculate_position_size(
+            current_balance=self.current_balance,
+            entry_price=self.closes.last() if len(self.closes) else 1.0,
+            stop_loss_price=None,
+            leverage=self.leverage
+        )
+        self.logger.debug("JIT warm-up took %.2fs", time.perf_counter() - started)
+    
+    def _seed_rsi(self):
+        """
+        Rebuild the incremental RSI from the close history (last close is in progress).
+        Runs before the tick consumer starts or on its thread (see reload_config).
+        """
+        self.rsi = IncrementalRSI(self.config.trading.RSI_PERIOD)
+        closes = self.closes.view()
+        self.rsi.seed(closes[:-1])
+        self.current_rsi = self.rsi.peek(closes[-1]) if len(closes) else None
     
     def _on_market_data(self, candle_data: dict):
         """
-        Process incoming market data from WebSocket
+        Queue incoming market data from WebSocket (runs on the reader thread)
+        
+        Args:
+            candle_data: Candle data from WebSocket
+        """
+        if self.is_running:
+            self._enqueue_tick(candle_data)
+    
+    def _enqueue_tick(self, candle_data: Optional[dict]):
+        """Queue a tick, dropping the oldest in-progress tick when the queue is full"""
+        try:
+            self._tick_q.put_nowait(candle_data)
+            return
+        except queue.Full:
+            pass
+        
+        with self._tick_q.mutex:
+            pending = self._tick_q.queue
+            # Closed-candle ticks are kept: they commit the candle history
+            for i, tick in enumerate(pending):
+                if isinstance(tick, dict) and not tick['is_closed']:
+                    del pending[i]
+                    break
+            else:
+                pending.popleft()
+            pending.append(candle_data)
+            self._tick_q.not_empty.notify()
+    
+    def _consume_loop(self):
+        """Process queued ticks (and config reloads) until the stop sentinel (None) arrives"""
+        while True:
+            candle_data = self._tick_q.get()
+            if candle_data is None:
+                return
+            try:
+                if candle_data is _RELOAD_TICK:
+                    self._apply_rsi_config()
+                    continue
+                self._process_market_data(candle_data)
+            except Exception as e:
+                self.logger.error("❌ Error processing market data: %s", e)
+    
+    def _process_market_data(self, candle_data: dict):
+        """
+        Update prices and indicators from one tick and run the trading logic
         
         Args:
             candle_data: Candle data from WebSocket
@@ -237,87 +427,137 @@ class TradingBot:
         if not self.is_running:
             return
         
+        # Hot path: bind per-tick state to locals
+        closes = self.closes
+        rsi = self.rsi
+        
         # Update current price
-        self.current_price = candle_data['close']
+        price = self.current_price = candle_data['close']
         is_closed = candle_data['is_closed']
         
-        # Update closes array
-        if self.last_candle_closed:
-            # New candle started
-            self.closes.append(self.current_price)
+        # Update closes array: a new kline open time starts a new slot
+        open_time = candle_data['open_time']
+        if open_time == self._candle_open_time or self._candle_open_time is None:
+            # Update current candle (or take the first slot without history)
+            closes.set_last(price)
         else:
-            # Update current candle
-            self.closes[-1] = self.current_price
-        
-        self.last_candle_closed = is_closed
+            # New candle started: commit the previous close to the RSI state
+            rsi.update(closes.last())
+            closes.append(price)
+        self._candle_open_time = open_time
+        
+        # While flat, an in-progress tick that barely moves the price cannot
+        # change the signal; closed candles and open positions are always evaluated
+        last_price = self._last_processed_price
+        if not is_closed and self.position is None and \
+                abs(price - last_price) < last_price * MIN_PRICE_CHANGE:
+            return
+        self._last_processed_price = price
         
         # Calculate RSI
-        if len(self.closes) > self.config.trading.RSI_PERIOD:
-            self.current_rsi = self.indicators.calculate_rsi(
-                self.closes,
-                self.config.trading.RSI_PERIOD
-            )
+        if len(closes) > rsi.period:
+            current_rsi = self.current_rsi = rsi.peek(price)
             
-            if self.current_rsi is None:
+            if current_rsi is None:
                 return
             
             # Update strategy extremes
-            self.strategy.update_price_extremes(self.current_price, self.current_rsi)
+            self.strategy.update_price_extremes(price, current_rsi)
             
-            # Process trading logic
-            self._process_trading_logic()
+            # Process trading logic (closed candles always, bursts coalesced)
+            now = time.monotonic()
+            if is_closed or now - self._last_process_ts >= TICK_PROCESS_INTERVAL:
+                self._last_process_ts = now
+                self._tick_fn(datetime.now())
+            else:
+                self._coalesced_ticks += 1
             
             # Log status periodically (every closed candle)
             if is_closed:
+                if self._coalesced_ticks:
+                    self.logger.debug("Burst coalesced %d ticks", self._coalesced_ticks)
+                    self._coalesced_ticks = 0
                 self._log_status()
     
-    def _process_trading_logic(self):
-        """Process trading logic based on current market conditions"""
-        if self.position:
-            # Check for sell/cover signal
-            should_sell, reason, result_type = self.strategy.should_sell(
-                position=self.position,
-                current_price=self.current_price,
-                current_rsi=self.current_rsi
-            )
-            
-            if should_sell:
-                if self.position.side == PositionSide.LONG:
-                    self._execute_sell(self.position, self.current_price, reason)
-                else:  # SHORT
-                    self._execute_cover(self.position, self.current_price, reason)
-        else:
-            # Check for LONG signal
-            should_buy, reason = self.strategy.should_buy(
-                current_price=self.current_price,
-                current_rsi=self.current_rsi,
-                closes=self.closes,
+    def _set_position(self, position: Optional[Position]):
+        """Set the open position and pick the matching per-tick handler"""
+        self.position = position
+        self._tick_fn = self._tick_in_position if position else self._tick_flat
+    
+    def _tick_in_position(self, now: datetime):
+        """
+        Check the open position for a sell/cover signal
+        
+        Args:
+            now: Wall-clock time of the tick, shared by any orders it triggers
+        """
+        position = self.position
+        price = self.current_price
+        
+        should_sell, reason, result_type = self.strategy.should_sell(
+            position=position,
+            current_price=price,
+            current_rsi=self.current_rsi
+        )
+        
+        if should_sell:
+            if position.side is _LONG:
+                self._execute_sell(position, price, reason, now)
+            else:  # SHORT
+                self._execute_cover(position, price, reason, now)
+    
+    def _tick_flat(self, now: datetime):
+        """
+        Check for LONG (and, in Futures mode, SHORT) entry signals
+        
+        Args:
+            now: Wall-clock time of the tick, shared by any orders it triggers
+        """
+        strategy = self.strategy
+        current_rsi = self.current_rsi
+        price = self.current_price
+        
+        # Neutral RSI with reset oversold/overbought tracking cannot signal
+        if strategy.skip_idle_entry(price, current_rsi, self.is_futures):
+            return
+        
+        # Entry checks only need the RSI lookback, not the full history
+        closes = self.closes.view(self.rsi.period + 1)
+        
+        # Check for LONG signal
+        should_buy, reason = strategy.should_buy(
+            current_price=price,
+            current_rsi=current_rsi,
+            closes=closes,
+            in_position=False
+        )
+        
+        if should_buy:
+            self._execute_buy(price, reason, now)
+        
+        # Check for SHORT signal (only in Futures mode, unless a LONG was just opened)
+        if self.is_futures and self.position is None:
+            should_short, reason = strategy.should_short(
+                current_price=price,
+                current_rsi=current_rsi,
+                closes=closes,
                 in_position=False
             )
             
-            if should_buy:
-                self._execute_buy(self.current_price, reason)
-            
-            # Check for SHORT signal (only in Futures mode)
-            if self.is_futures:
-                should_short, reason = self.strategy.should_short(
-                    current_price=self.current_price,
-                    current_rsi=self.current_rsi,
-                    closes=self.closes,
-                    in_position=False
-                )
-                
-                if should_short:
-                    self._execute_short(self.current_price, reason)
+            if should_short:
+                self._execute_short(price, reason, now)
     
-    def _execute_buy(self, price: float, reason: str):
+    def _execute_buy(self, price: float, reason: str, now: Optional[datetime] = None):
         """
         Execute a buy order with risk management
         
         Args:
             price: Buy price
             reason: Buy reason
+            now: Time of the triggering tick (defaults to the current time)
         """
+        now = now or datetime.now()
+        
         # Calculate position size with risk management
         quantity, sizing_details = self.risk_manager.calculate_position_size(
             current_balance=self.current_balance,
@@ -340,25 +580,26 @@ class TradingBot:
             return
         
         self.logger.info("=" * 60)
-        self.logger.info(f"🟢 BUY SIGNAL: {reason}")
-        self.logger.info(f"Price: {format_currency(price)} | Quantity: {quantity:.6f}")
-        self.logger.info(f"RSI: {self.current_rsi:.2f}")
+        self.logger.info("🟢 BUY SIGNAL: %s", reason)
+        self.logger.info("Price: %s | Quantity: %.6f", format_currency(price), quantity)
+        self.logger.info("RSI: %.2f", self.current_rsi)
         if self.is_futures:
-            self.logger.info(f"Leverage: {self.leverage}x | Position Value: {format_currency(quantity * price * self.leverage)}")
-        self.logger.info(f"Position Sizing: {sizing_details}")
+            self.logger.info("Leverage: %sx | Position Value: %s", self.leverage, format_currency(quantity * price * self.leverage))
+        self.logger.info("Position Sizing: %s", sizing_details)
         self.logger.info(validation_msg)
         
         # Create position
-        self.position = Position(
+        self._set_position(Position(
             symbol=self.symbol,
             quantity=quantity,
             entry_price=price,
-            entry_time=datetime.now(),
+            entry_time=now,
             entry_rsi=self.current_rsi,
             side=PositionSide.LONG,
             current_price=price,
-            current_rsi=self.current_rsi
-        )
+            current_rsi=self.current_rsi,
+            margin=quantity * price / self.leverage
+        ))
         
         # Execute order (simulation or real)
         if not self.is_simulation:
@@ -379,14 +620,13 @@ class TradingBot:
             
             if not order:
                 self.logger.error("❌ Failed to execute buy order")
-                self.position = None
+                self._set_position(None)
                 return
         
         # Update balance (for Futures, this is margin used)
         if self.is_futures:
             # In Futures, we only use margin, not full balance
-            margin_used = (quantity * price) / self.leverage
-            self.current_balance -= margin_used
+            self.current_balance -= self.position.margin
         else:
             # In Spot, we use full balance
             self.current_balance = 0.0
@@ -394,7 +634,8 @@ class TradingBot:
         self.stats.current_balance = self.current_balance
         
         # Send notification
-        self.notifier.send_trade_notification(
+        self._submit_io(
+            self.notifier.send_trade_notification,
             trade_type=TradeType.BUY,
             symbol=self.symbol,
             price=price,
@@ -404,18 +645,23 @@ class TradingBot:
         )
         
         # Add to report
-        self.reporter.log_buy(self.position, reason)
+        self._submit_io(self.reporter.log_buy, self.position, reason)
+        
+        self._status_cache = None
         
         self.logger.info("=" * 60)
     
-    def _execute_short(self, price: float, reason: str):
+    def _execute_short(self, price: float, reason: str, now: Optional[datetime] = None):
         """
         Execute a SHORT order (Futures only)
         
         Args:
             price: Entry price
             reason: Short reason
+            now: Time of the triggering tick (defaults to the current time)
         """
+        now = now or datetime.now()
+        
         if not self.is_futures:
             self.logger.error("❌ SHORT positions only available in Futures mode")
             return
@@ -442,24 +688,25 @@ class TradingBot:
             return
         
         self.logger.info("=" * 60)
-        self.logger.info(f"🔴 SHORT SIGNAL: {reason}")
-        self.logger.info(f"Price: {format_currency(price)} | Quantity: {quantity:.6f}")
-        self.logger.info(f"RSI: {self.current_rsi:.2f}")
-        self.logger.info(f"Leverage: {self.leverage}x | Position Value: {format_currency(quantity * price * self.leverage)}")
-        self.logger.info(f"Position Sizing: {sizing_details}")
+        self.logger.info("🔴 SHORT SIGNAL: %s", reason)
+        self.logger.info("Price: %s | Quantity: %.6f", format_currency(price), quantity)
+        self.logger.info("RSI: %.2f", self.current_rsi)
+        self.logger.info("Leverage: %sx | Position Value: %s", self.leverage, format_currency(quantity * price * self.leverage))
+        self.logger.info("Position Sizing: %s", sizing_details)
         self.logger.info(validation_msg)
         
         # Create SHORT position
-        self.position = Position(
+        self._set_position(Position(
             symbol=self.symbol,
             quantity=quantity,
             entry_price=price,
-            entry_time=datetime.now(),
+            entry_time=now,
             entry_rsi=self.current_rsi,
             side=PositionSide.SHORT,
             current_price=price,
-            current_rsi=self.current_rsi
-        )
+            current_rsi=self.current_rsi,
+            margin=quantity * price / self.leverage
+        ))
         
         # Execute order (simulation or real)
         if not self.is_simulation:
@@ -474,16 +721,16 @@ class TradingBot:
             
                 if not order:
                     self.logger.error("❌ Failed to execute SHORT order")
-                    self.position = None
+                    self._set_position(None)
                     return
         
         # Update balance (margin used)
-        margin_used = (quantity * price) / self.leverage
-        self.current_balance -= margin_used
+        self.current_balance -= self.position.margin
         self.stats.current_balance = self.current_balance
         
         # Send notification
-        self.notifier.send_trade_notification(
+        self._submit_io(
+            self.notifier.send_trade_notification,
             trade_type=TradeType.SELL,  # SHORT is a SELL to open
             symbol=self.symbol,
             price=price,
@@ -493,11 +740,13 @@ class TradingBot:
         )
         
         # Add to report
-        self.reporter.log_buy(self.position, f"SHORT: {reason}")
+        self._submit_io(self.reporter.log_buy, self.position, f"SHORT: {reason}")
+        
+        self._status_cache = None
         
         self.logger.info("=" * 60)
     
-    def _execute_sell(self, position: Position, price: float, reason: str):
+    def _execute_sell(self, position: Position, price: float, reason: str, now: Optional[datetime] = None):
         """
         Execute a sell order with risk validation
         
@@ -505,7 +754,10 @@ class TradingBot:
             position: Current position
             price: Sell price
             reason: Sell reason
+            now: Time of the triggering tick (defaults to the current time)
         """
+        now = now or datetime.now()
+        
         # Validate position close
         is_valid, validation_msg = self.risk_manager.validate_position_close(
             position=position,
@@ -514,40 +766,39 @@ class TradingBot:
         )
         
         if not is_valid:
-            self.logger.error(f"❌ Position close blocked: {validation_msg}")
+            self.logger.error("❌ Position close blocked: %s", validation_msg)
             return
         
         # Calculate P&L
         if self.is_futures:
             # For Futures, P&L is calculated with leverage
-            entry_value = position.quantity * position.entry_price
             exit_value = position.quantity * price
-            profit_loss = exit_value - entry_value
+            profit_loss = exit_value - position.entry_notional
         else:
             # For Spot, standard calculation
             sell_value = position.quantity * price
-            profit_loss = sell_value - (position.quantity * position.entry_price)
+            profit_loss = sell_value - position.entry_notional
         
-        profit_loss_pct = (profit_loss / (position.quantity * position.entry_price)) * 100
+        profit_loss_pct = (profit_loss / position.entry_notional) * 100
         
         # Determine result
         result = TradeResult.WIN if profit_loss >= 0 else TradeResult.LOSS
         
-        time_held = (datetime.now() - position.entry_time).total_seconds() / 60
+        time_held = position.held_seconds() / 60
         
         self.logger.info("=" * 60)
         
         if result == TradeResult.WIN:
-            self.logger.info(f"🟢 SELL SIGNAL (WIN): {reason}")
+            self.logger.info("🟢 SELL SIGNAL (WIN): %s", reason)
         else:
-            self.logger.warning(f"🔴 SELL SIGNAL (LOSS): {reason}")
+            self.logger.warning("🔴 SELL SIGNAL (LOSS): %s", reason)
         
-        self.logger.info(f"Entry: {format_currency(position.entry_price)} | Exit: {format_currency(price)}")
-        self.logger.info(f"P&L: {format_currency(profit_loss)} ({format_percentage(profit_loss_pct)})")
-        self.logger.info(f"Time Held: {time_held:.1f} minutes")
-        self.logger.info(f"RSI: {self.current_rsi:.2f}")
+        self.logger.info("Entry: %s | Exit: %s", format_currency(position.entry_price), format_currency(price))
+        self.logger.info("P&L: %s (%s)", format_currency(profit_loss), format_percentage(profit_loss_pct))
+        self.logger.info("Time Held: %.1f minutes", time_held)
+        self.logger.info("RSI: %.2f", self.current_rsi)
         if self.is_futures:
-            self.logger.info(f"Leverage: {self.leverage}x")
+            self.logger.info("Leverage: %sx", self.leverage)
         
         # Execute order (simulation or real)
         if not self.is_simulation:
@@ -573,8 +824,7 @@ class TradingBot:
         # Update balance
         if self.is_futures:
             # For Futures, return margin and add P&L
-            margin_used = (position.quantity * position.entry_price) / self.leverage
-            self.current_balance += margin_used + profit_loss
+            self.current_balance += position.margin + profit_loss
         else:
             # For Spot, receive sell value
             sell_value = position.quantity * price
@@ -587,12 +837,12 @@ class TradingBot:
         
         # Create trade record
         trade = Trade(
-            id=str(uuid.uuid4()),
+            id=self._next_trade_id(),
             symbol=self.symbol,
             trade_type=TradeType.SELL,
             quantity=position.quantity,
             price=price,
-            timestamp=datetime.now(),
+            timestamp=now,
             rsi_value=self.current_rsi,
             is_simulation=self.is_simulation,
             buy_price=position.entry_price,
@@ -607,7 +857,8 @@ class TradingBot:
         self.stats.update(trade)
         
         # Send notification
-        self.notifier.send_trade_notification(
+        self._submit_io(
+            self.notifier.send_trade_notification,
             trade_type=TradeType.SELL,
             symbol=self.symbol,
             price=price,
@@ -619,17 +870,19 @@ class TradingBot:
         )
         
         # Add to report
-        self.reporter.log_sell(position, price, profit_loss, profit_loss_pct, reason, result)
+        self._submit_io(self.reporter.log_sell, position, price, profit_loss, profit_loss_pct, reason, result)
         
         # Clear position
-        self.position = None
+        self._set_position(None)
         
         # Reset strategy flags
         self.strategy.reset_extremes()
         
+        self._status_cache = None
+        
         self.logger.info("=" * 60)
     
-    def _execute_cover(self, position: Position, price: float, reason: str):
+    def _execute_cover(self, position: Position, price: float, reason: str, now: Optional[datetime] = None):
         """
         Execute a COVER order to close SHORT position (Futures only)
         
@@ -637,7 +890,10 @@ class TradingBot:
             position: Current SHORT position
             price: Cover price
             reason: Cover reason
+            now: Time of the triggering tick (defaults to the current time)
         """
+        now = now or datetime.now()
+        
         # Validate position close
         is_valid, validation_msg = self.risk_manager.validate_position_close(
             position=position,
@@ -646,33 +902,32 @@ class TradingBot:
         )
         
         if not is_valid:
-            self.logger.error(f"❌ Position cover blocked: {validation_msg}")
+            self.logger.error("❌ Position cover blocked: %s", validation_msg)
             return
         
         # Calculate P&L for SHORT (profit when price goes DOWN)
-        entry_value = position.quantity * position.entry_price
         exit_value = position.quantity * price
-        profit_loss = entry_value - exit_value  # INVERSE for SHORT
+        profit_loss = position.entry_notional - exit_value  # INVERSE for SHORT
         
-        profit_loss_pct = (profit_loss / (position.quantity * position.entry_price)) * 100
+        profit_loss_pct = (profit_loss / position.entry_notional) * 100
         
         # Determine result
         result = TradeResult.WIN if profit_loss >= 0 else TradeResult.LOSS
         
-        time_held = (datetime.now() - position.entry_time).total_seconds() / 60
+        time_held = position.held_seconds() / 60
         
         self.logger.info("=" * 60)
         
         if result == TradeResult.WIN:
-            self.logger.info(f"🟢 COVER (WIN): {reason}")
+            self.logger.info("🟢 COVER (WIN): %s", reason)
         else:
-            self.logger.warning(f"🔴 COVER (LOSS): {reason}")
+            self.logger.warning("🔴 COVER (LOSS): %s", reason)
         
-        self.logger.info(f"Entry: {format_currency(position.entry_price)} | Cover: {format_currency(price)}")
-        self.logger.info(f"P&L: {format_currency(profit_loss)} ({format_percentage(profit_loss_pct)})")
-        self.logger.info(f"Time Held: {time_held:.1f} minutes")
-        self.logger.info(f"RSI: {self.current_rsi:.2f}")
-        self.logger.info(f"Leverage: {self.leverage}x")
+        self.logger.info("Entry: %s | Cover: %s", format_currency(position.entry_price), format_currency(price))
+        self.logger.info("P&L: %s (%s)", format_currency(profit_loss), format_percentage(profit_loss_pct))
+        self.logger.info("Time Held: %.1f minutes", time_held)
+        self.logger.info("RSI: %.2f", self.current_rsi)
+        self.logger.info("Leverage: %sx", self.leverage)
         
         # Execute order (simulation or real)
         if not self.is_simulation:
@@ -691,8 +946,7 @@ class TradingBot:
                     return
         
         # Update balance (return margin and add P&L)
-        margin_used = (position.quantity * position.entry_price) / self.leverage
-        self.current_balance += margin_used + profit_loss
+        self.current_balance += position.margin + profit_loss
         self.stats.current_balance = self.current_balance
         
         # Log risk status after trade
@@ -700,12 +954,12 @@ class TradingBot:
         
         # Create trade record
         trade = Trade(
-            id=str(uuid.uuid4()),
+            id=self._next_trade_id(),
             symbol=self.symbol,
             trade_type=TradeType.BUY,  # COVER is a BUY to close
             quantity=position.quantity,
             price=price,
-            timestamp=datetime.now(),
+            timestamp=now,
             rsi_value=self.current_rsi,
             is_simulation=self.is_simulation,
             buy_price=position.entry_price,
@@ -720,7 +974,8 @@ class TradingBot:
         self.stats.update(trade)
         
         # Send notification
-        self.notifier.send_trade_notification(
+        self._submit_io(
+            self.notifier.send_trade_notification,
             trade_type=TradeType.BUY,  # COVER
             symbol=self.symbol,
             price=price,
@@ -732,25 +987,48 @@ class TradingBot:
         )
         
         # Add to report
-        self.reporter.log_sell(position, price, profit_loss, profit_loss_pct, f"COVER: {reason}", result)
+        self._submit_io(self.reporter.log_sell, position, price, profit_loss, profit_loss_pct, f"COVER: {reason}", result)
         
         # Clear position
-        self.position = None
+        self._set_position(None)
         
         # Reset strategy flags
         self.strategy.reset_extremes()
         
+        self._status_cache = None
+        
         self.logger.info("=" * 60)
     
+    def _next_trade_id(self) -> str:
+        """Trade ID unique across runs without a uuid4 call per trade"""
+        return f"{self._trade_id_prefix}-{next(self._trade_seq)}"
+    
+    def _submit_io(self, fn, *args, **kwargs) -> Future:
+        """Run a notification/report call on the background I/O worker"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bot-io')
+        future = self._io_pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._log_io_error)
+        return future
+    
+    def _log_io_error(self, future: Future):
+        """Log failures of background notification/report calls"""
+        error = future.exception()
+        if error:
+            self.logger.error("❌ Background notification/report failed: %s", error)
+    
     def _log_status(self):
         """Log current bot status"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         status_msg = self.strategy.get_status_message(self.position, self.current_rsi)
         
         balance_info = f"💰 Balance: {format_currency(self.current_balance)}"
         if self.position:
             balance_info += f" (in position: {format_currency(self.position.quantity * self.current_price)})"
         
-        self.logger.info(f"{status_msg} | {balance_info}")
+        self.logger.info("%s | %s", status_msg, balance_info)
     
     def get_status(self) -> dict:
         """
@@ -769,23 +1047,31 @@ class TradingBot:
             'current_rsi': self.current_rsi,
             'current_balance': self.current_balance,
             'position': self.position.to_dict() if self.position else None,
-            'stats': self.stats.to_dict(),
             'strategy_status': self.strategy.get_status_message(self.position, self.current_rsi),
             'oversold_intensity': round(self.strategy.oversold_intensity, 2),
             'oversold_counter': self.strategy.oversold_counter,
             'overbought_intensity': round(self.strategy.overbought_intensity, 2),
-            'overbought_counter': self.strategy.overbought_counter
+            'overbought_counter': self.strategy.overbought_counter,
+            'queue_depth': self._tick_q.qsize()
         }
         
         # Add Futures-specific information
         if self.is_futures:
             status['leverage'] = self.leverage
-            status['margin_type'] = self.config.trading.MARGIN_TYPE
-        
-        # Add risk management status
-        status['risk_status'] = self.risk_manager.get_risk_status(
-            self.current_balance,
-            self.stats
-        )
+            status['margin_type'] = self.margin_type
+        
+        # Stats and risk status only change on trades; reuse them between polls
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is None or now - self._status_cache_ts >= STATUS_CACHE_TTL:
+            cached = self._status_cache = {
+                'stats': self.stats.to_dict(),
+                'risk_status': self.risk_manager.get_risk_status(
+                    self.current_balance,
+                    self.stats
+                ).to_dict()
+            }
+            self._status_cache_ts = now
+        status.update(cached)
         
         return status
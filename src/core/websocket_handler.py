@@ -1,12 +1,75 @@
 """
 WebSocket Handler for Real-Time Market Data
 """
-import json
+import asyncio
 import logging
+import random
+import socket
 import threading
-from typing import Callable, Optional
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import websocket
-from datetime import datetime
+
+from src.models.trading_models import Candle, PositionSnap, Ticker
+from src.utils.helpers import json_loads
+
+try:
+    from picows import WSListener, WSMsgType, ws_connect
+    PICOWS_AVAILABLE = True
+except ImportError:  # picows is optional, fall back to websocket-client
+    PICOWS_AVAILABLE = False
+
+
+# Combined stream endpoints per trading mode
+STREAM_URLS = {
+    'spot': "wss://stream.binance.com:9443/stream?streams=",
+    'futures': "wss://fstream.binance.com/stream?streams="
+}
+
+# Reconnect backoff bounds for the kline stream (s), doubled per failed attempt
+RECONNECT_BACKOFF_MIN = 1.0
+RECONNECT_BACKOFF_MAX = 30.0
+
+# Extra socket options for websocket-client connections (TCP_NODELAY is
+# already a library default); a 1 MiB receive buffer absorbs kline bursts
+WS_SOCKOPT = [(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)]
+
+# Candles kept per (symbol, interval) stream
+STREAM_KLINE_HISTORY = 1000
+
+# Seconds without a message after which the market stream cache is not served
+STREAM_STALE_AFTER = 10.0
+
+# Futures user-data stream endpoint and listen key keepalive interval (s)
+USER_STREAM_URL = "wss://fstream.binance.com/ws/"
+USER_STREAM_KEEPALIVE = 30 * 60
+
+
+if PICOWS_AVAILABLE:
+    class _KlineListener(WSListener):
+        """Forward picows frames to the WebSocketHandler callbacks"""
+        
+        def __init__(self, handler: 'WebSocketHandler'):
+            self.handler = handler
+            self.close_code = None
+            self.close_msg = None
+        
+        def on_ws_connected(self, transport):
+            self.handler.on_open(transport)
+        
+        def on_ws_frame(self, transport, frame):
+            if frame.msg_type == WSMsgType.TEXT:
+                # Raw bytes go straight to the JSON parser, no UTF-8 decode step
+                self.handler.on_message(transport, frame.get_payload_as_bytes())
+            elif frame.msg_type == WSMsgType.CLOSE:
+                self.close_code = frame.get_close_code()
+                self.close_msg = frame.get_close_message()
+                transport.send_close(self.close_code)
+                transport.disconnect()
+        
+        def on_ws_disconnected(self, transport):
+            self.handler.on_close(transport, self.close_code, self.close_msg)
 
 
 class WebSocketHandler:
@@ -14,17 +77,19 @@ class WebSocketHandler:
     Handle Binance WebSocket connections for real-time market data
     """
     
-    def __init__(self, symbol: str, on_message_callback: Callable):
+    def __init__(self, symbol: str, on_message_callback: Callable, closed_only: bool = False):
         """
         Initialize WebSocket handler
         
         Args:
             symbol: Trading symbol (e.g., 'ETHUSDT')
-            on_message_callback: Callback function for messages
+            on_message_callback: Callback receiving {'open_time', 'close', 'is_closed'} per kline message
+            closed_only: Only forward closed candles (drop in-progress updates)
         """
         self.logger = logging.getLogger(__name__)
         self.symbol = symbol.lower()
         self.on_message_callback = on_message_callback
+        self.closed_only = closed_only
         
         # WebSocket URL for kline data (1-minute candles)
         self.socket_url = f"wss://stream.binance.com:9443/ws/{self.symbol}@kline_1m"
@@ -32,6 +97,12 @@ class WebSocketHandler:
         self.ws: Optional[websocket.WebSocketApp] = None
         self.ws_thread: Optional[threading.Thread] = None
         self.is_running = False
+        self._stop_event = threading.Event()
+        self._backoff = RECONNECT_BACKOFF_MIN
+        
+        # picows transport and its event loop (when picows is installed)
+        self._transport = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         self.logger.info(f"✓ WebSocket handler initialized for {symbol}")
     
@@ -39,6 +110,7 @@ class WebSocketHandler:
         """Called when WebSocket connection is opened"""
         self.logger.info(f"📡 WebSocket connection opened for {self.symbol.upper()}")
         self.is_running = True
+        self._backoff = RECONNECT_BACKOFF_MIN
     
     def on_close(self, ws, close_status_code, close_msg):
         """Called when WebSocket connection is closed"""
@@ -58,73 +130,124 @@ class WebSocketHandler:
             message: Raw message string
         """
         try:
-            data = json.loads(message)
+            data = json_loads(message)
             
-            # Extract kline data
-            if 'k' in data:
-                kline = data['k']
+            # Extract kline data (only the fields the trading loop reads)
+            kline = data.get('k')
+            if kline is not None:
+                is_closed = kline['x']  # True when candle is closed
+                if self.closed_only and not is_closed:
+                    return
+                
                 candle_data = {
-                    'symbol': kline['s'],
-                    'timestamp': datetime.fromtimestamp(kline['t'] / 1000),
-                    'open': float(kline['o']),
-                    'high': float(kline['h']),
-                    'low': float(kline['l']),
+                    'open_time': kline['t'],
                     'close': float(kline['c']),
-                    'volume': float(kline['v']),
-                    'is_closed': kline['x']  # True when candle is closed
+                    'is_closed': is_closed
                 }
                 
                 # Call the registered callback
                 self.on_message_callback(candle_data)
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"❌ Failed to parse WebSocket message: {e}")
         except Exception as e:
             self.logger.error(f"❌ Error processing WebSocket message: {e}")
     
     def start(self):
         """Start WebSocket connection in a separate thread"""
-        if self.is_running:
+        if self.ws_thread and self.ws_thread.is_alive():
             self.logger.warning("WebSocket is already running")
             return
         
         self.logger.info(f"🚀 Starting WebSocket connection for {self.symbol.upper()}")
+        self._stop_event.clear()
+        self._backoff = RECONNECT_BACKOFF_MIN
         
-        # Create WebSocket app
-        self.ws = websocket.WebSocketApp(
-            self.socket_url,
-            on_open=self.on_open,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close
-        )
+        if PICOWS_AVAILABLE:
+            target = self._run_picows
+        else:
+            # Create WebSocket app
+            self.ws = websocket.WebSocketApp(
+                self.socket_url,
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close
+            )
+            target = self._run_websocket
         
         # Run WebSocket in a separate thread
         self.ws_thread = threading.Thread(
-            target=self._run_websocket,
+            target=target,
             daemon=True
         )
         self.ws_thread.start()
     
     def _run_websocket(self):
-        """Run WebSocket connection (called in separate thread)"""
-        try:
-            self.ws.run_forever()
-        except Exception as e:
-            self.logger.error(f"❌ WebSocket thread error: {e}")
+        """Run WebSocket connection and reconnect until stopped (called in separate thread)"""
+        while not self._stop_event.is_set():
+            try:
+                self.ws.run_forever(
+                    sockopt=WS_SOCKOPT,
+                    skip_utf8_validation=True,
+                    ping_interval=20,
+                    ping_timeout=10
+                )
+            except Exception as e:
+                self.logger.error(f"❌ WebSocket thread error: {e}")
+            self.is_running = False
+            self._wait_before_reconnect()
+    
+    def _run_picows(self):
+        """Run the picows client and reconnect until stopped (called in separate thread)"""
+        while not self._stop_event.is_set():
+            try:
+                asyncio.run(self._picows_main())
+            except Exception as e:
+                self.on_error(self._transport, e)
+            finally:
+                self._transport = None
+                self._loop = None
             self.is_running = False
+            self._wait_before_reconnect()
+    
+    def _wait_before_reconnect(self):
+        """Sleep with exponential backoff and jitter, returning early on stop()"""
+        if self._stop_event.is_set():
+            return
+        
+        delay = self._backoff * random.uniform(0.5, 1.0)
+        self.logger.warning(f"🔄 Reconnecting WebSocket in {delay:.1f}s")
+        self._backoff = min(self._backoff * 2, RECONNECT_BACKOFF_MAX)
+        self._stop_event.wait(delay)
+    
+    async def _picows_main(self):
+        """Connect with picows and wait until the stream disconnects"""
+        self._loop = asyncio.get_running_loop()
+        self._transport, _ = await ws_connect(
+            lambda: _KlineListener(self),
+            self.socket_url
+        )
+        if self._stop_event.is_set():
+            # stop() ran while the handshake was in flight
+            self._transport.disconnect()
+        await self._transport.wait_disconnected()
     
     def stop(self):
         """Stop WebSocket connection"""
-        if not self.is_running:
+        if not (self.ws_thread and self.ws_thread.is_alive()):
             self.logger.warning("WebSocket is not running")
             return
         
         self.logger.info(f"🛑 Stopping WebSocket connection for {self.symbol.upper()}")
+        self._stop_event.set()
         
         if self.ws:
             self.ws.close()
         
+        if self._transport is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._transport.disconnect)
+        
         if self.ws_thread and self.ws_thread.is_alive():
             self.ws_thread.join(timeout=5)
         
@@ -134,3 +257,496 @@ class WebSocketHandler:
     def is_connected(self) -> bool:
         """Check if WebSocket is connected"""
         return self.is_running
+
+
+class MarketDataStream:
+    """
+    Combined Binance kline/ticker stream that keeps a local cache of the
+    latest candles and 24hr tickers, so REST polling can be skipped once
+    a subscription is live.
+    """
+    
+    def __init__(
+        self,
+        trading_mode: str = "spot",
+        history: Optional[Callable[[str, str], List[Candle]]] = None
+    ):
+        """
+        Initialize market data stream
+        
+        Args:
+            trading_mode: "spot" or "futures"
+            history: Returns REST klines for (symbol, interval); used to reseed
+                the kline cache after a reconnect
+        """
+        self.logger = logging.getLogger(__name__)
+        self.base_url = STREAM_URLS[trading_mode]
+        self.history = history
+        
+        self._streams: List[str] = []
+        self._callbacks: Dict[str, List[Callable]] = {}
+        self._klines: Dict[Tuple[str, str], Deque[Candle]] = {}
+        self._tickers: Dict[str, Ticker] = {}
+        self._lock = threading.Lock()
+        
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.ws_thread: Optional[threading.Thread] = None
+        self.is_running = False
+        self.connected = False
+        self._has_connected = False
+        self._last_message = 0.0  # time.monotonic() of the last message
+    
+    # ==================== SUBSCRIPTIONS ====================
+    
+    def subscribe_kline(
+        self,
+        symbol: str,
+        interval: str,
+        callback: Optional[Callable] = None,
+        history: Optional[List[Candle]] = None
+    ):
+        """
+        Subscribe to a kline stream
+        
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT')
+            interval: Kline interval (e.g., '1m')
+            callback: Optional callback receiving each Candle
+            history: Optional klines to seed the cache with
+        """
+        key = (symbol.upper(), interval)
+        with self._lock:
+            if key not in self._klines:
+                self._klines[key] = deque(history or [], maxlen=STREAM_KLINE_HISTORY)
+        self._add_stream(f"{symbol.lower()}@kline_{interval}", callback)
+    
+    def subscribe_ticker(self, symbol: str, callback: Optional[Callable] = None):
+        """
+        Subscribe to a 24hr ticker stream
+        
+        Args:
+            symbol: Trading symbol (e.g., 'ETHUSDT')
+            callback: Optional callback receiving each Ticker
+        """
+        self._add_stream(f"{symbol.lower()}@ticker", callback)
+    
+    def _add_stream(self, stream: str, callback: Optional[Callable]):
+        """Register a stream and reconnect so the combined URL includes it"""
+        with self._lock:
+            if callback:
+                self._callbacks.setdefault(stream, []).append(callback)
+            if stream in self._streams:
+                return
+            self._streams.append(stream)
+        
+        if not self.is_running:
+            self.start()
+        elif self.ws:
+            # The run loop reconnects with the new stream list
+            self.ws.close()
+    
+    # ==================== CACHE ACCESS ====================
+    
+    def is_live(self) -> bool:
+        """Whether the stream is connected and has delivered a message recently"""
+        return self.connected and time.monotonic() - self._last_message < STREAM_STALE_AFTER
+    
+    def get_klines(self, symbol: str, interval: str, limit: int) -> Optional[List[Candle]]:
+        """
+        Get cached klines for a subscribed stream
+        
+        Returns:
+            Newest `limit` klines, or None if fewer are cached or the stream
+            is down or stale
+        """
+        if not self.is_live():
+            return None
+        with self._lock:
+            candles = self._klines.get((symbol.upper(), interval))
+            if candles is None or len(candles) < limit:
+                return None
+            return list(candles)[-limit:]
+    
+    def get_ticker(self, symbol: str) -> Optional[Ticker]:
+        """Get the cached 24hr ticker for a subscribed symbol (None while down or stale)"""
+        if not self.is_live():
+            return None
+        return self._tickers.get(symbol.upper())
+    
+    # ==================== MESSAGE HANDLING ====================
+    
+    def on_message(self, ws, message):
+        """
+        Update the cache from a combined stream message
+        
+        Args:
+            ws: WebSocket instance
+            message: Raw message string
+        """
+        self._last_message = time.monotonic()
+        try:
+            envelope = json_loads(message)
+            data = envelope['data']
+            event = data.get('e')
+            
+            if event == 'kline':
+                item = self._update_kline(data['k'])
+            elif event == '24hrTicker':
+                item = self._update_ticker(data)
+            else:
+                return
+            
+            for callback in self._callbacks.get(envelope['stream'], ()):
+                callback(item)
+        except (ValueError, KeyError) as e:
+            self.logger.error("❌ Failed to parse stream message: %s", e)
+        except Exception as e:
+            self.logger.error("❌ Error processing stream message: %s", e)
+    
+    def _update_kline(self, k: Dict) -> Candle:
+        """Insert or replace the streamed candle in the kline cache"""
+        kline = Candle(
+            k['t'],
+            float(k['o']),
+            float(k['h']),
+            float(k['l']),
+            float(k['c']),
+            float(k['v']),
+            k['T']
+        )
+        
+        with self._lock:
+            candles = self._klines.setdefault(
+                (k['s'], k['i']), deque(maxlen=STREAM_KLINE_HISTORY)
+            )
+            if candles and candles[-1].open_time == kline.open_time:
+                candles[-1] = kline
+            elif not candles or candles[-1].open_time < kline.open_time:
+                if candles and kline.open_time != candles[-1].close_time + 1:
+                    # Missed candles: restart the cache so reads fall back to REST
+                    candles.clear()
+                candles.append(kline)
+        return kline
+    
+    def _update_ticker(self, data: Dict) -> Ticker:
+        """Store the streamed 24hr ticker"""
+        ticker = Ticker(
+            data['s'],
+            float(data['c']),
+            float(data['h']),
+            float(data['l']),
+            float(data['v']),
+            float(data['p']),
+            float(data['P'])
+        )
+        self._tickers[data['s']] = ticker
+        return ticker
+    
+    def on_open(self, ws):
+        """Called when the stream connects; reseeds the kline cache after a reconnect"""
+        if self._has_connected and self.history is not None:
+            with self._lock:
+                keys = list(self._klines)
+            for symbol, interval in keys:
+                try:
+                    candles = self.history(symbol, interval)
+                except Exception as e:
+                    self.logger.warning("⚠️ Could not reseed %s %s klines: %s", symbol, interval, e)
+                    candles = []
+                with self._lock:
+                    self._klines[(symbol, interval)] = deque(candles, maxlen=STREAM_KLINE_HISTORY)
+        
+        self._has_connected = True
+        self._last_message = time.monotonic()
+        self.connected = True
+    
+    def on_close(self, ws, close_status_code, close_msg):
+        """Called when the stream closes"""
+        self.connected = False
+    
+    def on_error(self, ws, error):
+        """Called when the stream encounters an error"""
+        self.logger.error("❌ Market stream error: %s", error)
+    
+    # ==================== CONNECTION ====================
+    
+    def start(self):
+        """Start the stream connection loop in a separate thread"""
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        self.ws_thread = threading.Thread(
+            target=self._run_websocket,
+            name="market-stream",
+            daemon=True
+        )
+        self.ws_thread.start()
+    
+    def _run_websocket(self):
+        """Connect to the combined stream and reconnect until stopped"""
+        while self.is_running:
+            with self._lock:
+                url = self.base_url + "/".join(self._streams)
+            
+            self.logger.info("📡 Connecting market stream: %s", url)
+            self.ws = websocket.WebSocketApp(
+                url,
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close
+            )
+            try:
+                self.ws.run_forever(sockopt=WS_SOCKOPT, skip_utf8_validation=True)
+            except Exception as e:
+                self.logger.error("❌ Market stream thread error: %s", e)
+            
+            self.connected = False
+            if self.is_running:
+                time.sleep(1)
+    
+    def stop(self):
+        """Stop the stream connection"""
+        self.is_running = False
+        if self.ws:
+            self.ws.close()
+        if self.ws_thread and self.ws_thread.is_alive():
+            self.ws_thread.join(timeout=5)
+        self.logger.info("✓ Market stream stopped")
+
+
+class UserStreamManager:
+    """
+    Binance Futures user-data stream. Keeps open positions and wallet
+    balances current from ACCOUNT_UPDATE events, so they can be read
+    without signed REST polling while the stream is connected.
+    """
+    
+    def __init__(
+        self,
+        client,
+        snapshot: Optional[Callable[[], Tuple[Dict, Dict]]] = None,
+        default_leverage: int = 1
+    ):
+        """
+        Initialize user-data stream
+        
+        Args:
+            client: Initialized python-binance client (listen key management)
+            snapshot: Returns (positions keyed by (symbol, position side),
+                balances keyed by asset) from REST; called on every (re)connect
+            default_leverage: Leverage assumed for positions opened on the stream
+        """
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.listen_key: Optional[str] = None
+        self.default_leverage = default_leverage
+        self.snapshot = snapshot
+        
+        self._positions: Dict[Tuple[str, str], PositionSnap] = {}
+        self._balances: Dict[str, Dict] = {}
+        self._leverage: Dict[str, int] = {}
+        self._callbacks: Dict[str, List[Callable]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.ws_thread: Optional[threading.Thread] = None
+        self.keepalive_thread: Optional[threading.Thread] = None
+        self.is_running = False
+        self.connected = False
+    
+    def on(self, event: str, callback: Callable):
+        """
+        Register a callback for a user-data event
+        
+        Args:
+            event: Event type (e.g., 'ACCOUNT_UPDATE', 'ORDER_TRADE_UPDATE')
+            callback: Callback receiving the raw event data
+        """
+        self._callbacks.setdefault(event, []).append(callback)
+    
+    # ==================== SNAPSHOT ACCESS ====================
+    
+    def get_position(self, symbol: str, position_side: Optional[str] = None) -> Optional[PositionSnap]:
+        """
+        Get the streamed open position for a symbol
+        
+        Args:
+            symbol: Trading symbol
+            position_side: 'BOTH', 'LONG' or 'SHORT' (None = first open leg)
+        """
+        if position_side is not None:
+            return self._positions.get((symbol, position_side))
+        for (pos_symbol, _), position in list(self._positions.items()):
+            if pos_symbol == symbol:
+                return position
+        return None
+    
+    def get_balance(self, asset: str) -> Optional[Dict]:
+        """Get the streamed wallet balance for an asset"""
+        return self._balances.get(asset)
+    
+    # ==================== MESSAGE HANDLING ====================
+    
+    def on_message(self, ws, message):
+        """
+        Apply a user-data event to the snapshot
+        
+        Args:
+            ws: WebSocket instance
+            message: Raw message string
+        """
+        try:
+            data = json_loads(message)
+            event = data.get('e')
+            
+            if event == 'ACCOUNT_UPDATE':
+                self._apply_account_update(data['a'])
+            elif event == 'ACCOUNT_CONFIG_UPDATE' and 'ac' in data:
+                self._leverage[data['ac']['s']] = int(data['ac']['l'])
+            elif event == 'listenKeyExpired':
+                self.logger.warning("⚠️ Listen key expired, reconnecting user stream")
+                self.listen_key = None
+                ws.close()
+            
+            for callback in self._callbacks.get(event, ()):
+                callback(data)
+        except (ValueError, KeyError) as e:
+            self.logger.error("❌ Failed to parse user stream message: %s", e)
+        except Exception as e:
+            self.logger.error("❌ Error processing user stream message: %s", e)
+    
+    def _apply_account_update(self, update: Dict):
+        """Merge balance and position deltas from an ACCOUNT_UPDATE event"""
+        with self._lock:
+            for b in update.get('B', ()):
+                self._balances[b['a']] = {
+                    'wallet_balance': float(b['wb']),
+                    'cross_wallet_balance': float(b['cw'])
+                }
+            
+            for p in update.get('P', ()):
+                symbol = p['s']
+                # Keyed by side so hedge-mode LONG and SHORT legs coexist
+                key = (symbol, p['ps'])
+                previous = self._positions.get(key)
+                position_amt = float(p['pa'])
+                
+                if position_amt == 0:
+                    self._positions.pop(key, None)
+                    continue
+                
+                # Leverage and liquidation price are not part of the event
+                if previous:
+                    leverage = previous.leverage
+                else:
+                    leverage = self._leverage.get(symbol, self.default_leverage)
+                self._positions[key] = PositionSnap(
+                    symbol,
+                    position_amt,
+                    float(p['ep']),
+                    float(p['up']),
+                    leverage,
+                    p['ps']
+                )
+    
+    def on_open(self, ws):
+        """Called when the stream connects; resyncs the snapshot before serving reads"""
+        if self.snapshot is not None:
+            # Events missed while disconnected are lost, so start from REST
+            try:
+                positions, balances = self.snapshot()
+            except Exception as e:
+                self.logger.error("❌ User stream resync failed, reconnecting: %s", e)
+                ws.close()
+                return
+            with self._lock:
+                self._positions = positions
+                self._balances = balances
+        
+        self.connected = True
+        self.logger.info("✓ User data stream connected")
+    
+    def on_error(self, ws, error):
+        """Called when the stream encounters an error"""
+        self.logger.error("❌ User stream error: %s", error)
+    
+    def on_close(self, ws, close_status_code, close_msg):
+        """Called when the stream closes"""
+        self.connected = False
+    
+    # ==================== CONNECTION ====================
+    
+    def start(self):
+        """Start the stream and listen key keepalive threads"""
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        self._stop_event.clear()
+        self.ws_thread = threading.Thread(
+            target=self._run_websocket,
+            name="user-stream",
+            daemon=True
+        )
+        self.keepalive_thread = threading.Thread(
+            target=self._run_keepalive,
+            name="user-stream-keepalive",
+            daemon=True
+        )
+        self.ws_thread.start()
+        self.keepalive_thread.start()
+    
+    def _run_websocket(self):
+        """Connect with a listen key and reconnect until stopped"""
+        while self.is_running:
+            try:
+                if self.listen_key is None:
+                    self.listen_key = self.client.futures_stream_get_listen_key()
+                
+                self.logger.info("📡 Connecting user data stream")
+                self.ws = websocket.WebSocketApp(
+                    USER_STREAM_URL + self.listen_key,
+                    on_open=self.on_open,
+                    on_message=self.on_message,
+                    on_error=self.on_error,
+                    on_close=self.on_close
+                )
+                self.ws.run_forever(sockopt=WS_SOCKOPT, skip_utf8_validation=True)
+            except Exception as e:
+                self.logger.error("❌ User stream thread error: %s", e)
+            
+            self.connected = False
+            if self.is_running:
+                time.sleep(1)
+    
+    def _run_keepalive(self):
+        """Extend the listen key validity until stopped"""
+        while not self._stop_event.wait(USER_STREAM_KEEPALIVE):
+            if not self.listen_key:
+                continue
+            try:
+                self.client.futures_stream_keepalive(listenKey=self.listen_key)
+            except Exception as e:
+                self.logger.error("❌ Failed to keep listen key alive: %s", e)
+    
+    def stop(self):
+        """Stop the stream and release the listen key"""
+        self.is_running = False
+        self._stop_event.set()
+        if self.ws:
+            self.ws.close()
+        if self.ws_thread and self.ws_thread.is_alive():
+            self.ws_thread.join(timeout=5)
+        
+        if self.listen_key:
+            try:
+                self.client.futures_stream_close(listenKey=self.listen_key)
+            except Exception as e:
+                self.logger.error("❌ Failed to close listen key: %s", e)
+            self.listen_key = None
+        
+        self.connected = False
+        self.logger.info("✓ User data stream stopped")
@@ -1,9 +1,57 @@
 """
 Technical indicators calculation
 """
-import pandas as pd
+import math
+from collections import deque
 import numpy as np
-from typing import List, Optional
+from typing import Deque, Optional, Sequence, Tuple
+
+from src.utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _rsi_core(prices: np.ndarray, period: int) -> float:
+    """RSI over the last `period` price changes of a NaN-free price window"""
+    n = prices.shape[0]
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n - period, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        else:
+            loss_sum -= delta
+    
+    if loss_sum == 0 and gain_sum == 0:
+        return 50.0  # RSI neutre si aucun mouvement
+    elif loss_sum == 0:
+        return 100.0  # RSI max si aucune perte
+    elif gain_sum == 0:
+        return 0.0    # RSI min si aucun gain
+    return 100 - (100 / (1 + gain_sum / loss_sum))
+
+
+@njit(cache=True, fastmath=True)
+def _ema_core(prices: np.ndarray, period: int) -> float:
+    """Last EMA value, seeded with the SMA of the first `period` prices"""
+    alpha = 2.0 / (period + 1)
+    ema = prices[:period].mean()
+    for i in range(period, prices.shape[0]):
+        ema += alpha * (prices[i] - ema)
+    return ema
+
+
+@njit(cache=True, fastmath=True)
+def _ema_series_core(prices: np.ndarray, period: int) -> np.ndarray:
+    """EMA at every price from index period - 1 on (NaN before), SMA-seeded"""
+    alpha = 2.0 / (period + 1)
+    out = np.full(prices.shape[0], np.nan)
+    ema = prices[:period].mean()
+    out[period - 1] = ema
+    for i in range(period, prices.shape[0]):
+        ema += alpha * (prices[i] - ema)
+        out[i] = ema
+    return out
 
 
 class TechnicalIndicators:
@@ -11,33 +59,131 @@ class TechnicalIndicators:
     
 
     @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
+    def calculate_rsi(prices: Sequence[float], period: int = 14) -> Optional[float]:
         """
-        Calculate RSI (Relative Strength Index) manually, robust to edge cases
+        Calculate RSI (Relative Strength Index) manually, robust to edge cases.
+        Accepts a list or a numpy array; only the last period + 1 prices matter.
         """
         if len(prices) < period + 1:
             return None
 
-        prices_series = pd.Series(prices, dtype=float)
-        delta = prices_series.diff()
-
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        last_gain = gain.iloc[-1]
-        last_loss = loss.iloc[-1]
-
-        # Cas extrêmes : marché plat ou haussier/baisser extrême
-        if last_loss == 0 and last_gain == 0:
-            return 50.0  # RSI neutre si aucun mouvement
-        elif last_loss == 0:
-            return 100.0  # RSI max si aucune perte
-        elif last_gain == 0:
-            return 0.0    # RSI min si aucun gain
-
-        rs = last_gain / last_loss
-        rsi = 100 - (100 / (1 + rs))
-        return float(rsi) if not pd.isna(rsi) else None
+        # Only the last period + 1 prices contribute to the simple averages
+        window = np.ascontiguousarray(prices[-(period + 1):], dtype=np.float64)
+        if np.isnan(window).any():
+            return None
+        return float(_rsi_core(window, period))
+    
+    @staticmethod
+    def calculate_sma(prices: Sequence[float], period: int = 20) -> Optional[float]:
+        """
+        Calculate the latest Simple Moving Average
+        
+        Args:
+            prices: Closing prices (list or numpy array)
+            period: Number of prices averaged
+            
+        Returns:
+            SMA of the last `period` prices, or None if there are fewer
+        """
+        if len(prices) < period:
+            return None
+        return float(np.asarray(prices[-period:], dtype=np.float64).mean())
+    
+    @staticmethod
+    def rolling_sma(prices: Sequence[float], period: int = 20) -> np.ndarray:
+        """
+        Calculate the SMA at every point of a price series in O(N)
+        
+        Args:
+            prices: Closing prices (list or numpy array)
+            period: Number of prices averaged
+            
+        Returns:
+            Array of len(prices) - period + 1 SMA values (empty if too short)
+        """
+        arr = np.asarray(prices, dtype=np.float64)
+        if period <= 0 or len(arr) < period:
+            return np.empty(0, dtype=np.float64)
+        
+        # Window sums from a running total: sum(i..i+n) = C[i+n] - C[i]
+        totals = np.empty(len(arr) + 1, dtype=np.float64)
+        totals[0] = 0.0
+        np.cumsum(arr, out=totals[1:])
+        return (totals[period:] - totals[:-period]) / period
+    
+    @staticmethod
+    def calculate_ema(prices: Sequence[float], period: int = 20) -> Optional[float]:
+        """
+        Calculate the latest Exponential Moving Average
+        
+        Args:
+            prices: Closing prices (list or numpy array)
+            period: EMA period (smoothing factor 2 / (period + 1))
+            
+        Returns:
+            EMA of the last price, or None if there are fewer than `period` prices
+        """
+        if len(prices) < period:
+            return None
+        return float(_ema_core(np.ascontiguousarray(prices, dtype=np.float64), period))
+    
+    @staticmethod
+    def calculate_macd(
+        prices: Sequence[float],
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Calculate the latest MACD values
+        
+        Args:
+            prices: Closing prices (list or numpy array)
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            signal_period: EMA period of the signal line
+            
+        Returns:
+            Tuple of (macd, signal, histogram), or None if there are fewer than
+            slow_period + signal_period - 1 prices
+        """
+        if len(prices) < slow_period + signal_period - 1:
+            return None
+        
+        arr = np.ascontiguousarray(prices, dtype=np.float64)
+        start = slow_period - 1  # first index where both EMAs exist
+        macd_line = (
+            _ema_series_core(arr, fast_period)[start:]
+            - _ema_series_core(arr, slow_period)[start:]
+        )
+        macd = float(macd_line[-1])
+        signal = float(_ema_core(macd_line, signal_period))
+        return macd, signal, macd - signal
+    
+    @staticmethod
+    def calculate_bollinger_bands(
+        prices: Sequence[float],
+        period: int = 20,
+        std_dev: float = 2.0
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Calculate the latest Bollinger Bands
+        
+        Args:
+            prices: Closing prices (list or numpy array)
+            period: Moving average period
+            std_dev: Band width in population standard deviations
+            
+        Returns:
+            Tuple of (upper, middle, lower), or None if there are fewer than `period` prices
+        """
+        if len(prices) < period:
+            return None
+        
+        tail = np.asarray(prices[-period:], dtype=np.float64)
+        middle = float(tail.mean())
+        width = std_dev * float(tail.std())
+        return middle + width, middle, middle - width
     
     @staticmethod
     def is_rsi_oversold(rsi: float, threshold: float = 30) -> bool:
@@ -48,4 +194,125 @@ class TechnicalIndicators:
     def is_rsi_overbought(rsi: float, threshold: float = 70) -> bool:
         """Check if RSI indicates overbought condition"""
         return rsi > threshold
+    
+    @staticmethod
+    def rsi_signals(
+        rsi: Sequence[float],
+        low: float = 30,
+        high: float = 70
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized is_rsi_oversold / is_rsi_overbought over an RSI series
+        
+        Args:
+            rsi: RSI values (list or numpy array; NaN compares False)
+            low: Oversold threshold
+            high: Overbought threshold
+            
+        Returns:
+            Tuple of (oversold, overbought) boolean masks; use np.flatnonzero
+            to get the signal bar indices
+        """
+        values = np.asarray(rsi, dtype=np.float64)
+        return values < low, values > high
+
 
+def _rsi_from_sums(gain_sum: float, loss_sum: float) -> float:
+    """RSI from summed gains/losses, with the same edge cases as calculate_rsi"""
+    if loss_sum == 0 and gain_sum == 0:
+        return 50.0
+    elif loss_sum == 0:
+        return 100.0
+    elif gain_sum == 0:
+        return 0.0
+    return 100 - (100 / (1 + gain_sum / loss_sum))
+
+
+class IncrementalRSI:
+    """
+    O(1) RSI over a stream of closes, matching TechnicalIndicators.calculate_rsi
+    (simple average of the last `period` gains and losses).
+    
+    Closed candles are committed with update(); the RSI of an in-progress
+    candle is read with peek() without changing the state.
+    """
+    
+    def __init__(self, period: int = 14):
+        """
+        Initialize incremental RSI
+        
+        Args:
+            period: RSI period
+        """
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self._gains: Deque[float] = deque(maxlen=period)
+        self._losses: Deque[float] = deque(maxlen=period)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+    
+    def seed(self, closes: Sequence[float]) -> Optional[float]:
+        """
+        Reset the state from closed-candle history
+        
+        Args:
+            closes: Closing prices of closed candles, oldest first
+        
+        Returns:
+            RSI after the last close, or None if history is too short
+        """
+        self.prev_close = None
+        self._gains.clear()
+        self._losses.clear()
+        self._gain_sum = self._loss_sum = 0.0
+        
+        rsi = None
+        for close in closes[-(self.period + 1):]:
+            rsi = self.update(close)
+        return rsi
+    
+    def update(self, close: float) -> Optional[float]:
+        """
+        Commit the close of a finished candle
+        
+        Args:
+            close: Closing price
+        
+        Returns:
+            RSI including this close, or None until `period` changes are known
+        """
+        close = float(close)
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            self._gains.append(delta if delta > 0 else 0.0)
+            self._losses.append(-delta if delta < 0 else 0.0)
+            # Re-summed once per candle so rounding never accumulates
+            self._gain_sum = math.fsum(self._gains)
+            self._loss_sum = math.fsum(self._losses)
+        self.prev_close = close
+        
+        if len(self._gains) < self.period:
+            return None
+        return _rsi_from_sums(self._gain_sum, self._loss_sum)
+    
+    def peek(self, close: float) -> Optional[float]:
+        """
+        RSI if `close` were the next committed close, without committing it
+        
+        Args:
+            close: Current (in-progress) price
+        
+        Returns:
+            Provisional RSI, or None if history is too short
+        """
+        if self.prev_close is None or len(self._gains) < self.period - 1:
+            return None
+        
+        delta = close - self.prev_close
+        gain_sum = self._gain_sum + (delta if delta > 0 else 0.0)
+        loss_sum = self._loss_sum + (-delta if delta < 0 else 0.0)
+        if len(self._gains) == self.period:
+            # The oldest change drops out of the window
+            gain_sum -= self._gains[0]
+            loss_sum -= self._losses[0]
+        return _rsi_from_sums(gain_sum, loss_sum)
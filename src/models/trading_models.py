@@ -1,10 +1,15 @@
 """
 Data models for the trading bot
 """
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Dict, Optional
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class TradeType(Enum):
@@ -37,7 +42,15 @@ class OrderStatus(Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
+# Enum member -> value, so to_dict() skips the Enum.value descriptor
+_ENUM_VALUES: Dict[Enum, str] = {
+    member: member.value
+    for enum in (TradeType, PositionSide, TradeResult, OrderStatus)
+    for member in enum
+}
+
+
+@dataclass(**_SLOTS)
 class Trade:
     """Trade information"""
     id: str
@@ -63,23 +76,23 @@ class Trade:
         return {
             "id": self.id,
             "symbol": self.symbol,
-            "trade_type": self.trade_type.value,
+            "trade_type": _ENUM_VALUES[self.trade_type],
             "quantity": self.quantity,
             "price": self.price,
             "timestamp": self.timestamp.isoformat(),
             "rsi_value": self.rsi_value,
-            "status": self.status.value,
+            "status": _ENUM_VALUES[self.status],
             "is_simulation": self.is_simulation,
             "buy_price": self.buy_price,
             "sell_price": self.sell_price,
             "profit_loss": self.profit_loss,
             "profit_loss_percentage": self.profit_loss_percentage,
-            "result": self.result.value,
+            "result": _ENUM_VALUES[self.result],
             "time_held": self.time_held
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Position:
     """Current trading position"""
     symbol: str
@@ -92,6 +105,25 @@ class Position:
     current_rsi: float = 0.0
     unrealized_pnl: float = 0.0
     unrealized_pnl_percentage: float = 0.0
+    entry_notional: float = 0.0  # quantity * entry_price, fixed at open
+    margin: float = 0.0  # Capital committed at open (entry_notional / leverage)
+    entry_monotonic: float = 0.0  # time.monotonic() at entry_time
+    _inv_entry_price: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if not self.entry_notional:
+            self.entry_notional = self.quantity * self.entry_price
+        if not self.margin:
+            self.margin = self.entry_notional
+        if not self.entry_monotonic:
+            # Read the wall clock once; elapsed time after this is monotonic
+            self.entry_monotonic = time.monotonic() - (datetime.now() - self.entry_time).total_seconds()
+        # Lets update() multiply instead of divide on every tick
+        self._inv_entry_price = 1.0 / self.entry_price if self.entry_price else 0.0
+    
+    def held_seconds(self) -> float:
+        """Seconds since entry (immune to wall-clock adjustments)"""
+        return time.monotonic() - self.entry_monotonic
     
     def update(self, current_price: float, current_rsi: float):
         """Update current position values"""
@@ -99,11 +131,11 @@ class Position:
         self.current_rsi = current_rsi
         
         # Calculate P&L based on position side
-        if self.side == PositionSide.LONG:
-            self.unrealized_pnl = (current_price - self.entry_price) * self.quantity
-            self.unrealized_pnl_percentage = ((current_price / self.entry_price) - 1) * 100
+        if self.side is PositionSide.LONG:
+            self.unrealized_pnl = current_price * self.quantity - self.entry_notional
+            self.unrealized_pnl_percentage = (current_price * self._inv_entry_price - 1) * 100
         else:  # SHORT
-            self.unrealized_pnl = (self.entry_price - current_price) * self.quantity
+            self.unrealized_pnl = self.entry_notional - current_price * self.quantity
             self.unrealized_pnl_percentage = ((self.entry_price / current_price) - 1) * 100
     
     def to_dict(self) -> dict:
@@ -114,16 +146,16 @@ class Position:
             "entry_price": self.entry_price,
             "entry_time": self.entry_time.isoformat(),
             "entry_rsi": self.entry_rsi,
-            "side": self.side.value,
+            "side": _ENUM_VALUES[self.side],
             "current_price": self.current_price,
             "current_rsi": self.current_rsi,
             "unrealized_pnl": self.unrealized_pnl,
             "unrealized_pnl_percentage": self.unrealized_pnl_percentage,
-            "time_held_minutes": (datetime.now() - self.entry_time).total_seconds() / 60
+            "time_held_minutes": self.held_seconds() / 60
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TradingStats:
     """Trading statistics"""
     total_trades: int = 0
@@ -132,14 +164,28 @@ class TradingStats:
     total_profit_loss: float = 0.0
     total_profit_loss_percentage: float = 0.0
     win_rate: float = 0.0
-    average_profit: float = 0.0
-    average_loss: float = 0.0
-    average_trade_duration: float = 0.0  # in minutes
+    sum_profit: float = 0.0
+    sum_loss: float = 0.0
+    sum_duration: float = 0.0  # in minutes
     largest_win: float = 0.0
     largest_loss: float = 0.0
     start_balance: float = 0.0
     current_balance: float = 0.0
     start_time: datetime = field(default_factory=datetime.now)
+    # start_time as an epoch, refreshed when start_time is reassigned
+    _start_ref: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _start_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._start_ref = self.start_time
+        self._start_epoch = self.start_time.timestamp()
+    
+    def runtime_seconds(self) -> float:
+        """Seconds since start_time, without datetime arithmetic"""
+        if self._start_ref is not self.start_time:
+            self._start_ref = self.start_time
+            self._start_epoch = self.start_time.timestamp()
+        return time.time() - self._start_epoch
     
     def update(self, trade: Trade):
         """Update statistics with a new trade"""
@@ -148,20 +194,14 @@ class TradingStats:
         if trade.result == TradeResult.WIN:
             self.winning_trades += 1
             if trade.profit_loss:
-                self.average_profit = (
-                    (self.average_profit * (self.winning_trades - 1) + trade.profit_loss) 
-                    / self.winning_trades
-                )
+                self.sum_profit += trade.profit_loss
                 if trade.profit_loss > self.largest_win:
                     self.largest_win = trade.profit_loss
         
         elif trade.result == TradeResult.LOSS:
             self.losing_trades += 1
             if trade.profit_loss:
-                self.average_loss = (
-                    (self.average_loss * (self.losing_trades - 1) + trade.profit_loss) 
-                    / self.losing_trades
-                )
+                self.sum_loss += trade.profit_loss
                 if trade.profit_loss < self.largest_loss:
                     self.largest_loss = trade.profit_loss
         
@@ -172,18 +212,31 @@ class TradingStats:
             self.win_rate = (self.winning_trades / self.total_trades) * 100
         
         if trade.time_held:
-            self.average_trade_duration = (
-                (self.average_trade_duration * (self.total_trades - 1) + trade.time_held) 
-                / self.total_trades
-            )
+            self.sum_duration += trade.time_held
         
         if self.start_balance > 0:
             self.total_profit_loss_percentage = (
                 (self.current_balance / self.start_balance - 1) * 100
             )
     
+    @property
+    def average_profit(self) -> float:
+        """Mean profit of winning trades"""
+        return self.sum_profit / max(self.winning_trades, 1)
+    
+    @property
+    def average_loss(self) -> float:
+        """Mean loss of losing trades"""
+        return self.sum_loss / max(self.losing_trades, 1)
+    
+    @property
+    def average_trade_duration(self) -> float:
+        """Mean trade duration in minutes"""
+        return self.sum_duration / max(self.total_trades, 1)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary"""
+        runtime_hours = self.runtime_seconds() / 3600
         return {
             "total_trades": self.total_trades,
             "winning_trades": self.winning_trades,
@@ -198,15 +251,12 @@ class TradingStats:
             "largest_loss": round(self.largest_loss, 2),
             "start_balance": round(self.start_balance, 2),
             "current_balance": round(self.current_balance, 2),
-            "runtime_hours": round((datetime.now() - self.start_time).total_seconds() / 3600, 2),
-            "trades_per_hour": round(
-                self.total_trades / max((datetime.now() - self.start_time).total_seconds() / 3600, 0.01),
-                2
-            )
+            "runtime_hours": round(runtime_hours, 2),
+            "trades_per_hour": round(self.total_trades / max(runtime_hours, 0.01), 2)
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MarketData:
     """Market data snapshot"""
     symbol: str
@@ -230,3 +280,142 @@ class MarketData:
             "volume": self.volume,
             "rsi": self.rsi
         }
+
+
+# ==================== MARKET RECORDS ====================
+
+class _Record:
+    """
+    Dict-style read access for lightweight API records, so callers
+    written against the previous dict results keep working.
+    """
+    __slots__ = ()
+    
+    # Previous dict key -> attribute name, where they differ
+    _KEY_ALIASES: ClassVar[Dict[str, str]] = {}
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, self._KEY_ALIASES.get(key, key))
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default=None):
+        """Dict-style get"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(**_SLOTS)
+class Candle(_Record):
+    """Candlestick (kline)"""
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    close_time: int
+
+
+@dataclass(**_SLOTS)
+class Ticker(_Record):
+    """24hr ticker statistics"""
+    symbol: str
+    last_price: float
+    high_price: float
+    low_price: float
+    volume: float
+    price_change: float
+    price_change_percent: float
+    
+    _KEY_ALIASES: ClassVar[Dict[str, str]] = {
+        'lastPrice': 'last_price',
+        'highPrice': 'high_price',
+        'lowPrice': 'low_price',
+        'priceChange': 'price_change',
+        'priceChangePercent': 'price_change_percent'
+    }
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary (Binance field names)"""
+        return {
+            'symbol': self.symbol,
+            'lastPrice': self.last_price,
+            'highPrice': self.high_price,
+            'lowPrice': self.low_price,
+            'volume': self.volume,
+            'priceChange': self.price_change,
+            'priceChangePercent': self.price_change_percent
+        }
+
+
+@dataclass(**_SLOTS)
+class Balance(_Record):
+    """Asset balance"""
+    asset: str
+    free: float = 0.0
+    locked: float = 0.0
+    total: float = 0.0
+
+
+@dataclass(frozen=True, **_SLOTS)
+class PositionSnap(_Record):
+    """Open Futures position snapshot"""
+    symbol: str
+    position_amt: float
+    entry_price: float
+    unrealized_pnl: float
+    leverage: int
+    position_side: str
+    liquidation_price: Optional[float] = None
+
+
+@dataclass(**_SLOTS)
+class RiskSnapshot(_Record):
+    """Risk metrics returned by RiskManager.get_risk_status"""
+    current_balance: float = 0.0
+    initial_balance: float = 0.0
+    peak_balance: float = 0.0
+    current_drawdown_pct: float = 0.0
+    max_drawdown_pct: float = 0.0
+    max_risk_per_trade_pct: float = 0.0
+    drawdown_warning: bool = False
+    drawdown_critical: bool = False
+    total_pnl: Optional[float] = None
+    total_pnl_pct: Optional[float] = None
+    win_rate: Optional[float] = None
+    
+    # Dict access reports the drawdown rounded, as the previous dict did
+    _KEY_ALIASES: ClassVar[Dict[str, str]] = {"current_drawdown_pct": "rounded_drawdown_pct"}
+    
+    @property
+    def rounded_drawdown_pct(self) -> float:
+        """Current drawdown rounded to 2 decimals"""
+        return round(self.current_drawdown_pct, 2)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary (stats fields only when present)"""
+        data = {
+            "current_balance": self.current_balance,
+            "initial_balance": self.initial_balance,
+            "peak_balance": self.peak_balance,
+            "current_drawdown_pct": self.rounded_drawdown_pct,
+            "max_drawdown_pct": self.max_drawdown_pct,
+            "max_risk_per_trade_pct": self.max_risk_per_trade_pct,
+            "drawdown_warning": self.drawdown_warning,
+            "drawdown_critical": self.drawdown_critical
+        }
+        
+        if self.total_pnl is not None:
+            data["total_pnl"] = self.total_pnl
+            data["total_pnl_pct"] = self.total_pnl_pct
+            data["win_rate"] = self.win_rate
+        
+        return data
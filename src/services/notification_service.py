@@ -3,9 +3,10 @@ Notification Service for Email Alerts
 """
 import logging
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from config.settings import AppConfig
@@ -13,6 +14,10 @@ from src.models.trading_models import TradeType, TradingStats
 from src.utils.helpers import format_currency, format_percentage
 
 
+# Trade notifications sent within this window (s) are combined into one email
+TRADE_BATCH_WINDOW = 0.5
+
+
 class NotificationService:
     """
     Handle email notifications for trading events
@@ -29,6 +34,12 @@ class NotificationService:
         self.config = config
         self.enabled = config.notifications.ENABLE_EMAIL
         
+        # Pending trade notifications (subject, html section) for the next batch
+        self.batch_window = TRADE_BATCH_WINDOW
+        self._pending: List[Tuple[str, str]] = []
+        self._batch_lock = threading.Lock()
+        self._batch_timer: Optional[threading.Timer] = None
+        
         if self.enabled:
             self.smtp_host = config.notifications.SMTP_HOST
             self.smtp_port = config.notifications.SMTP_PORT
@@ -129,7 +140,8 @@ class NotificationService:
         profit_loss_pct: Optional[float] = None
     ):
         """
-        Send trade execution notification
+        Send trade execution notification. Notifications arriving within
+        batch_window of each other are sent together as one email.
         
         Args:
             trade_type: BUY or SELL
@@ -145,11 +157,12 @@ class NotificationService:
         emoji = "🟢" if is_buy else ("🟢" if profit_loss and profit_loss >= 0 else "🔴")
         color = "#4CAF50" if is_buy or (profit_loss and profit_loss >= 0) else "#f44336"
         
+        if not self.enabled:
+            return
+        
         subject = f"{emoji} {trade_type.value} - {symbol}"
         
         html_content = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif;">
                 <h2 style="color: {color};">{emoji} {trade_type.value} Order Executed</h2>
                 <p><strong>Symbol:</strong> {symbol}</p>
                 <p><strong>Price:</strong> {format_currency(price)}</p>
@@ -165,7 +178,33 @@ class NotificationService:
                 <p><strong>P&L:</strong> {format_currency(profit_loss)} ({format_percentage(profit_loss_pct)})</p>
             """
         
-        html_content += """
+        with self._batch_lock:
+            self._pending.append((subject, html_content))
+            if self._batch_timer is None:
+                self._batch_timer = threading.Timer(self.batch_window, self.flush)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+    
+    def flush(self):
+        """Send pending trade notifications now (one email per batch)"""
+        with self._batch_lock:
+            pending, self._pending = self._pending, []
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+        
+        if not pending:
+            return
+        
+        if len(pending) == 1:
+            subject = pending[0][0]
+        else:
+            subject = f"📬 {len(pending)} Trades - " + " | ".join(s for s, _ in pending)
+        
+        sections = '\n                <hr>'.join(section for _, section in pending)
+        html_content = f"""
+        <html>
+            <body style="font-family: Arial, sans-serif;">{sections}
                 <p style="color: #666; font-size: 12px; margin-top: 20px;">
                     This is an automated notification from RSI Trading Bot
                 </p>
@@ -182,6 +221,9 @@ class NotificationService:
         Args:
             stats: Trading statistics
         """
+        # Deliver any trade notifications still waiting for their batch
+        self.flush()
+        
         total_pnl = stats.current_balance - stats.start_balance
         total_pnl_pct = (total_pnl / stats.start_balance) * 100
         color = "#4CAF50" if total_pnl >= 0 else "#f44336"
@@ -241,7 +283,7 @@ class NotificationService:
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd;"><strong>Runtime:</strong></td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{(datetime.now() - stats.start_time).total_seconds() / 3600:.2f} hours</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">{stats.runtime_seconds() / 3600:.2f} hours</td>
                     </tr>
                 </table>
                 
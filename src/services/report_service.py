@@ -108,7 +108,7 @@ Reason: {reason}
             result: Trade result (WIN/LOSS)
         """
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        time_held = (datetime.now() - position.entry_time).total_seconds() / 60
+        time_held = position.held_seconds() / 60
         
         result_emoji = "🟢 WIN" if result == TradeResult.WIN else "🔴 LOSS"
         
@@ -154,7 +154,7 @@ Reason: {reason}
             current_position: Current open position (if any)
         """
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        runtime = (datetime.now() - stats.start_time).total_seconds() / 3600
+        runtime = stats.runtime_seconds() / 3600
         total_pnl = stats.current_balance - stats.start_balance
         total_pnl_pct = (total_pnl / stats.start_balance) * 100
         
@@ -4,13 +4,20 @@ Supports LONG and SHORT positions for Futures trading
 """
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional
+import numpy as np
 from src.models.trading_models import Position, TradeType, PositionSide
 from src.indicators.technical_indicators import TechnicalIndicators
 from src.utils.helpers import calculate_percentage
 from config.settings import AppConfig
 
 
+# RSI band where oversold/overbought tracking fully resets (narrowed at
+# runtime so it stays clear of the oversold/overbought buffer zones)
+NEUTRAL_RSI_LOW = 45
+NEUTRAL_RSI_HIGH = 55
+
+
 class RSIStrategy:
     """
     RSI-based trading strategy with multiple exit conditions
@@ -36,6 +43,15 @@ class RSIStrategy:
         self.big_profit_pct = config.trading.BIG_PROFIT_PERCENTAGE
         self.max_loss_pct = config.trading.MAX_LOSS_PERCENTAGE
         
+        # Entry/exit timing settings (read on every tick)
+        self.min_rsi_counter = config.trading.MIN_RSI_COUNTER
+        self.min_time_after_sell = config.trading.MIN_TIME_AFTER_SELL
+        self.rsi_bounce_threshold = config.trading.RSI_BOUNCE_THRESHOLD
+        self.sell_at_loss_0_5_hours = config.trading.SELL_AT_LOSS_0_5_HOURS
+        self.sell_at_loss_1_0_hours = config.trading.SELL_AT_LOSS_1_0_HOURS
+        self.sell_at_loss_2_0_hours = config.trading.SELL_AT_LOSS_2_0_HOURS
+        self.max_hold_hours = config.trading.MAX_HOLD_HOURS
+        
         # Price tracking
         self.highest_price: float = 0.0
         self.lowest_price: float = float('inf')
@@ -88,11 +104,66 @@ class RSIStrategy:
         self.lowest_rsi = 100.0
         self.highest_rsi = 0.0
     
+    def in_sell_cooldown(self) -> bool:
+        """Check whether entries are still blocked after the last sell"""
+        if self.last_sell_time is None:
+            return False
+        time_since_sell = (datetime.now() - self.last_sell_time).total_seconds() / 60
+        return time_since_sell < self.min_time_after_sell
+    
+    def is_entry_idle(self, current_rsi: float, allow_short: bool) -> bool:
+        """
+        Check whether should_buy/should_short cannot signal for this tick
+        
+        True when RSI is in the neutral band and the oversold (and overbought)
+        tracking is already reset, so the only state either call would touch
+        is the price/RSI extremes.
+        
+        Args:
+            current_rsi: Current RSI
+            allow_short: Whether should_short is also evaluated
+            
+        Returns:
+            True if no entry signal is possible
+        """
+        if self.min_rsi_counter <= 0:
+            return False
+        neutral_low = max(NEUTRAL_RSI_LOW, self.rsi_oversold + 5)
+        if current_rsi < neutral_low or self.oversold_counter or \
+                self.oversold_intensity or self.oversold_start_time is not None:
+            return False
+        neutral_high = min(NEUTRAL_RSI_HIGH, self.rsi_overbought - 5)
+        if allow_short and (current_rsi > neutral_high or self.overbought_counter or
+                            self.overbought_intensity or self.overbought_start_time is not None):
+            return False
+        return True
+    
+    def skip_idle_entry(self, current_price: float, current_rsi: float, allow_short: bool) -> bool:
+        """
+        Skip should_buy/should_short when they cannot signal, keeping their side effects
+        
+        Records the price/RSI extremes the skipped calls would have tracked,
+        so a later entry still compares against peaks reached while idle.
+        
+        Args:
+            current_price: Current price
+            current_rsi: Current RSI
+            allow_short: Whether should_short is also evaluated
+            
+        Returns:
+            True if the entry checks can be skipped for this tick
+        """
+        if not self.is_entry_idle(current_rsi, allow_short):
+            return False
+        if not self.in_sell_cooldown():
+            self.update_price_extremes(current_price, current_rsi)
+        return True
+    
     def should_buy(
         self, 
         current_price: float, 
         current_rsi: float,
-        closes: List[float],
+        closes: np.ndarray,
         in_position: bool
     ) -> tuple[bool, str]:
         """
@@ -101,7 +172,7 @@ class RSIStrategy:
         Args:
             current_price: Current price
             current_rsi: Current RSI
-            closes: List of closing prices
+            closes: Recent closing prices as a float64 view (oldest first)
             in_position: Whether currently in a position
             
         Returns:
@@ -113,7 +184,7 @@ class RSIStrategy:
         # Check if enough time has passed since last sell
         if self.last_sell_time:
             time_since_sell = (datetime.now() - self.last_sell_time).total_seconds() / 60
-            if time_since_sell < self.config.trading.MIN_TIME_AFTER_SELL:
+            if time_since_sell < self.min_time_after_sell:
                 return False, f"Too soon after sell ({time_since_sell:.1f} min)"
         
         # Update price tracking
@@ -142,13 +213,13 @@ class RSIStrategy:
                 if oversold_duration > 5:
                     self.oversold_intensity += 0.5  # Bonus durée
             
-            self.logger.debug(f"Oversold: RSI={current_rsi:.1f}, Intensity={self.oversold_intensity:.1f}, Count={self.oversold_counter}")
+            self.logger.debug("Oversold: RSI=%.1f, Intensity=%.1f, Count=%s", current_rsi, self.oversold_intensity, self.oversold_counter)
         
         elif current_rsi < self.rsi_oversold + 5:
             # Zone tampon : RSI proche oversold, maintien partiel
             self.oversold_intensity = max(0, self.oversold_intensity - 0.2)
         
-        elif current_rsi < 45:
+        elif current_rsi < NEUTRAL_RSI_LOW:
             # RSI bas mais pas oversold : décroissance lente
             self.oversold_intensity = max(0, self.oversold_intensity - 0.5)
             if self.oversold_counter > 0:
@@ -166,12 +237,12 @@ class RSIStrategy:
                 self.oversold_start_time = None
             
             if self.oversold_intensity == 0:
-                self.logger.debug(f"Oversold signals reset (RSI: {current_rsi:.1f})")
+                self.logger.debug("Oversold signals reset (RSI: %.1f)", current_rsi)
         
         # Buy conditions améliorées
         # Soit le compteur basique (3+ cycles), soit une forte intensité (10+)
         rsi_counter_met = (
-            self.oversold_counter >= self.config.trading.MIN_RSI_COUNTER or
+            self.oversold_counter >= self.min_rsi_counter or
             self.oversold_intensity >= 10.0
         )
         price_condition_met = current_price <= top_price_threshold
@@ -180,16 +251,16 @@ class RSIStrategy:
         rsi_bounced = False
         if self.lowest_rsi < self.rsi_oversold:
             rsi_bounce = current_rsi - self.lowest_rsi
-            if rsi_bounce >= self.config.trading.RSI_BOUNCE_THRESHOLD:
+            if rsi_bounce >= self.rsi_bounce_threshold:
                 rsi_bounced = True
-                self.logger.debug(f"RSI bounced: {rsi_bounce:.2f} from {self.lowest_rsi:.2f}")
+                self.logger.debug("RSI bounced: %.2f from %.2f", rsi_bounce, self.lowest_rsi)
         
         # Buy signal logic
         if rsi_counter_met and price_condition_met and rsi_bounced:
             reason = []
             if self.oversold_intensity >= 10.0:
                 reason.append(f"Strong oversold (intensity: {self.oversold_intensity:.1f})")
-            elif self.oversold_counter >= self.config.trading.MIN_RSI_COUNTER:
+            elif self.oversold_counter >= self.min_rsi_counter:
                 reason.append(f"RSI oversold x{self.oversold_counter}")
             if rsi_bounced:
                 reason.append(f"RSI bounce +{current_rsi - self.lowest_rsi:.1f}")
@@ -208,7 +279,7 @@ class RSIStrategy:
         self, 
         current_price: float, 
         current_rsi: float,
-        closes: List[float],
+        closes: np.ndarray,
         in_position: bool
     ) -> tuple[bool, str]:
         """
@@ -217,7 +288,7 @@ class RSIStrategy:
         Args:
             current_price: Current price
             current_rsi: Current RSI
-            closes: List of closing prices
+            closes: Recent closing prices as a float64 view (oldest first)
             in_position: Whether currently in a position
             
         Returns:
@@ -229,7 +300,7 @@ class RSIStrategy:
         # Check if enough time has passed since last sell
         if self.last_sell_time:
             time_since_sell = (datetime.now() - self.last_sell_time).total_seconds() / 60
-            if time_since_sell < self.config.trading.MIN_TIME_AFTER_SELL:
+            if time_since_sell < self.min_time_after_sell:
                 return False, f"Too soon after sell ({time_since_sell:.1f} min)"
         
         # Update price tracking
@@ -258,13 +329,13 @@ class RSIStrategy:
                 if overbought_duration > 5:
                     self.overbought_intensity += 0.5  # Bonus durée
             
-            self.logger.debug(f"Overbought: RSI={current_rsi:.1f}, Intensity={self.overbought_intensity:.1f}, Count={self.overbought_counter}")
+            self.logger.debug("Overbought: RSI=%.1f, Intensity=%.1f, Count=%s", current_rsi, self.overbought_intensity, self.overbought_counter)
         
         elif current_rsi > self.rsi_overbought - 5:
             # Zone tampon : RSI proche overbought, maintien partiel
             self.overbought_intensity = max(0, self.overbought_intensity - 0.2)
         
-        elif current_rsi > 55:
+        elif current_rsi > NEUTRAL_RSI_HIGH:
             # RSI haut mais pas overbought : décroissance lente
             self.overbought_intensity = max(0, self.overbought_intensity - 0.5)
             if self.overbought_counter > 0:
@@ -282,11 +353,11 @@ class RSIStrategy:
                 self.overbought_start_time = None
             
             if self.overbought_intensity == 0:
-                self.logger.debug(f"Overbought signals reset (RSI: {current_rsi:.1f})")
+                self.logger.debug("Overbought signals reset (RSI: %.1f)", current_rsi)
         
         # SHORT conditions
         rsi_counter_met = (
-            self.overbought_counter >= self.config.trading.MIN_RSI_COUNTER or
+            self.overbought_counter >= self.min_rsi_counter or
             self.overbought_intensity >= 10.0
         )
         price_condition_met = current_price >= bottom_price_threshold
@@ -295,16 +366,16 @@ class RSIStrategy:
         rsi_dropped = False
         if self.highest_rsi > self.rsi_overbought:
             rsi_drop = self.highest_rsi - current_rsi
-            if rsi_drop >= self.config.trading.RSI_BOUNCE_THRESHOLD:
+            if rsi_drop >= self.rsi_bounce_threshold:
                 rsi_dropped = True
-                self.logger.debug(f"RSI dropped: {rsi_drop:.2f} from {self.highest_rsi:.2f}")
+                self.logger.debug("RSI dropped: %.2f from %.2f", rsi_drop, self.highest_rsi)
         
         # SHORT signal logic
         if rsi_counter_met and price_condition_met and rsi_dropped:
             reason = []
             if self.overbought_intensity >= 10.0:
                 reason.append(f"Strong overbought (intensity: {self.overbought_intensity:.1f})")
-            elif self.overbought_counter >= self.config.trading.MIN_RSI_COUNTER:
+            elif self.overbought_counter >= self.min_rsi_counter:
                 reason.append(f"RSI overbought x{self.overbought_counter}")
             if rsi_dropped:
                 reason.append(f"RSI drop -{self.highest_rsi - current_rsi:.1f}")
@@ -374,8 +445,7 @@ class RSIStrategy:
             self.highest_rsi = current_rsi
         
         # Time held
-        time_held = datetime.now() - position.entry_time
-        hours_held = time_held.total_seconds() / 3600
+        hours_held = position.held_seconds() / 3600
         
         # === ADAPTIVE LOSS PREVENTION STRATEGIES ===
         
@@ -395,7 +465,7 @@ class RSIStrategy:
         
         # Mode 1: Sell at buy price (early warning)
         # Activate earlier if deteriorating, later if recovering
-        threshold_0_5 = self.config.trading.SELL_AT_LOSS_0_5_HOURS
+        threshold_0_5 = self.sell_at_loss_0_5_hours
         if price_trend == "deteriorating":
             threshold_0_5 *= 0.7  # 30% faster activation
         elif price_trend == "recovering":
@@ -405,10 +475,10 @@ class RSIStrategy:
             current_price <= position.entry_price - loss_0_5_pct and 
             hours_held >= threshold_0_5):
             self.sell_at_buyprice = True
-            self.logger.warning(f"⚠ Activated: Sell at buy price mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.warning("⚠ Activated: Sell at buy price mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Mode 2: Fast sell (moderate urgency)
-        threshold_1_0 = self.config.trading.SELL_AT_LOSS_1_0_HOURS
+        threshold_1_0 = self.sell_at_loss_1_0_hours
         if price_trend == "deteriorating":
             threshold_1_0 *= 0.75
         elif price_trend == "recovering":
@@ -418,10 +488,10 @@ class RSIStrategy:
             current_price <= position.entry_price - loss_1_0_pct and 
             hours_held >= threshold_1_0):
             self.sell_fast = True
-            self.logger.warning(f"⚠ Activated: Fast sell mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.warning("⚠ Activated: Fast sell mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Mode 3: Very fast sell (high urgency)
-        threshold_2_0 = self.config.trading.SELL_AT_LOSS_2_0_HOURS
+        threshold_2_0 = self.sell_at_loss_2_0_hours
         if price_trend == "deteriorating":
             threshold_2_0 *= 0.8
             
@@ -431,7 +501,7 @@ class RSIStrategy:
             self.sell_very_fast = True
             self.sell_very_fast_time = datetime.now()
             self.very_fast_lose_amt = 1.0
-            self.logger.error(f"🚨 Activated: VERY FAST sell mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.error("🚨 Activated: VERY FAST sell mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Progressive loss thresholds in very fast mode
         if self.sell_very_fast and self.sell_very_fast_time:
@@ -444,17 +514,17 @@ class RSIStrategy:
                 self.very_fast_lose_amt = 3.0  # Aggressive exit
         
         # Emergency sell - held too long regardless of RSI
-        max_hold = self.config.trading.MAX_HOLD_HOURS
+        max_hold = self.max_hold_hours
         if hours_held >= max_hold:
             # Force sell if held max time with any loss
             if position.unrealized_pnl < 0:
-                self.logger.error(f"🚨 MAX HOLD TIME: Selling at {position.unrealized_pnl_percentage:.2f}% after {hours_held:.1f}h")
+                self.logger.error("🚨 MAX HOLD TIME: Selling at %.2f%% after %.1fh", position.unrealized_pnl_percentage, hours_held)
                 self._reset_sell_flags()
                 self.last_sell_time = datetime.now()
                 return True, f"Max hold time exceeded ({hours_held:.1f}h)", "loss"
             # Or if RSI overbought
             elif current_rsi > self.rsi_overbought:
-                self.logger.warning(f"⏰ Max hold time + overbought: {position.unrealized_pnl_percentage:.2f}%")
+                self.logger.warning("⏰ Max hold time + overbought: %.2f%%", position.unrealized_pnl_percentage)
                 self._reset_sell_flags()
                 self.last_sell_time = datetime.now()
                 return True, f"Max hold + RSI overbought", "win" if position.unrealized_pnl > 0 else "neutral"
@@ -465,7 +535,7 @@ class RSIStrategy:
             if self.sell_at_buyprice:
                 target = position.entry_price + calculate_percentage(0.15, position.entry_price)
                 if current_price >= target:
-                    self.logger.info(f"✓ Selling at buy price mode: +{position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.info("✓ Selling at buy price mode: +%.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, "RSI oversold + buy price recovery", "win"
@@ -474,7 +544,7 @@ class RSIStrategy:
             if self.sell_fast:
                 target = position.entry_price - calculate_percentage(0.75, position.entry_price)
                 if current_price >= target:
-                    self.logger.warning(f"⚠ Fast sell: {position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.warning("⚠ Fast sell: %.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, "RSI oversold + fast sell", "loss"
@@ -486,7 +556,7 @@ class RSIStrategy:
                     position.entry_price
                 )
                 if current_price >= target:
-                    self.logger.error(f"🚨 Very fast sell: {position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.error("🚨 Very fast sell: %.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, f"RSI oversold + very fast sell (-{self.very_fast_lose_amt}%)", "loss"
@@ -499,7 +569,7 @@ class RSIStrategy:
             position.entry_price
         )
         if current_price >= profit_3_pct:
-            self.logger.info(f"🎉 BIG WIN: +{position.unrealized_pnl_percentage:.2f}%")
+            self.logger.info("🎉 BIG WIN: +%.2f%%", position.unrealized_pnl_percentage)
             self._reset_sell_flags()
             self.last_sell_time = datetime.now()
             return True, f"Big profit target (+{self.big_profit_pct}%)", "win"
@@ -514,7 +584,7 @@ class RSIStrategy:
             if current_price >= profit_target:
                 # Confirm RSI peaked (dropped by 3 points from highest)
                 if current_rsi + 3 <= self.highest_rsi:
-                    self.logger.success(f"✓ RSI sell: +{position.unrealized_pnl_percentage:.2f}% (RSI peaked at {self.highest_rsi:.1f})")
+                    self.logger.success("✓ RSI sell: +%.2f%% (RSI peaked at %.1f)", position.unrealized_pnl_percentage, self.highest_rsi)
                     self._reset_sell_flags()
                     self.highest_rsi = 0.0
                     self.last_sell_time = datetime.now()
@@ -551,8 +621,7 @@ class RSIStrategy:
             self.lowest_rsi = current_rsi
         
         # Time held
-        time_held = datetime.now() - position.entry_time
-        hours_held = time_held.total_seconds() / 3600
+        hours_held = position.held_seconds() / 3600
         
         # === ADAPTIVE LOSS PREVENTION FOR SHORT (price going UP is bad) ===
         
@@ -571,7 +640,7 @@ class RSIStrategy:
         loss_2_0_pct = calculate_percentage(2.0, position.entry_price)
         
         # Mode 1: Cover at entry price (early warning)
-        threshold_0_5 = self.config.trading.SELL_AT_LOSS_0_5_HOURS
+        threshold_0_5 = self.sell_at_loss_0_5_hours
         if price_trend == "deteriorating":
             threshold_0_5 *= 0.7
         elif price_trend == "recovering":
@@ -581,10 +650,10 @@ class RSIStrategy:
             current_price >= position.entry_price + loss_0_5_pct and 
             hours_held >= threshold_0_5):
             self.sell_at_buyprice = True
-            self.logger.warning(f"⚠ Activated SHORT: Cover at entry price mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.warning("⚠ Activated SHORT: Cover at entry price mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Mode 2: Fast cover
-        threshold_1_0 = self.config.trading.SELL_AT_LOSS_1_0_HOURS
+        threshold_1_0 = self.sell_at_loss_1_0_hours
         if price_trend == "deteriorating":
             threshold_1_0 *= 0.75
         elif price_trend == "recovering":
@@ -594,10 +663,10 @@ class RSIStrategy:
             current_price >= position.entry_price + loss_1_0_pct and 
             hours_held >= threshold_1_0):
             self.sell_fast = True
-            self.logger.warning(f"⚠ Activated SHORT: Fast cover mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.warning("⚠ Activated SHORT: Fast cover mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Mode 3: Very fast cover
-        threshold_2_0 = self.config.trading.SELL_AT_LOSS_2_0_HOURS
+        threshold_2_0 = self.sell_at_loss_2_0_hours
         if price_trend == "deteriorating":
             threshold_2_0 *= 0.8
             
@@ -607,7 +676,7 @@ class RSIStrategy:
             self.sell_very_fast = True
             self.sell_very_fast_time = datetime.now()
             self.very_fast_lose_amt = 1.0
-            self.logger.error(f"🚨 Activated SHORT: VERY FAST cover mode (held {hours_held:.1f}h, trend: {price_trend})")
+            self.logger.error("🚨 Activated SHORT: VERY FAST cover mode (held %.1fh, trend: %s)", hours_held, price_trend)
         
         # Progressive loss thresholds
         if self.sell_very_fast and self.sell_very_fast_time:
@@ -620,15 +689,15 @@ class RSIStrategy:
                 self.very_fast_lose_amt = 3.0
         
         # Emergency cover - held too long
-        max_hold = self.config.trading.MAX_HOLD_HOURS
+        max_hold = self.max_hold_hours
         if hours_held >= max_hold:
             if position.unrealized_pnl < 0:
-                self.logger.error(f"🚨 SHORT MAX HOLD: Covering at {position.unrealized_pnl_percentage:.2f}% after {hours_held:.1f}h")
+                self.logger.error("🚨 SHORT MAX HOLD: Covering at %.2f%% after %.1fh", position.unrealized_pnl_percentage, hours_held)
                 self._reset_sell_flags()
                 self.last_sell_time = datetime.now()
                 return True, f"Max hold time exceeded ({hours_held:.1f}h)", "loss"
             elif current_rsi < self.rsi_oversold:
-                self.logger.warning(f"⏰ SHORT max hold + oversold: {position.unrealized_pnl_percentage:.2f}%")
+                self.logger.warning("⏰ SHORT max hold + oversold: %.2f%%", position.unrealized_pnl_percentage)
                 self._reset_sell_flags()
                 self.last_sell_time = datetime.now()
                 return True, f"Max hold + RSI oversold", "win" if position.unrealized_pnl > 0 else "neutral"
@@ -640,7 +709,7 @@ class RSIStrategy:
             if self.sell_at_buyprice:
                 target = position.entry_price - calculate_percentage(0.15, position.entry_price)
                 if current_price <= target:
-                    self.logger.info(f"✓ SHORT covering at entry mode: +{position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.info("✓ SHORT covering at entry mode: +%.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, "RSI oversold + entry recovery (SHORT)", "win"
@@ -649,7 +718,7 @@ class RSIStrategy:
             if self.sell_fast:
                 target = position.entry_price + calculate_percentage(0.75, position.entry_price)
                 if current_price <= target:
-                    self.logger.warning(f"⚠ SHORT fast cover: {position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.warning("⚠ SHORT fast cover: %.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, "RSI oversold + fast cover (SHORT)", "loss"
@@ -661,7 +730,7 @@ class RSIStrategy:
                     position.entry_price
                 )
                 if current_price <= target:
-                    self.logger.error(f"🚨 SHORT very fast cover: {position.unrealized_pnl_percentage:.2f}%")
+                    self.logger.error("🚨 SHORT very fast cover: %.2f%%", position.unrealized_pnl_percentage)
                     self._reset_sell_flags()
                     self.last_sell_time = datetime.now()
                     return True, f"RSI oversold + very fast cover (SHORT) (+{self.very_fast_lose_amt}%)", "loss"
@@ -674,7 +743,7 @@ class RSIStrategy:
             position.entry_price
         )
         if current_price <= profit_target_big:
-            self.logger.info(f"🎉 SHORT BIG WIN: +{position.unrealized_pnl_percentage:.2f}%")
+            self.logger.info("🎉 SHORT BIG WIN: +%.2f%%", position.unrealized_pnl_percentage)
             self._reset_sell_flags()
             self.last_sell_time = datetime.now()
             return True, f"Big profit target (SHORT) (+{self.big_profit_pct}%)", "win"
@@ -689,7 +758,7 @@ class RSIStrategy:
             if current_price <= profit_target:
                 # Confirm RSI bottomed (rose by 3 points from lowest)
                 if current_rsi - 3 >= self.lowest_rsi:
-                    self.logger.success(f"✓ SHORT RSI cover: +{position.unrealized_pnl_percentage:.2f}% (RSI bottomed at {self.lowest_rsi:.1f})")
+                    self.logger.success("✓ SHORT RSI cover: +%.2f%% (RSI bottomed at %.1f)", position.unrealized_pnl_percentage, self.lowest_rsi)
                     self._reset_sell_flags()
                     self.lowest_rsi = 100.0
                     self.last_sell_time = datetime.now()
@@ -1,9 +1,20 @@
 """
 Utility functions for the trading bot
 """
+import json
 import logging
+from functools import lru_cache
 from typing import Union
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    json_loads = json.loads
+
+# Distinct formatted values kept per formatter
+FORMAT_CACHE_SIZE = 2048
+
 
 def calculate_percentage(percentage: float, value: float) -> float:
     """
@@ -30,9 +41,21 @@ def format_currency(value: float, decimals: int = 2) -> str:
     Returns:
         Formatted string
     """
+    # Quantize first so every value printing the same shares one cache entry
+    value = round(value, decimals)
+    if value == 0:
+        # -0.0 and 0.0 share a cache key but print differently
+        return _currency(value, decimals)
+    return _format_currency(value, decimals)
+
+
+def _currency(value: float, decimals: int) -> str:
     return f"${value:,.{decimals}f}"
 
 
+_format_currency = lru_cache(maxsize=FORMAT_CACHE_SIZE)(_currency)
+
+
 def format_percentage(value: float, decimals: int = 2) -> str:
     """
     Format value as percentage
@@ -44,9 +67,19 @@ def format_percentage(value: float, decimals: int = 2) -> str:
     Returns:
         Formatted string with % sign
     """
+    value = round(value, decimals)
+    if value == 0:
+        return _percentage(value, decimals)
+    return _format_percentage(value, decimals)
+
+
+def _percentage(value: float, decimals: int) -> str:
     return f"{value:+.{decimals}f}%"
 
 
+_format_percentage = lru_cache(maxsize=FORMAT_CACHE_SIZE)(_percentage)
+
+
 def setup_logger(name: str, log_file: str, level: Union[str, int] = logging.INFO) -> logging.Logger:
     """
     Setup a logger with file and console handlers
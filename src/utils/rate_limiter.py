@@ -0,0 +1,66 @@
+"""
+Client-side rate limiting for Binance API requests
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers block briefly until enough tokens
+    have refilled instead of running into exchange-side throttling.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize token bucket
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update (lock held)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+    
+    def consume(self, amount: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available
+        
+        Args:
+            amount: Number of tokens (request weight)
+            
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.refill_rate
+            
+            time.sleep(delay)
+            waited += delay
+    
+    def sync_used(self, used: float):
+        """
+        Align the bucket with usage reported by the server
+        
+        Args:
+            used: Tokens the server reports as already used in the window
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = max(0.0, min(self.tokens, self.capacity - used))
@@ -0,0 +1,78 @@
+"""
+Fixed-size numeric ring buffer for price history
+"""
+from typing import Iterable
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Preallocated float64 ring buffer. Every value is written twice (at
+    slot and slot + capacity), so the newest values are always available
+    as one contiguous array view without copying or shifting.
+    """
+    
+    __slots__ = ('capacity', '_data', '_head', '_size')
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer
+        
+        Args:
+            capacity: Maximum number of values kept
+        """
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=np.float64)
+        self._head = 0  # Next slot to write
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, value: float):
+        """Append a value, dropping the oldest one when full"""
+        head = self._head
+        self._data[head] = self._data[head + self.capacity] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+    
+    def load(self, values: Iterable[float]):
+        """Replace the contents with the newest `capacity` values"""
+        if not isinstance(values, np.ndarray):
+            values = np.fromiter(values, dtype=np.float64)
+        values = values[-self.capacity:]
+        size = len(values)
+        self._data[:size] = values
+        self._data[self.capacity:self.capacity + size] = values
+        self._head = size % self.capacity
+        self._size = size
+    
+    def set_last(self, value: float):
+        """Overwrite the newest value (appends if the buffer is empty)"""
+        if not self._size:
+            self.append(value)
+            return
+        slot = (self._head - 1) % self.capacity
+        self._data[slot] = self._data[slot + self.capacity] = value
+    
+    def last(self) -> float:
+        """Newest value"""
+        return float(self._data[(self._head - 1) % self.capacity])
+    
+    def view(self, n: int = 0) -> np.ndarray:
+        """
+        Contiguous read-only view of the newest values, oldest first
+        
+        Args:
+            n: Number of values (0 or more than stored = all)
+        
+        Returns:
+            Array view into the buffer (valid until the next write)
+        """
+        size = self._size if n <= 0 or n > self._size else n
+        end = self._head + self.capacity
+        window = self._data[end - size:end]
+        window.flags.writeable = False
+        return window
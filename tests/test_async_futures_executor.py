@@ -0,0 +1,82 @@
+"""
+Unit tests for the async Futures executor
+"""
+import asyncio
+import pytest
+from unittest import mock
+from config.settings import AppConfig
+from src.core.async_futures_executor import AsyncFuturesExecutor
+
+
+@pytest.fixture
+def client():
+    """Create a mocked async Binance client"""
+    client = mock.Mock()
+    client.used_weight = 0
+    client._request = mock.AsyncMock(return_value={})
+    return client
+
+
+@pytest.fixture
+def executor(client):
+    """Create async Futures executor instance"""
+    return AsyncFuturesExecutor("key", "secret", AppConfig(), client=client)
+
+
+def test_bulk_configure_sets_every_symbol(executor, client):
+    """Test bulk configuration sends margin type and leverage per symbol"""
+    result = asyncio.run(executor.bulk_configure(['ETHUSDT', 'BTCUSDT'], leverage=5))
+    
+    assert result == {'ETHUSDT': True, 'BTCUSDT': True}
+    assert client._request.await_count == 4
+    params = client._request.await_args_list[0].args[2]
+    assert params['recvWindow'] == 5000
+
+
+def test_bulk_configure_backs_off_near_weight_limit(executor, client):
+    """Test bulk configuration pauses once most of the weight quota is used"""
+    client.used_weight = 1100
+    with mock.patch('src.core.async_futures_executor.asyncio.sleep', new=mock.AsyncMock()) as sleep:
+        asyncio.run(executor.bulk_configure(['ETHUSDT']))
+    
+    sleep.assert_awaited_once()
+    assert client.used_weight == 0
+
+
+def test_close_positions_fetches_then_closes_open_ones(executor, client):
+    """Test positions are read first and only open ones are closed"""
+    def respond(method, path, params=None, signed=False):
+        if path == '/fapi/v1/exchangeInfo':
+            return {'symbols': []}
+        if path == '/fapi/v2/positionRisk':
+            amt = '0.3' if params['symbol'] == 'ETHUSDT' else '0'
+            return [{'symbol': params['symbol'], 'positionAmt': amt, 'entryPrice': '2000',
+                     'unRealizedProfit': '0', 'leverage': '5', 'positionSide': 'BOTH'}]
+        return {'orderId': 1}
+    client._request.side_effect = respond
+    
+    result = asyncio.run(executor.close_positions(['ETHUSDT', 'BTCUSDT']))
+    
+    assert result == {'ETHUSDT': {'orderId': 1}, 'BTCUSDT': None}
+    order_params = client._request.await_args_list[-1].args[2]
+    assert order_params['side'] == 'SELL'
+    assert order_params['reduceOnly'] == 'true'
+
+
+def test_orders_use_symbol_precision(executor, client):
+    """Test prices are rounded and quantities truncated like the sync executor"""
+    client._request.side_effect = lambda method, path, params=None, signed=False: (
+        {'symbols': [{'symbol': 'ETHUSDT', 'status': 'TRADING', 'baseAsset': 'ETH',
+                      'quoteAsset': 'USDT', 'pricePrecision': 2, 'quantityPrecision': 3,
+                      'filters': []}]}
+        if path == '/fapi/v1/exchangeInfo' else {'orderId': 1}
+    )
+    
+    asyncio.run(executor.create_limit_order('ETHUSDT', 'BUY', 0.12345, 2000.126))
+    asyncio.run(executor.create_stop_loss('ETHUSDT', 'SELL', 0.3, 1899.994))
+    
+    limit_params = client._request.await_args_list[1].args[2]
+    stop_params = client._request.await_args_list[2].args[2]
+    assert (limit_params['quantity'], limit_params['price']) == ('0.123', '2000.13')
+    assert (stop_params['quantity'], stop_params['stopPrice']) == ('0.300', '1899.99')
+    assert client._request.await_count == 3  # exchange info fetched once
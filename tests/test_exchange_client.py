@@ -0,0 +1,262 @@
+"""
+Unit tests for the Binance exchange client wrapper
+"""
+import asyncio
+import json
+import pytest
+import requests
+from unittest import mock
+from src.core.async_exchange_client import AsyncBinanceClient
+from src.core.exchange_client import BinanceClient, configure_session, create_order_pool
+
+
+@pytest.fixture
+def exchange():
+    """Create a spot client backed by a mocked python-binance client"""
+    with mock.patch('src.core.exchange_client.FastJsonClient'), \
+            mock.patch('src.core.exchange_client.create_order_pool'):
+        client = BinanceClient("key", "secret", trading_mode="spot")
+    client.client.get_exchange_info.return_value = {
+        'symbols': [{'symbol': 'ETHUSDT'}, {'symbol': 'BTCUSDT'}]
+    }
+    return client
+
+
+def test_symbol_info_uses_cached_exchange_info(exchange):
+    """Test exchange info is downloaded once within the TTL"""
+    assert exchange.get_symbol_info('ETHUSDT') == {'symbol': 'ETHUSDT'}
+    assert exchange.get_symbol_info('BTCUSDT') == {'symbol': 'BTCUSDT'}
+    assert exchange.get_symbol_info('XRPUSDT') is None
+    assert exchange.client.get_exchange_info.call_count == 1
+
+
+def test_symbol_info_refetches_after_invalidate(exchange):
+    """Test invalidating the cache forces a new download"""
+    exchange.get_symbol_info('ETHUSDT')
+    exchange.invalidate_exchange_info()
+    exchange.get_symbol_info('ETHUSDT')
+    assert exchange.client.get_exchange_info.call_count == 2
+
+
+def test_get_symbol_tickers_single_request(exchange):
+    """Test several tickers are fetched with one request and keep caller order"""
+    raw = {
+        'symbol': '', 'lastPrice': '1', 'highPrice': '2', 'lowPrice': '0.5',
+        'volume': '10', 'priceChange': '0.1', 'priceChangePercent': '1.0'
+    }
+    exchange.client.get_ticker.return_value = [
+        dict(raw, symbol='BTCUSDT'), dict(raw, symbol='ETHUSDT')
+    ]
+    
+    tickers = exchange.get_symbol_tickers(['ETHUSDT', 'BTCUSDT', 'XRPUSDT'])
+    
+    assert [t['symbol'] for t in tickers] == ['ETHUSDT', 'BTCUSDT']
+    assert tickers[0]['lastPrice'] == 1.0
+    exchange.client.get_ticker.assert_called_once_with(symbols='["ETHUSDT","BTCUSDT","XRPUSDT"]')
+
+
+def _raw_kline(open_time, close):
+    """Build a raw Binance kline row"""
+    return [open_time, '1', '2', '0.5', str(close), '10', open_time + 59999]
+
+
+def _kline_message(open_time, close):
+    """Build a combined-stream kline message"""
+    return json.dumps({
+        'stream': 'ethusdt@kline_1m',
+        'data': {'e': 'kline', 'k': {
+            's': 'ETHUSDT', 'i': '1m', 't': open_time, 'T': open_time + 59999,
+            'o': close, 'h': close, 'l': close, 'c': close, 'v': '1'
+        }}
+    })
+
+
+def test_get_klines_cached_then_topped_up(exchange):
+    """Test klines are served from cache and refreshed incrementally"""
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(3)]
+    
+    first = exchange.get_klines('ETHUSDT', '1m', limit=3)
+    second = exchange.get_klines('ETHUSDT', '1m', limit=3)
+    assert second == first
+    assert exchange.client.get_klines.call_count == 1
+    
+    # Expire the entry: only the last open candle and one new one are fetched
+    key = ('ETHUSDT', '1m', 3)
+    exchange._klines_cache[key] = (0.0, exchange._klines_cache[key][1])
+    exchange.client.get_klines.return_value = [_raw_kline(120000, 2.5), _raw_kline(180000, 3)]
+    
+    klines = exchange.get_klines('ETHUSDT', '1m', limit=3)
+    
+    assert [k['close'] for k in klines] == [1.0, 2.5, 3.0]
+    assert exchange.client.get_klines.call_args.kwargs['startTime'] == 120000
+
+
+def test_get_klines_np_columns(exchange):
+    """Test klines are returned as a structured array"""
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(3)]
+    
+    klines = exchange.get_klines_np('ETHUSDT', '1m', limit=3)
+    
+    assert klines['close'].tolist() == [0.0, 1.0, 2.0]
+    assert klines['open_time'][-1] == 120000
+    assert klines['close_time'][0] == 59999
+
+
+def test_create_order_signed_through_order_pool(exchange):
+    """Test orders are signed and sent through the order connection pool"""
+    exchange._order_pool.request.return_value = mock.Mock(
+        status=200, data=b'{"orderId": 1, "price": "0"}'
+    )
+    
+    order = exchange.create_order('ETHUSDT', 'BUY', 'MARKET', 0.5)
+    
+    assert order['orderId'] == 1
+    method, url = exchange._order_pool.request.call_args.args
+    assert method == 'POST'
+    assert url.startswith('https://api.binance.com/api/v3/order?symbol=ETHUSDT&side=BUY')
+    assert 'positionSide' not in url
+    assert 'recvWindow=60000' in url
+    assert '&signature=' in url
+
+
+def test_order_error_page_is_handled(exchange):
+    """Test a non-JSON error page fails the order instead of raising"""
+    exchange._order_pool.request.return_value = mock.Mock(
+        status=503, data=b'<html><body>503 Service Unavailable</body></html>', headers={}
+    )
+    
+    assert exchange.create_order('ETHUSDT', 'BUY', 'MARKET', 0.5) is None
+    assert exchange.cancel_order('ETHUSDT', 1) is False
+    assert exchange.cancel_all_open('ETHUSDT') is False
+
+
+def test_klines_served_from_stream_cache(exchange):
+    """Test subscribed klines are read from the stream cache"""
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(3)]
+    with mock.patch('src.core.websocket_handler.MarketDataStream.start'):
+        exchange.subscribe_kline('ETHUSDT', '1m')
+    exchange.stream.on_open(None)
+    
+    exchange.stream.on_message(None, _kline_message(180000, '3.5'))
+    
+    klines = exchange.get_klines('ETHUSDT', '1m', limit=2)
+    
+    assert [k['close'] for k in klines] == [2.0, 3.5]
+    assert exchange.client.get_klines.call_count == 1
+
+
+def test_stream_cache_skipped_when_down_stale_or_gappy(exchange):
+    """Test klines fall back to REST unless the stream is live and contiguous"""
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(3)]
+    with mock.patch('src.core.websocket_handler.MarketDataStream.start'):
+        exchange.subscribe_kline('ETHUSDT', '1m')
+    stream = exchange.stream
+    
+    assert stream.get_klines('ETHUSDT', '1m', 2) is None  # not connected yet
+    
+    stream.on_open(None)
+    assert stream.get_klines('ETHUSDT', '1m', 2) is not None
+    
+    stream._last_message -= 60
+    assert stream.get_klines('ETHUSDT', '1m', 2) is None  # stale
+    
+    stream.on_message(None, _kline_message(300000, '5'))  # skips two candles
+    assert stream.get_klines('ETHUSDT', '1m', 2) is None
+    
+    stream.on_close(None, None, None)
+    assert stream.get_klines('ETHUSDT', '1m', 1) is None
+
+
+def test_stream_cache_reseeded_on_reconnect(exchange):
+    """Test a reconnect replaces the kline cache with fresh REST history"""
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(3)]
+    with mock.patch('src.core.websocket_handler.MarketDataStream.start'):
+        exchange.subscribe_kline('ETHUSDT', '1m')
+    exchange.stream.on_open(None)
+    exchange.stream.on_close(None, None, None)
+    
+    exchange.client.get_klines.return_value = [_raw_kline(t * 60000, t) for t in range(6)]
+    exchange.stream.on_open(None)
+    
+    klines = exchange.stream.get_klines('ETHUSDT', '1m', 2)
+    assert [k.close for k in klines] == [4.0, 5.0]
+    assert exchange.client.get_klines.call_count == 2
+
+
+def test_balance_record_keeps_dict_access(exchange):
+    """Test balances are slot records that still read like the old dicts"""
+    exchange.client.get_asset_balance.return_value = {'asset': 'USDT', 'free': '10', 'locked': '2.5'}
+    
+    balance = exchange.get_account_balance('USDT')
+    
+    assert balance.total == 12.5
+    assert balance['free'] == 10.0
+    assert balance.to_dict() == {'asset': 'USDT', 'free': 10.0, 'locked': 2.5, 'total': 12.5}
+    assert not hasattr(balance, '__dict__')
+
+
+def test_warmup_primes_exchange_info(exchange):
+    """Test warm-up pings once and fills the exchange info cache"""
+    exchange.client.ping.assert_not_called()
+    
+    with mock.patch('src.core.exchange_client.socket.getaddrinfo'):
+        assert exchange.warmup()
+    
+    assert exchange.get_symbol_info('ETHUSDT') == {'symbol': 'ETHUSDT'}
+    assert exchange.client.get_exchange_info.call_count == 1
+    exchange.client.ping.assert_called_once()
+
+
+def test_warmup_survives_exchange_info_network_error(exchange):
+    """Test a network error while downloading exchange info does not escape warm-up"""
+    exchange.client.get_exchange_info.side_effect = requests.ConnectionError("down")
+    
+    with mock.patch('src.core.exchange_client.socket.getaddrinfo'):
+        assert exchange.warmup()
+
+
+def test_configure_session_keeps_existing_pool():
+    """Test reconfiguring a pooled session does not replace its adapter"""
+    client = mock.Mock(session=requests.Session())
+    configure_session(client)
+    adapter = client.session.get_adapter('https://')
+    
+    configure_session(client)
+    
+    assert client.session.get_adapter('https://') is adapter
+    assert client.session.headers['Connection'] == 'keep-alive'
+
+
+def test_order_pool_has_timeouts_and_no_read_retries():
+    """Test order requests time out and are never resent after a read failure"""
+    pool_kw = create_order_pool().connection_pool_kw
+    
+    assert pool_kw['timeout'].connect_timeout == 10
+    assert pool_kw['timeout'].read_timeout == 10
+    assert pool_kw['retries'].read == 0
+
+
+def test_async_cancel_sends_recv_window_and_survives_timeout():
+    """Test async cancels use the order recvWindow and report timeouts as failures"""
+    client = AsyncBinanceClient("key", "secret", trading_mode="futures")
+    request = mock.AsyncMock(side_effect=asyncio.TimeoutError)
+    
+    try:
+        with mock.patch.object(client, '_request', request):
+            assert client.cancel_orders('ETHUSDT', [1]) == [False]
+    finally:
+        client.close()
+    
+    assert request.call_args.args[2]['recvWindow'] == 60000
+
+
+def test_cancel_orders_fails_closed_and_syncs_weight(exchange):
+    """Test a failed batch cancel reports every order as not cancelled"""
+    exchange._async_client = mock.Mock(used_weight=1150)
+    exchange._async_client.cancel_orders.side_effect = RuntimeError("loop stopped")
+    
+    assert exchange.cancel_orders('ETHUSDT', [1, 2]) == [False, False]
+    assert exchange._weight_bucket.tokens <= exchange._weight_bucket.capacity - 1150
+    
+    exchange.close()
+    assert exchange._async_client is None
@@ -192,6 +192,63 @@ def test_app_config_validate_all_invalid_futures():
     assert any("leverage" in err.lower() for err in errors)
 
 
+def test_app_config_validate_all_reports_every_trading_error():
+    """Test full config validation lists leverage and risk errors together"""
+    config = AppConfig()
+    config.trading.TRADING_MODE = "futures"
+    config.trading.DEFAULT_LEVERAGE = 200  # Invalid
+    config.trading.MARGIN_TYPE = "isolated"
+    config.trading.MAX_RISK_PER_TRADE_PCT = 50.0  # Invalid
+    config.trading.MAX_DRAWDOWN_PCT = 10.0
+    
+    is_valid, errors = config.validate_all()
+    
+    config.trading.DEFAULT_LEVERAGE = 5
+    config.trading.MAX_RISK_PER_TRADE_PCT = 2.0
+    assert is_valid is False
+    assert any("leverage" in err.lower() for err in errors)
+    assert any("MAX_RISK_PER_TRADE_PCT" in err for err in errors)
+
+
+def test_trading_config_validate_all_returns_first_error():
+    """Test combined trading validation stops at the first failing rule"""
+    TradingConfig.TRADING_MODE = "futures"
+    TradingConfig.DEFAULT_LEVERAGE = 200  # Invalid
+    TradingConfig.MARGIN_TYPE = "invalid"  # Also invalid, but checked later
+    TradingConfig.MAX_RISK_PER_TRADE_PCT = 2.0
+    TradingConfig.MAX_DRAWDOWN_PCT = 10.0
+    
+    is_valid, error = TradingConfig.validate_all()
+    assert is_valid is False
+    assert "Invalid leverage" in error
+    
+    TradingConfig.DEFAULT_LEVERAGE = 5
+    TradingConfig.MARGIN_TYPE = "isolated"
+    is_valid, error = TradingConfig.validate_all()
+    assert is_valid is True
+    assert error == ""
+
+
+@pytest.mark.parametrize("key, value, message", [
+    ("DEFAULT_RSI_PERIOD", "0", "RSI_PERIOD"),
+    ("DEFAULT_RSI_OVERSOLD", "75", "RSI thresholds"),
+    ("DEFAULT_RSI_PERIOD", "fourteen", "Invalid value"),
+])
+def test_reload_rejects_bad_rsi_settings(monkeypatch, key, value, message):
+    """Test reload keeps the previous RSI settings when the new ones are invalid"""
+    monkeypatch.setattr('config.settings.load_dotenv', lambda **kwargs: None)
+    for name, current in (("TRADING_MODE", "spot"), ("RSI_PERIOD", 14),
+                          ("RSI_OVERBOUGHT", 70), ("RSI_OVERSOLD", 30)):
+        monkeypatch.setattr(TradingConfig, name, current)
+    monkeypatch.setenv(key, value)
+    
+    is_valid, error = AppConfig.reload()
+    
+    assert is_valid is False
+    assert message in error
+    assert (TradingConfig.RSI_PERIOD, TradingConfig.RSI_OVERBOUGHT, TradingConfig.RSI_OVERSOLD) == (14, 70, 30)
+
+
 def test_default_config_values():
     """Test default configuration values are sensible"""
     # Create fresh config to avoid test pollution
@@ -0,0 +1,225 @@
+"""
+Unit tests for the Futures executor
+"""
+import json
+import pytest
+import requests
+from unittest import mock
+from config.settings import AppConfig
+from src.core.futures_executor import FuturesExecutor
+
+
+@pytest.fixture
+def client():
+    """Create a mocked python-binance client"""
+    client = mock.Mock()
+    client.futures_exchange_info.return_value = {
+        'symbols': [{
+            'symbol': 'ETHUSDT',
+            'status': 'TRADING',
+            'baseAsset': 'ETH',
+            'quoteAsset': 'USDT',
+            'pricePrecision': 2,
+            'quantityPrecision': 3,
+            'filters': []
+        }]
+    }
+    return client
+
+
+@pytest.fixture
+def executor(client):
+    """Create Futures executor instance"""
+    return FuturesExecutor(client, AppConfig())
+
+
+def test_symbol_info_cached_within_ttl(executor, client):
+    """Test exchange info is downloaded once within the TTL"""
+    assert executor.get_symbol_info('ETHUSDT')['quantity_precision'] == 3
+    assert executor.get_symbol_info('BTCUSDT') is None
+    assert executor.get_symbol_info('ETHUSDT')['base_asset'] == 'ETH'
+    assert client.futures_exchange_info.call_count == 1
+
+
+def test_symbol_info_refetched_after_ttl(executor, client):
+    """Test exchange info is refetched once the TTL expires"""
+    executor.get_symbol_info('ETHUSDT')
+    executor._exchange_info_ts -= executor.exchange_info_ttl
+    executor.get_symbol_info('ETHUSDT')
+    assert client.futures_exchange_info.call_count == 2
+
+
+def test_symbol_info_parsed_once_per_refresh(executor, client):
+    """Test parsed symbol info is reused until exchange info is refetched"""
+    first = executor.get_symbol_info('ETHUSDT')
+    assert executor.get_symbol_info('ETHUSDT') is first
+    
+    executor._exchange_info_ts -= executor.exchange_info_ttl
+    assert executor.get_symbol_info('ETHUSDT') is not first
+
+
+def test_balance_served_from_cache_and_invalidated(executor, client):
+    """Test balance reads are cached until an order invalidates them"""
+    client.futures_account.return_value = {
+        'totalWalletBalance': '100',
+        'availableBalance': '80',
+        'totalUnrealizedProfit': '5'
+    }
+    
+    assert executor.get_futures_balance()['margin_balance'] == 105.0
+    executor.get_futures_balance()
+    assert client.futures_account.call_count == 1
+    
+    executor.create_market_order('ETHUSDT', 'BUY', 0.1)
+    executor.get_futures_balance()
+    assert client.futures_account.call_count == 2
+
+
+def test_stale_balance_returned_while_refreshing(executor, client):
+    """Test a stale balance is returned immediately and refreshed in the background"""
+    client.futures_account.return_value = {
+        'totalWalletBalance': '100',
+        'availableBalance': '80',
+        'totalUnrealizedProfit': '0'
+    }
+    executor.get_futures_balance()
+    executor.balance_ttl = 0.0
+    
+    with mock.patch('src.core.futures_executor.threading.Thread') as thread:
+        assert executor.get_futures_balance()['total_balance'] == 100.0
+    
+    thread.return_value.start.assert_called_once()
+
+
+def test_create_bracket_sends_one_batch(executor, client):
+    """Test entry, stop-loss and take-profit go out in one batch request"""
+    client.futures_place_batch_order.return_value = [
+        {'orderId': 1}, {'orderId': 2}, {'code': -2021, 'msg': 'Order would immediately trigger.'}
+    ]
+    
+    results = executor.create_bracket('ETHUSDT', 'BUY', 0.5, stop_price=1900, take_profit_price=2100)
+    
+    assert results == [{'orderId': 1}, {'orderId': 2}, None]
+    client.futures_place_batch_order.assert_called_once()
+    orders = client.futures_place_batch_order.call_args.kwargs['batchOrders']
+    assert [o['type'] for o in orders] == ['MARKET', 'STOP_MARKET', 'TAKE_PROFIT_MARKET']
+    assert orders[1] == {
+        'symbol': 'ETHUSDT', 'side': 'SELL', 'type': 'STOP_MARKET', 'quantity': '0.500',
+        'stopPrice': '1900.00', 'positionSide': 'BOTH', 'reduceOnly': 'true'
+    }
+    client.futures_create_order.assert_not_called()
+
+
+def test_positions_fetched_once_for_all_symbols(executor, client):
+    """Test position reads share one snapshot across symbols"""
+    client.futures_position_information.return_value = [
+        {'symbol': 'ETHUSDT', 'positionAmt': '0.5', 'entryPrice': '2000', 'unRealizedProfit': '3',
+         'leverage': '5', 'positionSide': 'BOTH', 'liquidationPrice': '1500'},
+        {'symbol': 'BTCUSDT', 'positionAmt': '0', 'entryPrice': '0', 'unRealizedProfit': '0',
+         'leverage': '5', 'positionSide': 'BOTH', 'liquidationPrice': '0'}
+    ]
+    
+    position = executor.get_position('ETHUSDT')
+    assert position.position_amt == 0.5
+    assert position['liquidation_price'] == 1500.0
+    assert executor.get_position('BTCUSDT') is None
+    client.futures_position_information.assert_called_once_with()
+
+
+def test_limit_order_formatted_to_symbol_precision(executor, client):
+    """Test prices and quantities are rounded to the symbol precision"""
+    executor.create_limit_order('ETHUSDT', 'BUY', 0.12345, 2000.456)
+    
+    kwargs = client.futures_create_order.call_args.kwargs
+    assert kwargs['quantity'] == '0.123'
+    assert kwargs['price'] == '2000.46'
+
+
+def test_quantity_truncated_not_rounded_up(executor):
+    """Test quantities never round up past the sized amount"""
+    format_price, format_qty = executor.get_order_formatters('ETHUSDT')
+    
+    assert format_qty(0.1236) == '0.123'
+    assert format_qty(0.3) == '0.300'
+    assert format_qty(2.0) == '2.000'
+    assert format_price(2000.456) == '2000.46'
+
+
+def test_position_read_from_connected_user_stream(executor, client):
+    """Test positions come from the user stream while it is connected"""
+    client.futures_position_information.return_value = []
+    client.futures_account.return_value = {
+        'totalWalletBalance': '1000', 'availableBalance': '900', 'totalUnrealizedProfit': '0',
+        'assets': [{'asset': 'USDT', 'walletBalance': '1000', 'crossWalletBalance': '900'}]
+    }
+    with mock.patch('src.core.websocket_handler.UserStreamManager.start'):
+        stream = executor.start_user_stream()
+    stream.on_open(mock.Mock())
+    assert stream.connected
+    
+    stream.on_message(None, json.dumps({
+        'e': 'ACCOUNT_UPDATE',
+        'a': {
+            'B': [{'a': 'USDT', 'wb': '1000', 'cw': '900'}],
+            'P': [{'s': 'ETHUSDT', 'pa': '-0.2', 'ep': '2100', 'up': '-4', 'ps': 'BOTH'}]
+        }
+    }))
+    
+    position = executor.get_position('ETHUSDT')
+    assert position.position_amt == -0.2
+    assert position.leverage == executor.default_leverage
+    assert stream.get_balance('USDT')['wallet_balance'] == 1000.0
+    client.futures_position_information.assert_called_once_with()
+
+
+def test_user_stream_resyncs_on_reconnect(executor, client):
+    """Test a reconnect replaces the snapshot from REST, keeping hedge-mode legs apart"""
+    client.futures_position_information.return_value = []
+    client.futures_account.return_value = {
+        'totalWalletBalance': '1000', 'availableBalance': '900', 'totalUnrealizedProfit': '0',
+        'assets': [{'asset': 'USDT', 'walletBalance': '1000', 'crossWalletBalance': '900'}]
+    }
+    with mock.patch('src.core.websocket_handler.UserStreamManager.start'):
+        stream = executor.start_user_stream()
+    stream.on_open(mock.Mock())
+    stream.on_message(None, json.dumps({
+        'e': 'ACCOUNT_UPDATE',
+        'a': {'P': [
+            {'s': 'ETHUSDT', 'pa': '0.5', 'ep': '2000', 'up': '0', 'ps': 'LONG'},
+            {'s': 'ETHUSDT', 'pa': '-0.3', 'ep': '2100', 'up': '0', 'ps': 'SHORT'}
+        ]}
+    }))
+    assert stream.get_position('ETHUSDT', 'LONG').position_amt == 0.5
+    assert stream.get_position('ETHUSDT', 'SHORT').position_amt == -0.3
+    
+    # The LONG leg closed while the stream was down
+    stream.on_close(None, None, None)
+    client.futures_position_information.return_value = [
+        {'symbol': 'ETHUSDT', 'positionAmt': '-0.3', 'entryPrice': '2100', 'unRealizedProfit': '1',
+         'leverage': '5', 'positionSide': 'SHORT', 'liquidationPrice': '2500'}
+    ]
+    stream.on_open(mock.Mock())
+    
+    assert stream.get_position('ETHUSDT', 'LONG') is None
+    assert executor.get_position('ETHUSDT').position_side == 'SHORT'
+
+
+def test_order_survives_exchange_info_network_error(executor, client):
+    """Test a failed exchange info download does not escape an order"""
+    client.futures_exchange_info.side_effect = requests.ConnectionError("down")
+    client.futures_create_order.return_value = {'orderId': 1}
+    
+    assert executor.create_market_order('ETHUSDT', 'BUY', 0.5) == {'orderId': 1}
+    assert client.futures_create_order.call_args.kwargs['quantity'] == '0.5'
+    
+    # Not cached: the next order retries the download
+    client.futures_exchange_info.side_effect = None
+    executor.create_market_order('ETHUSDT', 'BUY', 0.5)
+    assert client.futures_create_order.call_args.kwargs['quantity'] == '0.500'
+
+
+def test_unknown_symbol_formatters_cached(executor, client):
+    """Test an unknown symbol falls back to plain strings without refetching"""
+    assert executor.get_order_formatters('XRPUSDT') == (str, str)
+    assert executor.get_order_formatters('XRPUSDT') == (str, str)
+    assert client.futures_exchange_info.call_count == 1
@@ -0,0 +1,55 @@
+"""
+Unit tests for the notification service
+"""
+import pytest
+from unittest import mock
+from config.settings import AppConfig
+from src.models.trading_models import TradeType, TradingStats
+from src.services.notification_service import NotificationService
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    """Create an enabled notification service with email sending mocked"""
+    cfg = AppConfig()
+    monkeypatch.setattr(cfg.notifications, 'ENABLE_EMAIL', True)
+    service = NotificationService(cfg)
+    service.batch_window = 60
+    service._send_email = mock.Mock(return_value=True)
+    return service
+
+
+def _notify(service, trade_type, price):
+    service.send_trade_notification(
+        trade_type=trade_type,
+        symbol='ETHUSDT',
+        price=price,
+        quantity=0.5,
+        rsi=30.0,
+        reason="test"
+    )
+
+
+def test_trade_notifications_batched_into_one_email(notifier):
+    """Test notifications inside the batch window share one email"""
+    _notify(notifier, TradeType.BUY, 2000.0)
+    _notify(notifier, TradeType.SELL, 1990.0)
+    notifier._send_email.assert_not_called()
+    
+    notifier.flush()
+    
+    notifier._send_email.assert_called_once()
+    subject, html = notifier._send_email.call_args.args
+    assert subject.startswith("📬 2 Trades")
+    assert html.count("Order Executed") == 2
+
+
+def test_final_report_flushes_pending_notifications(notifier):
+    """Test pending trade notifications are sent before the final report"""
+    _notify(notifier, TradeType.BUY, 2000.0)
+    
+    notifier.send_final_report(TradingStats(start_balance=1000.0, current_balance=1000.0))
+    
+    subjects = [c.args[0] for c in notifier._send_email.call_args_list]
+    assert subjects[0] == "🟢 BUY - ETHUSDT"
+    assert "Final Trading Report" in subjects[1]
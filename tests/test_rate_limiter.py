@@ -0,0 +1,32 @@
+"""
+Unit tests for the token bucket rate limiter
+"""
+from src.utils.rate_limiter import TokenBucket
+
+
+def test_consume_within_capacity_does_not_wait():
+    """Test consuming available tokens returns immediately"""
+    bucket = TokenBucket(capacity=10, refill_rate=1)
+    
+    assert bucket.consume(4) == 0.0
+    assert bucket.consume(6) == 0.0
+    assert bucket.tokens < 1
+
+
+def test_consume_waits_for_refill():
+    """Test an empty bucket waits for the missing tokens"""
+    bucket = TokenBucket(capacity=2, refill_rate=200)
+    bucket.consume(2)
+    
+    waited = bucket.consume(1)
+    
+    assert 0 < waited < 0.1
+
+
+def test_sync_used_caps_tokens():
+    """Test server-reported usage lowers the available tokens"""
+    bucket = TokenBucket(capacity=1200, refill_rate=20)
+    
+    bucket.sync_used(1100)
+    
+    assert bucket.tokens <= 100.5
@@ -0,0 +1,34 @@
+"""
+Unit tests for the price ring buffer
+"""
+from src.utils.ring_buffer import RingBuffer
+
+
+def test_append_keeps_newest_values_in_order():
+    """Test the view stays ordered after the buffer wraps"""
+    buf = RingBuffer(4)
+    for value in range(1, 8):
+        buf.append(value)
+    
+    assert len(buf) == 4
+    assert buf.view().tolist() == [4.0, 5.0, 6.0, 7.0]
+    assert buf.view(2).tolist() == [6.0, 7.0]
+    assert buf.last() == 7.0
+
+
+def test_load_and_set_last():
+    """Test seeding from history and overwriting the current value"""
+    buf = RingBuffer(3)
+    buf.load([1.0, 2.0, 3.0, 4.0, 5.0])
+    buf.set_last(9.0)
+    buf.append(10.0)
+    
+    assert buf.view().tolist() == [4.0, 9.0, 10.0]
+
+
+def test_set_last_on_empty_buffer_appends():
+    """Test the first write works before any history is loaded"""
+    buf = RingBuffer(3)
+    buf.set_last(5.0)
+    
+    assert buf.view().tolist() == [5.0]
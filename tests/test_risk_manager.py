@@ -219,6 +219,18 @@ def test_risk_status_critical(risk_manager):
     assert status['drawdown_critical'] is True
 
 
+def test_risk_status_snapshots_are_independent(risk_manager):
+    """Test each risk status is its own snapshot with rounded dict access"""
+    first = risk_manager.get_risk_status(970.0)
+    second = risk_manager.get_risk_status(933.333)
+    
+    assert first['current_drawdown_pct'] == 3.0
+    assert second['current_drawdown_pct'] == 6.67
+    assert second.current_drawdown_pct == pytest.approx(6.6667, rel=1e-4)
+    assert second.to_dict()['current_drawdown_pct'] == 6.67
+    assert 'win_rate' not in second.to_dict()
+
+
 def test_position_sizing_with_leverage(risk_manager):
     """Test position sizing accounts for leverage correctly"""
     # With 5x leverage, position value can be 5x balance
@@ -250,3 +262,21 @@ def test_risk_manager_with_zero_balance(risk_manager):
     )
     
     assert is_valid is False
+
+
+def test_update_drawdown_series_matches_scalar_path(config):
+    """Test the vectorized drawdown replay matches per-balance updates"""
+    balances = [1000.0, 900.0, 950.0, 1100.0, 990.0]
+    scalar = RiskManager(config, initial_balance=1000.0)
+    vectorized = RiskManager(config, initial_balance=1000.0)
+    
+    expected = []
+    for balance in balances:
+        scalar._update_drawdown(balance)
+        expected.append(scalar.current_drawdown_pct)
+    
+    drawdowns = vectorized.update_drawdown_series(balances)
+    
+    assert drawdowns.tolist() == pytest.approx(expected)
+    assert vectorized.peak_balance == scalar.peak_balance == 1100.0
+    assert vectorized.current_drawdown_pct == pytest.approx(10.0)
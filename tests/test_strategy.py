@@ -75,6 +75,44 @@ def test_should_buy_already_in_position(strategy):
     assert reason == "Already in position"
 
 
+def test_entry_idle_in_neutral_zone(strategy):
+    """Test entry checks are skipped only while RSI is neutral and tracking is reset"""
+    assert strategy.is_entry_idle(50.0, allow_short=True)
+    assert strategy.is_entry_idle(60.0, allow_short=False)
+    assert not strategy.is_entry_idle(60.0, allow_short=True)
+    assert not strategy.is_entry_idle(40.0, allow_short=False)
+    
+    # Oversold tracking still has to decay through should_buy
+    strategy.should_buy(2000.0, 25.0, [2000.0] * 20, in_position=False)
+    assert not strategy.is_entry_idle(50.0, allow_short=False)
+    
+    strategy.should_buy(2000.0, 50.0, [2000.0] * 20, in_position=False)
+    assert strategy.is_entry_idle(50.0, allow_short=False)
+
+
+def test_entry_idle_band_follows_thresholds(strategy):
+    """Test the idle band stays clear of custom oversold/overbought buffers"""
+    strategy.rsi_oversold = 50
+    strategy.rsi_overbought = 55
+    
+    assert not strategy.is_entry_idle(52.0, allow_short=False)
+    assert strategy.is_entry_idle(56.0, allow_short=False)
+    assert not strategy.is_entry_idle(56.0, allow_short=True)
+
+
+def test_idle_skip_keeps_price_peak(strategy):
+    """Test a peak reached at neutral RSI still sets the buy price threshold"""
+    closes = [2000.0] * 20
+    assert strategy.skip_idle_entry(2000.0, 50.0, allow_short=True)
+    
+    for _ in range(3):
+        should_buy, _ = strategy.should_buy(1980.0, 25.0, closes, in_position=False)
+        assert not should_buy
+    
+    should_buy, reason = strategy.should_buy(1980.0, 29.0, closes, in_position=False)
+    assert should_buy, reason
+
+
 def test_reset_extremes(strategy):
     """Test resetting price extremes"""
     strategy.update_price_extremes(2000.0, 45.0)
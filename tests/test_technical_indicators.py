@@ -0,0 +1,102 @@
+"""
+Unit tests for technical indicators
+"""
+import numpy as np
+import pytest
+from src.indicators.technical_indicators import IncrementalRSI, TechnicalIndicators
+
+
+@pytest.fixture
+def closes():
+    """Random-walk closing prices"""
+    rng = np.random.default_rng(7)
+    return (2000 + np.cumsum(rng.normal(0, 5, 200))).tolist()
+
+
+def test_incremental_rsi_matches_batch(closes):
+    """Test committed and provisional RSI match the batch calculation"""
+    rsi = IncrementalRSI(14)
+    rsi.seed(closes[:50])
+    
+    for i in range(50, len(closes)):
+        expected = TechnicalIndicators.calculate_rsi(closes[:i + 1], 14)
+        assert rsi.peek(closes[i]) == pytest.approx(expected)
+        assert rsi.update(closes[i]) == pytest.approx(expected)
+
+
+def test_incremental_rsi_needs_full_period():
+    """Test RSI is unavailable until `period` price changes are known"""
+    rsi = IncrementalRSI(3)
+    
+    assert rsi.seed([1.0, 2.0]) is None
+    assert rsi.peek(3.0) is None
+    assert rsi.update(3.0) is None
+    assert rsi.peek(4.0) == 100.0
+
+
+def test_incremental_rsi_flat_market():
+    """Test a flat market reads as neutral RSI"""
+    rsi = IncrementalRSI(3)
+    
+    assert rsi.seed([5.0] * 10) == 50.0
+
+
+def test_calculate_rsi_accepts_arrays(closes):
+    """Test array and list inputs give the same RSI, and NaN prices give None"""
+    prices = np.asarray(closes)
+    
+    assert TechnicalIndicators.calculate_rsi(prices, 14) == pytest.approx(
+        TechnicalIndicators.calculate_rsi(closes, 14)
+    )
+    prices[-3] = np.nan
+    assert TechnicalIndicators.calculate_rsi(prices, 14) is None
+
+
+def test_moving_averages_and_bands(closes):
+    """Test SMA, EMA and Bollinger Bands against straightforward references"""
+    tail = closes[-20:]
+    sma = sum(tail) / 20
+    ema = sum(closes[:10]) / 10
+    for price in closes[10:]:
+        ema = price * (2 / 11) + ema * (1 - 2 / 11)
+    std = float(np.std(tail))
+    
+    assert TechnicalIndicators.calculate_sma(closes, 20) == pytest.approx(sma)
+    assert TechnicalIndicators.calculate_ema(np.asarray(closes), 10) == pytest.approx(ema)
+    assert TechnicalIndicators.calculate_bollinger_bands(closes, 20, 2) == pytest.approx(
+        (sma + 2 * std, sma, sma - 2 * std)
+    )
+    assert TechnicalIndicators.calculate_sma(closes[:5], 20) is None
+
+
+def test_rolling_sma_matches_pointwise(closes):
+    """Test the rolling SMA series matches calculate_sma at every point"""
+    series = TechnicalIndicators.rolling_sma(closes, 20)
+    
+    assert len(series) == len(closes) - 19
+    assert series[0] == pytest.approx(TechnicalIndicators.calculate_sma(closes[:20], 20))
+    assert series[-1] == pytest.approx(TechnicalIndicators.calculate_sma(closes, 20))
+    assert TechnicalIndicators.rolling_sma(closes[:5], 20).size == 0
+
+
+def test_macd_matches_prefix_emas(closes):
+    """Test MACD line, signal and histogram against EMAs of growing prefixes"""
+    ema = TechnicalIndicators.calculate_ema
+    macd_line = [ema(closes[:i], 12) - ema(closes[:i], 26) for i in range(26, len(closes) + 1)]
+    
+    macd, signal, histogram = TechnicalIndicators.calculate_macd(closes)
+    
+    assert macd == pytest.approx(macd_line[-1])
+    assert signal == pytest.approx(ema(macd_line, 9))
+    assert histogram == pytest.approx(macd - signal)
+    assert TechnicalIndicators.calculate_macd(closes[:33]) is None
+
+
+def test_rsi_signals_match_scalar_checks():
+    """Test the vectorized RSI masks agree with the scalar checks"""
+    rsi = [25.0, 30.0, 50.0, 70.0, 75.0, float('nan')]
+    oversold, overbought = TechnicalIndicators.rsi_signals(rsi)
+    
+    assert np.flatnonzero(oversold).tolist() == [0]
+    assert np.flatnonzero(overbought).tolist() == [4]
+    assert oversold[:5].tolist() == [TechnicalIndicators.is_rsi_oversold(v) for v in rsi[:5]]
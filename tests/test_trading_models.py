@@ -0,0 +1,53 @@
+"""
+Unit tests for trading models
+"""
+import pytest
+from datetime import datetime, timedelta
+from src.models.trading_models import (
+    Position, PositionSide, Trade, TradeResult, TradeType, TradingStats
+)
+
+
+def test_position_update_pnl():
+    """Test unrealized P&L for LONG and SHORT positions"""
+    long = Position("ETHUSDT", 0.5, 2000.0, datetime.now(), 30.0)
+    long.update(2100.0, 60.0)
+    assert long.unrealized_pnl == pytest.approx(50.0)
+    assert long.unrealized_pnl_percentage == pytest.approx(5.0)
+    
+    short = Position("ETHUSDT", 0.5, 2000.0, datetime.now(), 70.0, side=PositionSide.SHORT)
+    short.update(1900.0, 40.0)
+    assert short.unrealized_pnl == pytest.approx(50.0)
+    assert short.unrealized_pnl_percentage == pytest.approx((2000.0 / 1900.0 - 1) * 100)
+
+
+def test_position_held_seconds_backdated():
+    """Test time held accounts for an entry time in the past"""
+    position = Position("ETHUSDT", 1.0, 2000.0, datetime.now() - timedelta(hours=2), 30.0)
+    
+    assert position.held_seconds() == pytest.approx(7200, abs=1)
+
+
+def test_trading_stats_averages():
+    """Test averages derived from running sums"""
+    stats = TradingStats(start_balance=1000.0, current_balance=1000.0)
+    for pnl, result, held in ((10.0, TradeResult.WIN, 30.0),
+                              (20.0, TradeResult.WIN, 60.0),
+                              (-6.0, TradeResult.LOSS, 90.0)):
+        trade = Trade("t", "ETHUSDT", TradeType.SELL, 1.0, 2000.0, datetime.now(), 70.0,
+                      profit_loss=pnl, result=result, time_held=held)
+        stats.update(trade)
+    
+    assert stats.average_profit == pytest.approx(15.0)
+    assert stats.average_loss == pytest.approx(-6.0)
+    assert stats.average_trade_duration == pytest.approx(60.0)
+    assert stats.to_dict()["average_profit"] == 15.0
+
+
+def test_trading_stats_runtime_follows_start_time():
+    """Test runtime uses the current start_time after reassignment"""
+    stats = TradingStats(start_time=datetime.now() - timedelta(hours=1))
+    assert stats.runtime_seconds() == pytest.approx(3600, abs=1)
+    
+    stats.start_time = datetime.now() - timedelta(hours=2)
+    assert stats.to_dict()["runtime_hours"] == pytest.approx(2.0, abs=0.01)